@@ -1,15 +1,25 @@
 import requests
-from collections import Counter
-from flask import Flask, jsonify, render_template, request, send_file
+from collections import Counter, OrderedDict, deque
+from flask import Flask, g, has_request_context, jsonify, render_template, request, send_file
 import os
 import io
-import copy
 import json
 from datetime import datetime, timezone
 import pandas as pd
 from dotenv import load_dotenv
 import re
 import argparse
+import bisect
+import pickle
+import atexit
+import contextlib
+import zlib
+import sqlite3
+import time
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
@@ -36,23 +46,781 @@ HEADERS = {
     "Content-Type": "application/json"
 }
 
-_DATA_CACHE: dict[tuple, object] = {}
+# Shared HTTP client: one keep-alive connection pool to Jira for every helper.
+JIRA_HTTP_POOL_SIZE = int(os.getenv("JIRA_HTTP_POOL_SIZE", "32"))
+JIRA_HTTP_CONNECT_TIMEOUT = float(os.getenv("JIRA_HTTP_CONNECT_TIMEOUT", "10"))
+JIRA_HTTP_READ_TIMEOUT = float(os.getenv("JIRA_HTTP_READ_TIMEOUT", "120"))
+
+
+class _JiraSession(requests.Session):
+    """requests.Session with default timeouts (Session itself has none)."""
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", (JIRA_HTTP_CONNECT_TIMEOUT, JIRA_HTTP_READ_TIMEOUT))
+        return super().request(method, url, **kwargs)
+
+
+def _build_jira_http() -> requests.Session:
+    session = _JiraSession()
+    session.headers.update(HEADERS)
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    # Only connection failures are retried (the request never reached Jira). Read timeouts and error
+    # statuses are not: a PUT or POST that timed out may already have been applied.
+    retry = Retry(
+        total=None, connect=2, read=0, status=0, other=0, redirect=False,
+        allowed_methods=frozenset({"GET", "POST", "PUT", "DELETE"}),
+        backoff_factor=0.3, raise_on_status=False,
+    )
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=JIRA_HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+JIRA_HTTP = _build_jira_http()
+
+# Concurrent page fetches per paginated search (bounded so big work groups don't hammer Jira).
+JIRA_SEARCH_WORKERS = int(os.getenv("JIRA_SEARCH_WORKERS", "6"))
+# Issues written concurrently by /bulk_update (each issue is still one read, one PUT and one read back).
+BULK_UPDATE_WORKERS = int(os.getenv("JIRA_BULK_WORKERS", "8"))
+# The agile API accepts at most 50 issues per sprint move.
+SPRINT_MOVE_CHUNK = 50
+# Background write jobs ("async": true): issues written at once across all jobs, and finished jobs kept for polling.
+JOB_WORKERS = int(os.getenv("JIRA_JOB_WORKERS", "4"))
+JOB_HISTORY = int(os.getenv("JIRA_JOB_HISTORY", "200"))
+
+# In-process data cache: cache_key -> {"value", "created", "expires", "size"}, kept in LRU order.
+_DATA_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_CACHE_STATS = Counter()
+_CACHE_LOCK = threading.RLock()
+# Single-flight: cache_key -> Future of the build in progress, so concurrent misses share one Jira pull.
+_CACHE_INFLIGHT: dict[tuple, Future] = {}
+CACHE_MAX_BYTES = int(float(os.getenv("JIRA_CACHE_MAX_MB", "512")) * 1024 * 1024)
+CACHE_DEFAULT_TTL_SECONDS = int(os.getenv("JIRA_CACHE_TTL_SECONDS", "900"))
+# Issue searches refresh with an `updated >= -Nm` delta; a full re-pull (which also drops deleted issues)
+# happens at most this often (0 = always full). The overlap re-reads a short window to absorb clock/index lag.
+DELTA_RECONCILE_SECONDS = int(os.getenv("JIRA_DELTA_RECONCILE_SECONDS", str(6 * 3600)))
+DELTA_OVERLAP_SECONDS = int(os.getenv("JIRA_DELTA_OVERLAP_SECONDS", "120"))
+# Expired entries keep being served for this long while one background rebuild replaces them (0 = always wait).
+CACHE_STALE_GRACE_SECONDS = int(os.getenv("JIRA_CACHE_STALE_SECONDS", "3600"))
+CACHE_REFRESH_WORKERS = int(os.getenv("JIRA_CACHE_REFRESH_WORKERS", "2"))
+# Rebuild every configured fix version x work group view this often, ahead of users (0 = off).
+CACHE_REWARM_SECONDS = int(os.getenv("JIRA_CACHE_REWARM_SECONDS", "600"))
+CACHE_WARMUP_WORKERS = int(os.getenv("JIRA_CACHE_WARMUP_WORKERS", "4"))
+# Revalidation: key -> {"future", "claim"} of its forced rebuild while queued or running, shared by the
+# stale-while-revalidate background refreshes and forced ones (forceRefresh=1, re-warm); and the refresh threads.
+_CACHE_REFRESHING: dict[tuple, dict] = {}
+_CACHE_REFRESH_POOL = ThreadPoolExecutor(max_workers=max(1, CACHE_REFRESH_WORKERS), thread_name_prefix="cache-refresh")
+# Per-namespace TTL (namespace = cache_key[0]); reference data lives long, issue searches go stale fast.
+CACHE_TTL_BY_NAMESPACE = {
+    "jira_priorities": 24 * 3600,
+    "jira_user_search": 3600,
+    "project_versions": 6 * 3600,
+    "feature_details": 600,
+    # watermark of a delta-synced search; its expiry is what forces the next full reconcile
+    "issue_sync_state": DELTA_RECONCILE_SECONDS,
+}
+# Optional cross-process cache shared by every worker on the host (SQLite file path; empty = per-process only).
+SHARED_CACHE_DB = os.getenv("JIRA_SHARED_CACHE_DB", "").strip()
+SHARED_CACHE_LEASE_SECONDS = int(os.getenv("JIRA_SHARED_CACHE_LEASE_SECONDS", "300"))
+# Optional SQLite mirror of the configured work groups' issues; the issue views then read it instead of Jira.
+MIRROR_DB = os.getenv("JIRA_MIRROR_DB", "").strip()
+MIRROR_SYNC_SECONDS = int(os.getenv("JIRA_MIRROR_SYNC_SECONDS", "120"))
+# A work group whose mirror is older than this (sync loop dead, Jira down) is read from Jira instead.
+MIRROR_MAX_STALE_SECONDS = int(os.getenv("JIRA_MIRROR_MAX_STALE_SECONDS", str(max(600, MIRROR_SYNC_SECONDS * 5))))
+# Parsed mirror views kept in memory per process (each is reused until its work group's mirror changes).
+MIRROR_VIEW_CACHE_ENTRIES = int(os.getenv("JIRA_MIRROR_VIEW_CACHE", "64"))
+# Safety cap on one work group's issue store (see _work_group_issues).
+WORK_GROUP_ISSUES_HARD_CAP = int(os.getenv("JIRA_WORK_GROUP_HARD_CAP", "60000"))
+CACHE_SNAPSHOT_FILE = "cache_snapshot.bin"
+CACHE_SNAPSHOT_SECONDS = int(os.getenv("JIRA_CACHE_SNAPSHOT_SECONDS", "300"))
 TEAM_CAPACITY_FILE = "team_capacity_data.json"
+# Sprint id catalog (see _sprint_catalog); a work group's agile boards are re-listed at most this often on a miss.
+SPRINT_CATALOG_FILE = "sprint_catalog.json"
+SPRINT_BOARD_REFRESH_SECONDS = int(os.getenv("JIRA_SPRINT_BOARD_REFRESH_SECONDS", "600"))
+# Catalog changes are written to disk at most this often (and at exit).
+SPRINT_CATALOG_SAVE_SECONDS = float(os.getenv("JIRA_SPRINT_CATALOG_SAVE_SECONDS", "5"))
+# Users learned from searches, team capacity and cached issues answer assignee resolution for this long.
+USER_DIRECTORY_TTL_SECONDS = int(os.getenv("JIRA_USER_DIRECTORY_TTL_SECONDS", str(24 * 3600)))
 APP_SETTINGS_FILE = "app_settings.json"
 
 
+class _FrozenDict(dict):
+    """Read-only dict for cached values; still a dict for jsonify/isinstance, but mutation raises."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("cached value is read-only; use _thaw() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # pickles as a plain dict (no copy, no reference to this module); loaders _freeze() it again
+        return (dict, (), None, None, iter(self.items()))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class _FrozenList(list):
+    """Read-only list for cached values; still a list for jsonify and the isinstance(raw, list) field checks."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("cached value is read-only; use _thaw() for a mutable copy")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (list, (), None, iter(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _freeze(value):
+    """Recursively turn dicts into _FrozenDict and lists/sets into _FrozenList (done once, on insert)."""
+    if isinstance(value, (_FrozenDict, _FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (list, set, frozenset)):
+        return _FrozenList(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """Mutable deep copy of a frozen cached value, for callers that need to edit it."""
+    if isinstance(value, dict):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _cache_ttl(cache_key: tuple) -> int:
+    return CACHE_TTL_BY_NAMESPACE.get(cache_key[0] if cache_key else "", CACHE_DEFAULT_TTL_SECONDS)
+
+
+# items measured per large list / dict by _cache_value_size
+_CACHE_SIZE_SAMPLE = 32
+
+
+def _cache_value_size(value) -> int:
+    """
+    Approximate resident size for the eviction budget: the pickled length, measured on an even sample of
+    _CACHE_SIZE_SAMPLE items of large lists and dicts and scaled up, so sizing a 40k-issue list stays cheap.
+    Callers that already know the serialized length (shared store, snapshot) pass it to _cache_store instead.
+    """
+    try:
+        if isinstance(value, dict):
+            items = list(value.items())
+            if len(items) > _CACHE_SIZE_SAMPLE:
+                step = len(items) / _CACHE_SIZE_SAMPLE
+                sample = [items[int(i * step)] for i in range(_CACHE_SIZE_SAMPLE)]
+                return _cache_value_size(dict(sample)) * len(items) // _CACHE_SIZE_SAMPLE
+            large = {k for k, v in items if isinstance(v, (dict, list, tuple)) and len(v) > _CACHE_SIZE_SAMPLE}
+            if large:
+                # e.g. {"issues": [...], ...}: sample the big members, measure the rest as is
+                rest = {k: v for k, v in items if k not in large}
+                return len(pickle.dumps(rest, protocol=pickle.HIGHEST_PROTOCOL)) + sum(_cache_value_size(value[k]) for k in large)
+        elif isinstance(value, (list, tuple)) and len(value) > _CACHE_SIZE_SAMPLE:
+            step = len(value) / _CACHE_SIZE_SAMPLE
+            sample = [value[int(i * step)] for i in range(_CACHE_SIZE_SAMPLE)]
+            return _cache_value_size(sample) * len(value) // _CACHE_SIZE_SAMPLE
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+def _cache_lookup(cache_key: tuple, allow_expired: bool = False) -> dict | None:
+    """Return the cache entry (and mark it recently used); expired entries only when allow_expired."""
+    with _CACHE_LOCK:
+        entry = _DATA_CACHE.get(cache_key)
+        if entry is None:
+            return None
+        if (not allow_expired) and entry["expires"] <= time.time():
+            return None
+        _DATA_CACHE.move_to_end(cache_key)
+        return entry
+
+
+def _cache_store(cache_key: tuple, value, created: float | None = None, expires: float | None = None,
+                 size: int | None = None, derived: dict | None = None) -> dict:
+    """Publish `value` for `cache_key`; `derived` holds structures already computed from it (see _cache_derived)."""
+    now = time.time() if created is None else created
+    entry = {
+        "value": value,
+        "created": now,
+        "expires": (now + _cache_ttl(cache_key)) if expires is None else expires,
+        "size": _cache_value_size(value) if size is None else size,
+        "derived": dict(derived or {}),
+    }
+    with _CACHE_LOCK:
+        _cache_discard_local(cache_key)
+        _DATA_CACHE[cache_key] = entry
+        _CACHE_STATS["bytes"] += entry["size"]
+        _cache_evict()
+    return entry
+
+
+def _cache_derived(cache_key: tuple, value, name: str, build):
+    """
+    A structure computed from a cached value (a key map, an index), built once per stored value and kept on
+    its entry, so it is published and evicted together with the value. Not kept once the entry moved on.
+    """
+    with _CACHE_LOCK:
+        entry = _DATA_CACHE.get(cache_key)
+        if entry is not None and entry["value"] is value and name in entry["derived"]:
+            return entry["derived"][name]
+    built = build(value)
+    with _CACHE_LOCK:
+        entry = _DATA_CACHE.get(cache_key)
+        if entry is not None and entry["value"] is value:
+            built = entry["derived"].setdefault(name, built)
+    return built
+
+
+def _cache_discard_local(cache_key: tuple) -> bool:
+    with _CACHE_LOCK:
+        entry = _DATA_CACHE.pop(cache_key, None)
+        if entry is None:
+            return False
+        _CACHE_STATS["bytes"] -= entry["size"]
+        return True
+
+
+def _cache_evict():
+    """Drop expired entries first, then least-recently-used ones, until under CACHE_MAX_BYTES."""
+    with _CACHE_LOCK:
+        if _CACHE_STATS["bytes"] <= CACHE_MAX_BYTES:
+            return
+        now = time.time()
+        for key in [k for k, e in _DATA_CACHE.items() if e["expires"] <= now]:
+            # stale entries still in their grace period go too: they are only a fallback
+            _cache_discard_local(key)
+            _CACHE_STATS["evicted_expired"] += 1
+        # keep at least the newest entry even if it alone is over budget
+        while _CACHE_STATS["bytes"] > CACHE_MAX_BYTES and len(_DATA_CACHE) > 1:
+            key = next(iter(_DATA_CACHE))
+            _cache_discard_local(key)
+            _CACHE_STATS["evicted_lru"] += 1
+
+
+# ---------------- Shared cache backend (SQLite, cross-process) ----------------
+# Every worker keeps its own in-memory cache as L1; the SQLite file is the shared L2.
+# An L1 hit is checked against the row's `created` so a refresh or invalidation in one worker reaches the others.
+# A lease row per key lets one worker pull from Jira while the others wait for its result.
+
+_SHARED_CACHE_LOCAL = threading.local()
+
+
+def _shared_cache_enabled() -> bool:
+    return bool(SHARED_CACHE_DB)
+
+
+def _shared_cache_conn() -> sqlite3.Connection:
+    conn = getattr(_SHARED_CACHE_LOCAL, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(SHARED_CACHE_DB, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            " cache_key TEXT PRIMARY KEY, namespace TEXT NOT NULL,"
+            " value BLOB NOT NULL, created REAL NOT NULL, expires REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS cache_entries_expires ON cache_entries(expires)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_leases (cache_key TEXT PRIMARY KEY, expires REAL NOT NULL)")
+        # records patched into a cached issue list since it was last written whole (see _shared_cache_patch)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entry_patches ("
+            " cache_key TEXT NOT NULL, issue_key TEXT NOT NULL, value BLOB NOT NULL,"
+            " PRIMARY KEY (cache_key, issue_key))"
+        )
+        _SHARED_CACHE_LOCAL.conn = conn
+    return conn
+
+
+def _shared_cache_key(cache_key: tuple) -> str:
+    return json.dumps(list(cache_key), ensure_ascii=False)
+
+
+def _shared_cache_created(cache_key: tuple) -> float | None:
+    row = _shared_cache_conn().execute(
+        "SELECT created FROM cache_entries WHERE cache_key = ?", (_shared_cache_key(cache_key),)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _shared_cache_load(cache_key: tuple, allow_expired: bool = False) -> dict | None:
+    """Return {"value", "created", "expires", "size"} from the shared store, value frozen and patches applied."""
+    conn = _shared_cache_conn()
+    key = _shared_cache_key(cache_key)
+    row = conn.execute("SELECT value, created, expires FROM cache_entries WHERE cache_key = ?", (key,)).fetchone()
+    if not row:
+        return None
+    value_blob, created, expires = row
+    if (not allow_expired) and expires <= time.time():
+        return None
+    try:
+        raw = zlib.decompress(value_blob)
+        value = pickle.loads(raw)
+        size = len(raw)
+        patches = conn.execute("SELECT issue_key, value FROM cache_entry_patches WHERE cache_key = ?", (key,)).fetchall()
+        if patches and isinstance(value, list):
+            records = {issue_key: pickle.loads(zlib.decompress(blob)) for issue_key, blob in patches}
+            value = [records.get(it.get("key"), it) if isinstance(it, dict) else it for it in value]
+        value = _freeze(value)
+    except Exception:
+        return None
+    return {"value": value, "created": created, "expires": expires, "size": size}
+
+
+def _shared_cache_put(cache_key: tuple, value, created: float, expires: float):
+    blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 6)
+    conn = _shared_cache_conn()
+    key = _shared_cache_key(cache_key)
+    conn.execute(
+        "INSERT OR REPLACE INTO cache_entries (cache_key, namespace, value, created, expires) VALUES (?, ?, ?, ?, ?)",
+        (key, str(cache_key[0] if cache_key else ""), blob, created, expires),
+    )
+    conn.execute("DELETE FROM cache_entry_patches WHERE cache_key = ?", (key,))
+    # long-dead rows are kept for a day (delta refreshes can still start from them), then dropped
+    if conn.execute("DELETE FROM cache_entries WHERE expires <= ?", (time.time() - 24 * 3600,)).rowcount:
+        conn.execute("DELETE FROM cache_entry_patches WHERE cache_key NOT IN (SELECT cache_key FROM cache_entries)")
+
+
+def _shared_cache_patch(cache_key: tuple, records: dict[str, dict], created: float):
+    """
+    Record issue records patched into a shared cached list without rewriting the list: only those records
+    are serialized, and the new `created` makes other workers reload it (with the patches applied).
+    """
+    conn = _shared_cache_conn()
+    key = _shared_cache_key(cache_key)
+    conn.executemany(
+        "INSERT OR REPLACE INTO cache_entry_patches (cache_key, issue_key, value) VALUES (?, ?, ?)",
+        [(key, issue_key, zlib.compress(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL), 6))
+         for issue_key, record in records.items()],
+    )
+    conn.execute("UPDATE cache_entries SET created = ? WHERE cache_key = ?", (created, key))
+
+
+def _shared_cache_keys(namespaces) -> list[tuple]:
+    names = list(namespaces or [])
+    if not names:
+        return []
+    rows = _shared_cache_conn().execute(
+        f"SELECT cache_key FROM cache_entries WHERE namespace IN ({', '.join('?' for _ in names)})", names
+    ).fetchall()
+    return [tuple(json.loads(r[0])) for r in rows]
+
+
+def _shared_cache_delete(cache_key: tuple):
+    conn = _shared_cache_conn()
+    conn.execute("DELETE FROM cache_entries WHERE cache_key = ?", (_shared_cache_key(cache_key),))
+    conn.execute("DELETE FROM cache_entry_patches WHERE cache_key = ?", (_shared_cache_key(cache_key),))
+
+
+def _shared_cache_try_lease(cache_key: tuple) -> bool:
+    now = time.time()
+    cur = _shared_cache_conn().execute(
+        "INSERT INTO cache_leases (cache_key, expires) VALUES (?, ?) "
+        "ON CONFLICT(cache_key) DO UPDATE SET expires = excluded.expires WHERE cache_leases.expires <= ?",
+        (_shared_cache_key(cache_key), now + SHARED_CACHE_LEASE_SECONDS, now),
+    )
+    return cur.rowcount == 1
+
+
+def _shared_cache_release_lease(cache_key: tuple):
+    _shared_cache_conn().execute("DELETE FROM cache_leases WHERE cache_key = ?", (_shared_cache_key(cache_key),))
+
+
+def _shared_cache_wait_for_build(cache_key: tuple, newer_than: float) -> dict | None:
+    """Another worker holds the lease: poll until it publishes a newer entry or gives the lease up."""
+    key = _shared_cache_key(cache_key)
+    deadline = time.time() + SHARED_CACHE_LEASE_SECONDS
+    while time.time() < deadline:
+        created = _shared_cache_created(cache_key)
+        if created is not None and created >= newer_than:
+            return _shared_cache_load(cache_key, allow_expired=True)
+        lease = _shared_cache_conn().execute("SELECT 1 FROM cache_leases WHERE cache_key = ?", (key,)).fetchone()
+        if not lease:
+            return None
+        time.sleep(0.5)
+    return None
+
+
+def _cache_invalidate(cache_key: tuple):
+    """Drop a key everywhere: this worker's cache and, when enabled, the shared store for all workers."""
+    _cache_discard_local(cache_key)
+    if _shared_cache_enabled():
+        _shared_cache_delete(cache_key)
+
+
+def _cache_entry_any(cache_key: tuple) -> dict | None:
+    entry = _cache_lookup(cache_key, allow_expired=True)
+    if entry is None and _shared_cache_enabled():
+        entry = _shared_cache_load(cache_key, allow_expired=True)
+    return entry
+
+
+def _cache_put(cache_key: tuple, value, expires: float | None = None):
+    """
+    Store a value in this worker's cache and, when enabled, the shared store.
+    Pass `expires` to swap in a patched value without extending its TTL; the fresh `created`
+    still tells other workers to reload it.
+    """
+    entry = _cache_store(cache_key, _freeze(value), expires=expires)
+    if _shared_cache_enabled():
+        _shared_cache_put(cache_key, value, entry["created"], entry["expires"])
+
+
+def _background_refresh_requested() -> bool:
+    return has_request_context() and bool(g.get("cache_refresh_in_background"))
+
+
+def _note_data_age(created: float, refreshing: bool = False):
+    """Remember the oldest cache entry a request was served from (see _add_data_age_headers)."""
+    if not has_request_context():
+        return
+    oldest = g.get("cache_data_created")
+    g.cache_data_created = created if oldest is None else min(oldest, created)
+    g.cache_data_refreshing = bool(g.get("cache_data_refreshing")) or refreshing
+
+
+def _cache_revalidate(cache_key: tuple, builder, run_here: bool = False) -> Future:
+    """
+    One forced rebuild of `cache_key` shared by everyone asking for it while it is queued or running.
+    A new one is queued on the refresh pool; with `run_here` the caller builds it itself instead (also
+    taking over one still waiting in the pool), unless a refresh thread already started it.
+    """
+    with _CACHE_LOCK:
+        job = _CACHE_REFRESHING.get(cache_key)
+        queue = job is None and not run_here
+        if job is None:
+            job = {"future": Future(), "claim": threading.Lock()}
+            _CACHE_REFRESHING[cache_key] = job
+        else:
+            _CACHE_STATS["coalesced"] += 1
+
+    def _run():
+        if not job["claim"].acquire(blocking=False):
+            return
+        try:
+            job["future"].set_result(_cache_build(cache_key, builder, force_refresh=True))
+        except BaseException as e:
+            job["future"].set_exception(e)
+        finally:
+            with _CACHE_LOCK:
+                if _CACHE_REFRESHING.get(cache_key) is job:
+                    del _CACHE_REFRESHING[cache_key]
+
+    if queue:
+        _CACHE_REFRESH_POOL.submit(_run)
+    elif run_here:
+        _run()
+    return job["future"]
+
+
+def _cache_refresh_in_background(cache_key: tuple, builder) -> bool:
+    """Queue one forced rebuild of `cache_key` unless one is already queued or running."""
+    with _CACHE_LOCK:
+        if cache_key in _CACHE_REFRESHING or cache_key in _CACHE_INFLIGHT:
+            return False
+        _CACHE_STATS["background_refreshes"] += 1
+
+    def _report(future: Future):
+        if future.exception() is not None:
+            print(f"[Cache] background refresh of {cache_key[0]} failed: {future.exception()}")
+
+    _cache_revalidate(cache_key, builder).add_done_callback(_report)
+    return True
+
+
 def _cache_get_or_build(cache_key: tuple, builder, force_refresh: bool = False):
-    if (not force_refresh) and (cache_key in _DATA_CACHE):
-        return copy.deepcopy(_DATA_CACHE[cache_key])
-    value = builder()
-    _DATA_CACHE[cache_key] = copy.deepcopy(value)
-    return copy.deepcopy(value)
+    """
+    Cached values are frozen on insert and shared by every reader, so a hit costs O(1).
+    Callers only read them; anything that needs to edit a cached value works on _thaw(value).
+    Entries expire per namespace TTL and are evicted LRU once the cache passes CACHE_MAX_BYTES.
+    Concurrent misses for the same key wait for the one build already running, and with the shared
+    backend enabled that holds across worker processes too.
+    An entry that expired less than CACHE_STALE_GRACE_SECONDS ago is still returned at once while a
+    background rebuild replaces it; so is a fresh one when the request asked for forceRefresh=background.
+    A forced refresh joins that background rebuild when one is queued or running instead of starting another.
+    """
+    now = time.time()
+    if force_refresh:
+        with _CACHE_LOCK:
+            _CACHE_STATS["forced"] += 1
+        value = _cache_revalidate(cache_key, builder, run_here=True).result()
+        _note_data_age(time.time())
+        return value
+
+    entry = _cache_lookup(cache_key, allow_expired=True)
+    if entry is not None and _shared_cache_enabled():
+        # outside _CACHE_LOCK: hits on other keys must not queue behind this SQLite read
+        shared_created = _shared_cache_created(cache_key)
+        if shared_created is None:
+            # invalidated by another worker
+            with _CACHE_LOCK:
+                if _DATA_CACHE.get(cache_key) is entry:
+                    _cache_discard_local(cache_key)
+            entry = None
+        elif shared_created > entry["created"]:
+            # refreshed by another worker; pick up its copy below
+            entry = None
+    if entry is not None and entry["expires"] + CACHE_STALE_GRACE_SECONDS > now:
+        fresh = entry["expires"] > now
+        refreshing = (not fresh) or _background_refresh_requested()
+        with _CACHE_LOCK:
+            _CACHE_STATS["hits" if fresh else "stale_hits"] += 1
+        if refreshing:
+            _cache_refresh_in_background(cache_key, builder)
+        _note_data_age(entry["created"], refreshing)
+        return entry["value"]
+
+    with _CACHE_LOCK:
+        _CACHE_STATS["expired" if cache_key in _DATA_CACHE else "misses"] += 1
+    return _cache_build(cache_key, builder)
+
+
+def _cache_build(cache_key: tuple, builder, force_refresh: bool = False):
+    """Build (or, with the shared backend, fetch another worker's build of) `cache_key`; one build per key at a time."""
+    with _CACHE_LOCK:
+        pending = _CACHE_INFLIGHT.get(cache_key)
+        is_owner = pending is None
+        if is_owner:
+            pending = Future()
+            _CACHE_INFLIGHT[cache_key] = pending
+        else:
+            _CACHE_STATS["coalesced"] += 1
+
+    if not is_owner:
+        value = pending.result()
+        _note_data_age(time.time())
+        return value
+
+    leased = False
+    try:
+        if _shared_cache_enabled():
+            started = time.time()
+            shared = None if force_refresh else _shared_cache_load(cache_key)
+            if shared is None:
+                leased = _shared_cache_try_lease(cache_key)
+                if not leased:
+                    with _CACHE_LOCK:
+                        _CACHE_STATS["shared_waits"] += 1
+                    shared = _shared_cache_wait_for_build(cache_key, newer_than=started)
+            if shared is not None:
+                with _CACHE_LOCK:
+                    _CACHE_STATS["shared_hits"] += 1
+                with _cache_write_lock(cache_key):
+                    _cache_store(cache_key, shared["value"], created=shared["created"], expires=shared["expires"],
+                                 size=shared["size"])
+                pending.set_result(shared["value"])
+                _note_data_age(shared["created"])
+                return shared["value"]
+
+        value = _freeze(builder())
+        with _cache_write_lock(cache_key):
+            entry = _cache_store(cache_key, value)
+            if _shared_cache_enabled():
+                _shared_cache_put(cache_key, value, entry["created"], entry["expires"])
+        pending.set_result(value)
+        _note_data_age(entry["created"])
+        return value
+    except BaseException as e:
+        pending.set_exception(e)
+        raise
+    finally:
+        if leased:
+            _shared_cache_release_lease(cache_key)
+        with _CACHE_LOCK:
+            _CACHE_INFLIGHT.pop(cache_key, None)
+
+
+def _cache_stats() -> dict:
+    now = time.time()
+    namespaces = Counter()
+    with _CACHE_LOCK:
+        entries = list(_DATA_CACHE.items())
+        stats = Counter(_CACHE_STATS)
+        in_flight = len(_CACHE_INFLIGHT)
+        refreshing = list(_CACHE_REFRESHING)
+    for key, _ in entries:
+        namespaces[key[0] if key else ""] += 1
+    return {
+        "entries": len(entries),
+        "expiredEntries": sum(1 for _, e in entries if e["expires"] <= now),
+        "bytes": stats["bytes"],
+        "maxBytes": CACHE_MAX_BYTES,
+        "hits": stats["hits"],
+        "staleHits": stats["stale_hits"],
+        "backgroundRefreshes": stats["background_refreshes"],
+        "refreshing": len(refreshing),
+        "misses": stats["misses"],
+        "expired": stats["expired"],
+        "forced": stats["forced"],
+        "coalesced": stats["coalesced"],
+        "inFlight": in_flight,
+        "evictedExpired": stats["evicted_expired"],
+        "evictedLru": stats["evicted_lru"],
+        "sharedBackend": SHARED_CACHE_DB or None,
+        "sharedHits": stats["shared_hits"],
+        "sharedWaits": stats["shared_waits"],
+        "deltaSyncs": stats["delta_syncs"],
+        "fullSyncs": stats["full_syncs"],
+        "userDirectoryHits": stats["user_directory_hits"],
+        "userDirectoryMisses": stats["user_directory_misses"],
+        "namespaces": dict(namespaces),
+    }
+
+
+# ---------------- Cache snapshot (warm start) ----------------
+
+_CACHE_SNAPSHOT_FORMAT = 2
+# cache_key -> (created, expires, compressed pickle) of the entries last written, so a save only
+# serializes entries that were rebuilt or patched since
+_CACHE_SNAPSHOT_BLOBS: dict[tuple, tuple] = {}
+_CACHE_SNAPSHOT_LOCK = threading.Lock()
+
+
+def _cache_snapshot_path() -> str:
+    return os.path.join(app.root_path, CACHE_SNAPSHOT_FILE)
+
+
+def _save_cache_snapshot() -> int:
+    """Write servable entries (with their original timestamps) to the snapshot file; returns entry count."""
+    now = time.time()
+    with _CACHE_LOCK:
+        entries = [
+            (k, e["value"], e["created"], e["expires"]) for k, e in _DATA_CACHE.items()
+            if e["expires"] + CACHE_STALE_GRACE_SECONDS > now
+        ]
+    with _CACHE_SNAPSHOT_LOCK:
+        blobs = {}
+        changed = 0
+        for cache_key, value, created, expires in entries:
+            previous = _CACHE_SNAPSHOT_BLOBS.get(cache_key)
+            if previous is not None and previous[:2] == (created, expires):
+                blobs[cache_key] = previous
+                continue
+            # frozen values pickle as plain dicts/lists, so no thawed copy of the cache is needed
+            blob = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 6)
+            blobs[cache_key] = (created, expires, blob)
+            changed += 1
+        if not changed and blobs.keys() == _CACHE_SNAPSHOT_BLOBS.keys():
+            return len(blobs)
+        payload = {
+            "format": _CACHE_SNAPSHOT_FORMAT,
+            "saved_at": now,
+            "entries": [(k, blob, created, expires) for k, (created, expires, blob) in blobs.items()],
+        }
+        path = _cache_snapshot_path()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        _CACHE_SNAPSHOT_BLOBS.clear()
+        _CACHE_SNAPSHOT_BLOBS.update(blobs)
+    return len(blobs)
+
+
+def _load_cache_snapshot() -> int:
+    """Restore still servable entries (fresh or within the stale grace) from the snapshot file; returns how many."""
+    path = _cache_snapshot_path()
+    try:
+        with open(path, "rb") as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return 0
+    except Exception as e:
+        print(f"[Cache] ignoring unreadable snapshot {path}: {e}")
+        return 0
+    if not isinstance(payload, dict) or payload.get("format") != _CACHE_SNAPSHOT_FORMAT:
+        return 0
+
+    now = time.time()
+    loaded = 0
+    for cache_key, blob, created, expires in payload.get("entries") or []:
+        cache_key = tuple(cache_key)
+        if expires + CACHE_STALE_GRACE_SECONDS <= now:
+            continue
+        with _CACHE_LOCK:
+            if cache_key in _DATA_CACHE:
+                continue
+        try:
+            raw = zlib.decompress(blob)
+            value = _freeze(pickle.loads(raw))
+        except Exception as e:
+            print(f"[Cache] skipping unreadable snapshot entry {cache_key[0] if cache_key else ''}: {e}")
+            continue
+        _cache_store(cache_key, value, created=created, expires=expires, size=len(raw))
+        with _CACHE_SNAPSHOT_LOCK:
+            _CACHE_SNAPSHOT_BLOBS[cache_key] = (created, expires, blob)
+        loaded += 1
+    return loaded
+
+
+def _start_cache_snapshotter(interval_seconds: int = CACHE_SNAPSHOT_SECONDS):
+    """Load the last snapshot, then re-save it every interval and once more at exit."""
+    if interval_seconds <= 0 or _shared_cache_enabled():
+        # the shared SQLite backend already persists across restarts
+        return
+    started = time.time()
+    loaded = _load_cache_snapshot()
+    print(f"[Cache] warm start: {loaded} entries restored in {time.time() - started:.2f}s")
+
+    def _save_quietly():
+        try:
+            _save_cache_snapshot()
+        except Exception as e:
+            print(f"[Cache] snapshot failed: {e}")
+
+    def _loop():
+        while True:
+            time.sleep(interval_seconds)
+            _save_quietly()
+
+    threading.Thread(target=_loop, name="cache-snapshot", daemon=True).start()
+    atexit.register(_save_quietly)
 
 
 def _is_force_refresh_requested() -> bool:
     raw = (request.args.get("forceRefresh", "") or "").strip().lower()
+    if raw in {"background", "async"}:
+        # answer from the cache now and rebuild what it used behind the response
+        g.cache_refresh_in_background = True
+        return False
     return raw in {"1", "true", "yes", "y"}
 
+
+@app.after_request
+def _add_data_age_headers(resp):
+    """X-Data-Age: seconds since the oldest cached data in the response was fetched; X-Data-Refreshing: 1 while a newer copy is on its way."""
+    created = g.get("cache_data_created")
+    if created is not None:
+        resp.headers["X-Data-Age"] = str(max(0, int(time.time() - created)))
+        resp.headers["X-Data-Refreshing"] = "1" if g.get("cache_data_refreshing") else "0"
+    return resp
+
 # ---------------- Common lightweight helpers (stateless) ----------------
 
 def _is_feature_type(fields: dict) -> bool:
@@ -236,42 +1004,49 @@ def _leading_work_group_value(fields: dict) -> str:
 
     return _one(raw)
 
-def _get_issue_summary(key: str, cache: dict) -> str:
-    if not key:
-        return ""
-    if key in cache:
-        return cache[key]
-    url = f"{JIRA_ISSUE}/{key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "summary"})
-    if resp.status_code == 200:
-        s = (resp.json().get("fields") or {}).get("summary", "") or ""
-        cache[key] = s
-        return s
-    return ""
+def _empty_issue_meta() -> dict:
+    return {"summary": "", "leading_work_group": "", "created": "", "priority": ""}
+
+def _issue_meta_from_fields(fields: dict) -> dict:
+    return {
+        "summary": (fields or {}).get("summary", "") or "",
+        "leading_work_group": _leading_work_group_value(fields),
+        "created": (fields or {}).get("created", "") or "",
+        "priority": _priority_name(fields),
+    }
+
+ISSUE_META_FIELDS = ["summary", "customfield_14400", "created", "priority"]
 
 def _get_issue_meta(key: str, cache: dict[str, dict]) -> dict:
     if not key:
-        return {"summary": "", "leading_work_group": "", "created": "", "priority": ""}
+        return _empty_issue_meta()
     if key in cache:
         return cache[key]
 
     url = f"{JIRA_ISSUE}/{key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "summary,customfield_14400,created,priority"})
+    resp = JIRA_HTTP.get(url, params={"fields": ",".join(ISSUE_META_FIELDS)})
     if resp.status_code == 200:
-        fields = (resp.json().get("fields") or {})
-        meta = {
-            "summary": fields.get("summary", "") or "",
-            "leading_work_group": _leading_work_group_value(fields),
-            "created": fields.get("created", "") or "",
-            "priority": _priority_name(fields),
-        }
+        meta = _issue_meta_from_fields(resp.json().get("fields") or {})
         cache[key] = meta
         return meta
 
-    meta = {"summary": "", "leading_work_group": "", "created": "", "priority": ""}
+    meta = _empty_issue_meta()
     cache[key] = meta
     return meta
 
+def _prefetch_issue_meta(keys, cache: dict[str, dict]) -> dict[str, dict]:
+    """
+    Resolve meta for many keys with chunked `key in (...)` searches and store it in `cache`.
+    Keys the batch could not resolve are left out, so _get_issue_meta still falls back to a single GET.
+    """
+    missing = [k for k in (keys or []) if k and k not in cache]
+    for key, issue in _mirror_issues_by_key(missing, ISSUE_META_FIELDS).items():
+        cache[key] = _issue_meta_from_fields(issue.get("fields") or {})
+    missing = [k for k in missing if k not in cache]
+    for key, issue in _jira_search_keys(missing, ISSUE_META_FIELDS).items():
+        cache[key] = _issue_meta_from_fields(issue.get("fields") or {})
+    return cache
+
 def _extract_linked_issue_links(links):
     result = []
     for link in (links or []):
@@ -598,23 +1373,26 @@ def _normalize_member_week_values(raw: dict, sprint_weeks: dict) -> dict:
     return normalized_week_values
 
 
+_USER_SEARCH_PARAM = "query"
+
+
 def _jira_user_search(query_text: str, max_results: int = 20) -> list[dict]:
     q = (query_text or "").strip()
     if not q:
         return []
 
+    global _USER_SEARCH_PARAM
     users_payload = None
     errors = []
 
-    attempts = [
-        {"query": q, "maxResults": max_results, "includeInactive": "false"},
-        {"username": q, "maxResults": max_results, "includeInactive": "false"},
-    ]
-
-    for params in attempts:
-        resp = requests.get(JIRA_USER_SEARCH, headers=HEADERS, params=params)
+    # Jira Cloud takes `query`, Server/DC `username`; the one that worked last time is tried first
+    modes = sorted(("query", "username"), key=lambda m: m != _USER_SEARCH_PARAM)
+    for mode in modes:
+        params = {mode: q, "maxResults": max_results, "includeInactive": "false"}
+        resp = JIRA_HTTP.get(JIRA_USER_SEARCH, params=params)
         if resp.status_code == 200:
             users_payload = resp.json()
+            _USER_SEARCH_PARAM = mode
             break
         errors.append(f"{resp.status_code} {resp.text}")
 
@@ -646,120 +1424,1410 @@ def _jira_user_search(query_text: str, max_results: int = 20) -> list[dict]:
         if len(out) >= max_results:
             break
 
+    _user_directory_add(out)
+    return out
+
+# ---------------- User directory ----------------
+# Every Jira user seen in a /user/search result, a team capacity member list or an assignee/reporter of a cached
+# issue, indexed by accountId, username, email and normalized name tokens. Entries seen in the last
+# USER_DIRECTORY_TTL_SECONDS resolve assignees without calling Jira; records from different sources are merged
+# when they share an accountId, username or email (capacity members carry no username on their own).
+
+_USER_DIRECTORY: dict[int, dict] = {}
+_USER_BY_ACCOUNT: dict[str, int] = {}
+_USER_BY_NAME: dict[str, int] = {}
+_USER_BY_EMAIL: dict[str, int] = {}
+_USER_BY_TOKENS: dict[frozenset, set[int]] = {}
+# autocomplete: every word of a user's name, email and username -> users, plus those words sorted for prefix scans
+_USER_BY_WORD: dict[str, set[int]] = {}
+_USER_WORDS_SORTED: list[str] | None = None
+# lower-cased queries Jira answered in full (fewer hits than asked for) -> when; longer queries starting with
+# one of them can only match users the directory already holds
+_USER_SEARCH_COMPLETE: dict[str, float] = {}
+_USER_DIRECTORY_LOCK = threading.RLock()
+_USER_DIRECTORY_SEEDED = False
+
+
+def _user_name_tokens(name: str) -> frozenset:
+    return frozenset(p for p in re.sub(r"[^a-z0-9]+", " ", str(name or "").lower()).split() if p)
+
+
+def _user_search_words(user: dict) -> set[str]:
+    return set().union(*(_user_name_tokens(user.get(k)) for k in ("displayName", "emailAddress", "name")))
+
+
+def _user_directory_add(users, seen: float | None = None):
+    """Merge user dicts (accountId/displayName/emailAddress/name/key) into the directory."""
+    global _USER_WORDS_SORTED
+    now = time.time() if seen is None else seen
+    with _USER_DIRECTORY_LOCK:
+        for raw in (users or ()):
+            if not isinstance(raw, dict):
+                continue
+            user = {k: str(raw.get(k) or "").strip() for k in ("accountId", "displayName", "emailAddress", "name", "key")}
+            user["displayName"] = user["displayName"] or user["name"]
+            email = user["emailAddress"].lower()
+            if not (user["accountId"] or user["name"] or email):
+                continue
+            uid = (
+                (user["accountId"] and _USER_BY_ACCOUNT.get(user["accountId"]))
+                or (user["name"] and _USER_BY_NAME.get(user["name"].lower()))
+                or (email and _USER_BY_EMAIL.get(email))
+            )
+            if not uid:
+                uid = len(_USER_DIRECTORY) + 1
+                _USER_DIRECTORY[uid] = {"user": {}, "seen": 0.0}
+            entry = _USER_DIRECTORY[uid]
+
+            old_tokens = _user_name_tokens(entry["user"].get("displayName"))
+            old_words = _user_search_words(entry["user"])
+            entry["user"] = {k: user[k] or entry["user"].get(k, "") for k in user}
+            for word in _user_search_words(entry["user"]) - old_words:
+                if word not in _USER_BY_WORD:
+                    _USER_WORDS_SORTED = None
+                _USER_BY_WORD.setdefault(word, set()).add(uid)
+            entry["seen"] = max(entry["seen"], now)
+            tokens = _user_name_tokens(entry["user"]["displayName"])
+            if tokens != old_tokens:
+                _USER_BY_TOKENS.get(old_tokens, set()).discard(uid)
+            if tokens:
+                _USER_BY_TOKENS.setdefault(tokens, set()).add(uid)
+            if entry["user"]["accountId"]:
+                _USER_BY_ACCOUNT[entry["user"]["accountId"]] = uid
+            if entry["user"]["name"]:
+                _USER_BY_NAME[entry["user"]["name"].lower()] = uid
+            if entry["user"]["emailAddress"]:
+                _USER_BY_EMAIL[entry["user"]["emailAddress"].lower()] = uid
+
+
+def _user_directory_add_issues(issues):
+    users = {}
+    for it in (issues or ()):
+        fields = it.get("fields") or {}
+        for user in (fields.get("assignee"), fields.get("reporter")):
+            if isinstance(user, dict):
+                # the same few hundred people repeat across thousands of issues
+                users[tuple(sorted(user.items()))] = user
+    _user_directory_add(users.values())
+
+
+def _user_directory_seed():
+    """Team capacity members, once per process (later saves add their members directly)."""
+    global _USER_DIRECTORY_SEEDED
+    if _USER_DIRECTORY_SEEDED:
+        return
+    _USER_DIRECTORY_SEEDED = True
+    for payload in _load_team_capacity_store().values():
+        _user_directory_add((payload or {}).get("members") or [])
+
+
+def _user_directory_find(display_name: str = "", email_address: str = "") -> dict | None:
+    """
+    A fresh directory user that can be assigned (has accountId, name or key): by exact email when one is given
+    (a miss goes to the Jira search, never to a namesake), else by name tokens.
+    """
+    _user_directory_seed()
+    cutoff = time.time() - USER_DIRECTORY_TTL_SECONDS
+
+    with _USER_DIRECTORY_LOCK:
+        def _assignable(uid):
+            entry = _USER_DIRECTORY.get(uid)
+            if entry and entry["seen"] >= cutoff and any(entry["user"].get(k) for k in ("accountId", "name", "key")):
+                return dict(entry["user"])
+            return None
+
+        email = str(email_address or "").strip().lower()
+        if email:
+            found = _assignable(_USER_BY_EMAIL.get(email))
+        else:
+            candidates = [u for u in map(_assignable, _USER_BY_TOKENS.get(_user_name_tokens(display_name), ())) if u]
+            # two people with the same name: let the Jira search (and its email match) decide
+            found = candidates[0] if len(candidates) == 1 else None
+
+    with _CACHE_LOCK:
+        _CACHE_STATS["user_directory_hits" if found else "user_directory_misses"] += 1
+    return found
+
+def _user_directory_match(query_text: str, limit: int) -> list[dict]:
+    """Fresh directory users with a name/email/username word starting with every word of the query."""
+    global _USER_WORDS_SORTED
+    words = sorted(_user_name_tokens(query_text), key=len, reverse=True)
+    if not words:
+        return []
+    cutoff = time.time() - USER_DIRECTORY_TTL_SECONDS
+    with _USER_DIRECTORY_LOCK:
+        if _USER_WORDS_SORTED is None:
+            _USER_WORDS_SORTED = sorted(_USER_BY_WORD)
+        # candidates from the longest (most selective) query word, then every other word must match too
+        uids = set()
+        i = bisect.bisect_left(_USER_WORDS_SORTED, words[0])
+        while i < len(_USER_WORDS_SORTED) and _USER_WORDS_SORTED[i].startswith(words[0]):
+            uids |= _USER_BY_WORD[_USER_WORDS_SORTED[i]]
+            i += 1
+        out = []
+        for uid in uids:
+            entry = _USER_DIRECTORY[uid]
+            if entry["seen"] < cutoff:
+                continue
+            user_words = _user_search_words(entry["user"])
+            if all(any(w.startswith(q) for w in user_words) for q in words[1:]):
+                out.append(dict(entry["user"], active=True))
+    out.sort(key=lambda u: (u["displayName"].lower(), u["name"]))
+    return out[:limit]
+
+
+def _user_autocomplete(query_text: str, max_results: int = 20) -> list[dict]:
+    """/jira_user_search: answered from the directory when it can be complete, otherwise one cached Jira search."""
+    q = re.sub(r"\s+", " ", str(query_text or "").strip().lower())
+    if not q:
+        return []
+    local = _user_directory_match(q, max_results)
+
+    cutoff = time.time() - USER_DIRECTORY_TTL_SECONDS
+    with _USER_DIRECTORY_LOCK:
+        complete = any(q.startswith(p) and at >= cutoff for p, at in _USER_SEARCH_COMPLETE.items())
+    if complete or len(local) >= max_results:
+        return local
+
+    remote = _cache_get_or_build(("jira_user_search", q, max_results), lambda: _jira_user_search(q, max_results))
+    if len(remote) < max_results:
+        with _USER_DIRECTORY_LOCK:
+            for prefix in [p for p, at in _USER_SEARCH_COMPLETE.items() if at < cutoff]:
+                del _USER_SEARCH_COMPLETE[prefix]
+            _USER_SEARCH_COMPLETE[q] = time.time()
+    out = [dict(u) for u in remote]
+    seen = {(u.get("accountId") or u.get("name") or u.get("displayName", "").lower()) for u in out}
+    for u in local:
+        if len(out) >= max_results:
+            break
+        if (u.get("accountId") or u.get("name") or u.get("displayName", "").lower()) not in seen:
+            out.append(u)
     return out
 
 # ---------------- Jira search ----------------
 
-def _jira_search(jql: str, fields: list[str], max_results: int = 1000, start_at: int = 0):
+def _jira_search(jql: str, fields: list[str], max_results: int = 1000, start_at: int = 0, validate_query: bool = True):
     payload = {"jql": jql, "maxResults": max_results, "startAt": start_at, "fields": fields}
-    resp = requests.post(JIRA_SEARCH, json=payload, headers=HEADERS)
+    if not validate_query:
+        # lets `key in (...)` skip unknown/deleted keys instead of failing the whole query
+        payload["validateQuery"] = False
+    resp = JIRA_HTTP.post(JIRA_SEARCH, json=payload)
     if resp.status_code != 200:
         print(f"Jira error: {resp.status_code} {resp.text}")
         return None
     return resp.json()
 
+def _jira_search_pages(jql: str, fields: list[str], page_size: int = 1000, hard_cap: int = 5000,
+                       strict: bool = False):
+    """
+    Stream JQL results page by page (each yielded item is that page's list of issues).
+    After the first page reveals `total`, up to JIRA_SEARCH_WORKERS following pages are kept in flight
+    while the caller processes the current one; pages are always yielded in startAt order.
+    Stopping iteration early cancels the pages that haven't started yet.
+    A failed page ends the stream; with strict=True it raises instead, for callers that can't use a partial result.
+    """
+    first = _jira_search(jql, fields, max_results=page_size, start_at=0)
+    if not first:
+        if strict:
+            raise RuntimeError(f"Jira search failed: {jql}")
+        return
+    issues = first.get("issues", []) or []
+    total = int(first.get("total", len(issues)))
+    yield issues
+
+    # Jira may clamp maxResults below what we asked for; page by what it actually returned.
+    step = len(issues)
+    if step == 0 or step >= total or step >= hard_cap:
+        return
+
+    # safety to avoid pulling the whole Jira by accident
+    starts = iter(range(step, min(total, hard_cap), step))
+    pool = ThreadPoolExecutor(max_workers=max(1, JIRA_SEARCH_WORKERS))
+    in_flight = deque()
+    try:
+        def _submit_next() -> bool:
+            s = next(starts, None)
+            if s is None:
+                return False
+            in_flight.append(pool.submit(_jira_search, jql, fields, max_results=step, start_at=s))
+            return True
+
+        for _ in range(max(1, JIRA_SEARCH_WORKERS)):
+            if not _submit_next():
+                break
+        while in_flight:
+            data = in_flight.popleft().result()
+            if not data:
+                if strict:
+                    raise RuntimeError(f"Jira search failed mid-way: {jql}")
+                # a failed page would leave a hole; stop at the last contiguous page like the serial walk did
+                return
+            _submit_next()
+            yield data.get("issues", []) or []
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 def _jira_search_all(jql: str, fields: list[str], page_size: int = 1000, hard_cap: int = 5000):
     """Paginate JQL to collect many issues safely."""
     results = []
-    start = 0
-    while True:
-        data = _jira_search(jql, fields, max_results=page_size, start_at=start)
-        if not data:
-            break
-        issues = data.get("issues", []) or []
-        results.extend(issues)
-        total = int(data.get("total", len(results)))
-        if start + len(issues) >= total:
-            break
-        start += len(issues)
-        if len(results) >= hard_cap:
-            # safety to avoid pulling the whole Jira by accident
-            break
+    for page in _jira_search_pages(jql, fields, page_size=page_size, hard_cap=hard_cap):
+        results.extend(page)
     return results
 
 
-def _jira_get_issue_fix_versions(issue_key: str) -> list[str]:
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "fixVersions"})
-    if resp.status_code != 200:
-        raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
-    fields = (resp.json().get("fields") or {})
-    return [fv.get("name") for fv in (fields.get("fixVersions") or []) if fv.get("name")]
+# ---------------- View field lists ----------------
+# What each view reads. The work group issue store fetches their union (see _compact_issue for the
+# projection); the write paths use ISSUE_LIST_VIEW_FIELDS to patch cached records in place.
+
+PI_PLANNING_FIELDS = [
+    "summary", "issuetype", "issuelinks",
+    "customfield_10701",      # Sprint(s)
+    "customfield_14700",      # PI Scope
+    "status", "priority",
+    "customfield_13801",      # Capability link
+    "fixVersions",
+    "customfield_10702",      # Epic Link (if exists)
+    "customfield_10708",      # Story Points
+    "assignee",
+    "reporter",
+    "parent"
+]
+
+BACKLOG_FIELDS = [
+    "summary", "issuetype", "issuelinks", "customfield_14700",
+    "status", "priority", "fixVersions", "customfield_10708", "assignee", "reporter",
+    "customfield_13801",  # Capability link
+    "customfield_13802",  # Target start
+    "customfield_13803",  # Target end
+]
+
+BACKLOG_CHILD_FIELDS = [
+    "summary",
+    "issuetype",
+    "customfield_10708",  # Story Points
+    "customfield_10702",  # Epic Link
+    "parent",
+    "issuelinks",
+    "status",
+    "assignee",
+]
+
+CAPABILITY_FIELDS = ["summary", "issuetype", "status", "customfield_14400", "created", "priority"]
+
+PROJECT_FR_FIELDS = ["summary", "status", "fixVersions", "labels"]
+
+FR_LIST_FIELDS = ["summary", "status", "fixVersions", "labels", "issuelinks"]
+
+# What a work group's issue store (and the mirror behind it) keeps per issue: every view's list,
+# plus `updated` for delta syncs and recency filters.
+WORK_GROUP_ISSUE_FIELDS = list(dict.fromkeys(
+    PI_PLANNING_FIELDS + BACKLOG_FIELDS + BACKLOG_CHILD_FIELDS + CAPABILITY_FIELDS + FR_LIST_FIELDS + ["updated"]
+))
+
+# cache namespace -> field list of the compact issue records cached under it
+ISSUE_LIST_VIEW_FIELDS = {
+    "work_group_issues_v1": WORK_GROUP_ISSUE_FIELDS,
+    "pi_planning_issues_v2": PI_PLANNING_FIELDS,   # only for fix versions missing from app_settings.json
+    "project_fault_reports": PROJECT_FR_FIELDS,
+}
 
+# ---------------- Compact issue projection ----------------
+# Cached search results keep the Jira shape ({"key", "fields": {...}}) so every helper above keeps working,
+# but each field is reduced to the parts the views actually read (no avatars, self URLs, nested link payloads).
 
-def _jira_update_issue_fix_versions(issue_key: str, add_versions: list[str], remove_versions: list[str]) -> dict:
-    ops = []
-    for v in add_versions:
-        ops.append({"add": {"name": v}})
-    for v in remove_versions:
-        ops.append({"remove": {"name": v}})
+def _compact_user(raw) -> dict | None:
+    if not isinstance(raw, dict):
+        return None
+    out = {}
+    for k in ("displayName", "name", "key", "emailAddress", "accountId"):
+        v = raw.get(k)
+        if v:
+            out[k] = v
+    return out
 
-    payload = {"update": {"fixVersions": ops}}
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.put(url, headers=HEADERS, json=payload)
-    if resp.status_code not in (200, 204):
-        raise RuntimeError(f"Failed to update issue {issue_key}: {resp.status_code} {resp.text}")
-    return payload
+def _compact_issue_type(raw) -> dict:
+    it = raw if isinstance(raw, dict) else {}
+    return {"name": it.get("name") or "", "id": str(it.get("id") or "")}
 
+def _compact_linked_issue(raw) -> dict | None:
+    if not isinstance(raw, dict) or not raw.get("key"):
+        return None
+    fields = raw.get("fields") or {}
+    return {
+        "key": raw.get("key"),
+        "fields": {
+            "summary": fields.get("summary", "") or "",
+            "issuetype": _compact_issue_type(fields.get("issuetype")),
+        },
+    }
 
-def _jira_get_issue_sprint_refs(issue_key: str) -> list[dict]:
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "customfield_10701"})
-    if resp.status_code != 200:
-        raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
-    fields = (resp.json().get("fields") or {})
-    return _extract_sprint_refs(fields.get("customfield_10701"))
+def _compact_issue_links(raw) -> list:
+    out = []
+    for link in (raw or []):
+        if not isinstance(link, dict):
+            continue
+        link_type = link.get("type") or {}
+        row = {"type": {"inward": link_type.get("inward") or "", "outward": link_type.get("outward") or ""}}
+        for side in ("outwardIssue", "inwardIssue"):
+            issue = _compact_linked_issue(link.get(side))
+            if issue:
+                row[side] = issue
+        out.append(row)
+    return out
+
+def _compact_sprints(raw) -> list:
+    """Sprint field (dicts or Java-style strings) -> [{"id", "name", "state", "boardId", "startDate", "endDate"}]."""
+    entries = raw if isinstance(raw, list) else ([raw] if raw not in (None, "") else [])
+    out = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            src = {
+                "id": entry.get("id"),
+                "name": entry.get("name"),
+                "state": entry.get("state"),
+                "boardId": entry.get("originBoardId") or entry.get("rapidViewId") or entry.get("boardId"),
+                "startDate": entry.get("startDate"),
+                "endDate": entry.get("endDate"),
+            }
+        else:
+            text = str(entry)
+            src = {}
+            for out_key, attr in (
+                ("id", "id"), ("name", "name"), ("state", "state"),
+                ("boardId", "rapidViewId"), ("startDate", "startDate"), ("endDate", "endDate"),
+            ):
+                m = re.search(rf"(?:^|[,\[\s]){attr}=([^,\]]*)", text, flags=re.IGNORECASE)
+                src[out_key] = m.group(1).strip() if m else None
+        row = {k: v for k, v in src.items() if v not in (None, "", "<null>")}
+        for k in ("id", "boardId"):
+            if k in row:
+                try:
+                    row[k] = int(row[k])
+                except Exception:
+                    row.pop(k)
+        if row.get("name"):
+            out.append(row)
+    return out
 
+def _compact_status(raw) -> dict:
+    st = raw if isinstance(raw, dict) else {}
+    cat = st.get("statusCategory") or {}
+    return {"name": st.get("name") or "", "statusCategory": {"key": cat.get("key") or ""}}
 
-def _jira_find_sprint_id_by_name(sprint_name: str, work_group: str = "", fix_version: str = "") -> int | None:
-    canonical_target = _canonicalize_sprint_name(sprint_name)
-    if not canonical_target:
+def _compact_parent(raw) -> dict | None:
+    if not isinstance(raw, dict) or not raw.get("key"):
         return None
+    out = {"key": raw.get("key")}
+    p_fields = raw.get("fields") or {}
+    if p_fields:
+        out["fields"] = {"issuetype": _compact_issue_type(p_fields.get("issuetype"))}
+    return out
 
-    # First try direct JQL by sprint name.
-    jql_direct = f'sprint = "{sprint_name}" ORDER BY updated DESC'
-    direct = _jira_search_all(jql_direct, ["customfield_10701"], page_size=50, hard_cap=200)
-    for issue in direct:
-        fields = issue.get("fields", {}) or {}
-        refs = _extract_sprint_refs(fields.get("customfield_10701"))
-        for ref in refs:
-            if ref.get("canonical") == canonical_target and ref.get("id") is not None:
-                return int(ref["id"])
+_FIELD_COMPACTORS = {
+    "issuetype": _compact_issue_type,
+    "status": _compact_status,
+    "priority": lambda v: {"name": v.get("name") or ""} if isinstance(v, dict) else None,
+    "assignee": _compact_user,
+    "reporter": _compact_user,
+    "fixVersions": lambda v: [
+        {"name": fv.get("name"), "archived": bool(fv.get("archived", False))}
+        for fv in (v or []) if isinstance(fv, dict) and fv.get("name")
+    ],
+    "issuelinks": _compact_issue_links,
+    "parent": _compact_parent,
+    "customfield_10701": _compact_sprints,                                   # Sprint(s)
+    "customfield_13801": lambda v: _extract_capability_key({"customfield_13801": v}),
+    "customfield_14400": lambda v: _leading_work_group_value({"customfield_14400": v}),
+    "customfield_14700": lambda v: {"value": v.get("value") or ""} if isinstance(v, dict) else v,
+}
 
-    # Fallback: scan recent issues in current PI/workgroup scope.
-    clauses = []
-    if work_group:
-        clauses.append(f'"Leading Work Group" = "{work_group}"')
-    if fix_version:
-        clauses.append(f'fixVersion = "{fix_version}"')
-    clauses.append("updated >= -120d")
-    jql_fallback = " AND ".join(clauses) + " ORDER BY updated DESC"
-    recent = _jira_search_all(jql_fallback, ["customfield_10701"], page_size=200, hard_cap=800)
-    for issue in recent:
-        fields = issue.get("fields", {}) or {}
-        refs = _extract_sprint_refs(fields.get("customfield_10701"))
-        for ref in refs:
-            if ref.get("canonical") == canonical_target and ref.get("id") is not None:
-                return int(ref["id"])
+def _compact_issue(issue: dict, fields: list[str]) -> dict:
+    """Project one raw search hit onto `fields` (the view's own field list)."""
+    src = (issue or {}).get("fields") or {}
+    out = {}
+    for name in fields:
+        if name not in src:
+            continue
+        compactor = _FIELD_COMPACTORS.get(name)
+        out[name] = compactor(src[name]) if compactor else src[name]
+    return {"key": (issue or {}).get("key", ""), "fields": out}
 
-    return None
+def _jira_search_compact(jql: str, fields: list[str], page_size: int = 1000, hard_cap: int = 5000,
+                         strict: bool = False) -> list[dict]:
+    """_jira_search_all, but every page is projected as it streams in so raw pages never pile up."""
+    results = []
+    for page in _jira_search_pages(jql, fields, page_size=page_size, hard_cap=hard_cap, strict=strict):
+        results.extend(_compact_issue(it, fields) for it in page)
+    return results
 
 
-def _jira_move_issue_to_sprint(issue_key: str, sprint_id: int) -> dict:
-    url = f"{JIRA_AGILE_SPRINT_ISSUES}/{int(sprint_id)}/issue"
-    payload = {"issues": [issue_key]}
-    resp = requests.post(url, headers=HEADERS, json=payload)
-    if resp.status_code not in (200, 201, 204):
-        raise RuntimeError(f"Failed to move issue {issue_key} to sprint {sprint_id}: {resp.status_code} {resp.text}")
-    return payload
+def _jira_search_keys(keys, fields: list[str], chunk_size: int = 100) -> dict[str, dict]:
+    """
+    Fetch many issues by key with chunked `key in (...)` searches (chunks run concurrently).
+    Returns {key: issue}; keys from failed chunks or unknown to Jira are simply absent.
+    """
+    wanted = []
+    seen = set()
+    for k in (keys or []):
+        key = str(k or "").strip()
+        if key and key not in seen:
+            seen.add(key)
+            wanted.append(key)
+    if not wanted:
+        return {}
 
+    chunks = [wanted[i:i + chunk_size] for i in range(0, len(wanted), chunk_size)]
 
-def _jira_clear_issue_sprints(issue_key: str) -> dict:
-    # Jira stores Sprint in customfield_10701 in this environment.
-    payload = {"fields": {"customfield_10701": []}}
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.put(url, headers=HEADERS, json=payload)
-    if resp.status_code not in (200, 204):
+    def _fetch(chunk):
+        jql = f"key in ({', '.join(chunk)})"
+        return _jira_search(jql, fields, max_results=len(chunk), validate_query=False)
+
+    workers = max(1, min(JIRA_SEARCH_WORKERS, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pages = list(pool.map(_fetch, chunks))
+
+    out = {}
+    for data in pages:
+        for issue in ((data or {}).get("issues") or []):
+            key = issue.get("key")
+            if key:
+                out[key] = issue
+    return out
+
+
+# ---------------- Incremental refresh of cached searches ----------------
+# A cached issue list remembers when it was last synced (an "issue_sync_state" entry next to it).
+# Refreshing it then asks Jira only for what changed since: one small `updated >= -Nm` query over the
+# work group tells which issues were touched, and only if any were, a second one re-reads those that
+# still match the view's JQL. Touched issues missing from the second result left the view and are dropped.
+# Deleted issues (and ones that moved out of the scope) only go away on the periodic full reconcile.
+
+_JQL_ORDER_BY_RE = re.compile(r"\s+ORDER\s+BY\s+", re.IGNORECASE)
+
+
+def _work_group_jql(work_group: str) -> str:
+    return f'"Leading Work Group" = "{work_group}"'
+
+
+def _split_jql_order_by(jql: str) -> tuple[str, str]:
+    """'A AND B ORDER BY x' -> ('A AND B', 'ORDER BY x'); the second part is '' when there is none."""
+    parts = _JQL_ORDER_BY_RE.split(jql or "", maxsplit=1)
+    if len(parts) == 1:
+        return parts[0].strip(), ""
+    return parts[0].strip(), f"ORDER BY {parts[1].strip()}"
+
+
+def _issue_sync_state(cache_key: tuple) -> dict | None:
+    state_key = ("issue_sync_state",) + tuple(cache_key)
+    entry = _cache_lookup(state_key)
+    if entry is None and _shared_cache_enabled():
+        entry = _shared_cache_load(state_key)
+    return entry
+
+
+def _delta_merge(previous, changed: list[dict], dropped: set, newest_first: bool) -> list[dict]:
+    """Fold changed records into the previous list, keeping its order (changed ones lead when sorted by updated)."""
+    by_key = {it.get("key"): it for it in changed}
+    if newest_first:
+        rest = [it for it in previous if it.get("key") not in by_key and it.get("key") not in dropped]
+        return list(changed) + rest
+    merged = []
+    for it in previous:
+        key = it.get("key")
+        if key in dropped:
+            continue
+        merged.append(by_key.pop(key, it))
+    merged.extend(it for it in changed if it.get("key") in by_key)
+    return merged
+
+
+def _updated_since_jql(synced_at: float, now: float) -> str:
+    """Relative window (Jira evaluates it on its own clock) covering everything since `synced_at`, plus the overlap."""
+    since = now - float(synced_at or 0) + DELTA_OVERLAP_SECONDS
+    return f"updated >= -{max(1, int(since // 60) + 1)}m"
+
+
+def _cached_issue_search(cache_key: tuple, jql: str, fields: list[str], work_group: str = "",
+                         page_size: int = 1000, hard_cap: int = 5000, force_refresh: bool = False):
+    """
+    _cache_get_or_build over _jira_search_compact, but a refresh of an existing result only pulls the delta.
+    `jql` must be limited to `work_group`; the work group clause alone is what detects issues that changed
+    out of the view. Without a work group a refresh is always a full pull.
+    """
+    state_key = ("issue_sync_state",) + tuple(cache_key)
+    where, order_by = _split_jql_order_by(jql)
+    scope_jql = _work_group_jql(work_group) if work_group else ""
+
+    def _full(started: float):
+        issues = _jira_search_compact(jql, fields, page_size=page_size, hard_cap=hard_cap, strict=True)
+        if DELTA_RECONCILE_SECONDS > 0 and scope_jql:
+            _cache_put(state_key, {"synced_at": started})
+        with _CACHE_LOCK:
+            _CACHE_STATS["full_syncs"] += 1
+        return issues
+
+    def _build():
+        started = time.time()
+        previous = _cache_entry_any(cache_key)
+        state = _issue_sync_state(cache_key) if (previous is not None and scope_jql) else None
+        if state is None or DELTA_RECONCILE_SECONDS <= 0:
+            return _full(started)
+
+        window = _updated_since_jql(state["value"].get("synced_at"), started)
+        try:
+            touched = set()
+            for page in _jira_search_pages(f"({scope_jql}) AND {window}", ["updated"],
+                                           page_size=page_size, hard_cap=hard_cap, strict=True):
+                touched.update(it.get("key") for it in page)
+            changed = []
+            if touched:
+                changed = _jira_search_compact(f"({where}) AND {window} {order_by}".strip(), fields,
+                                               page_size=page_size, hard_cap=hard_cap, strict=True)
+        except RuntimeError as e:
+            print(f"[Delta] {cache_key[0]}: {e}; falling back to a full pull")
+            return _full(started)
+
+        dropped = touched - {it.get("key") for it in changed}
+        newest_first = order_by.lower().replace(" ", "") == "orderbyupdateddesc"
+        issues = _delta_merge(previous["value"], changed, dropped, newest_first)
+        # keep the state's expiry: that is when the next full reconcile is due
+        _cache_put(state_key, {"synced_at": started}, expires=state["expires"])
+        with _CACHE_LOCK:
+            _CACHE_STATS["delta_syncs"] += 1
+        if changed or dropped:
+            print(f"[Delta] {cache_key[0]}: {len(changed)} changed, {len(dropped)} dropped ({window})")
+        return issues
+
+    return _cache_get_or_build(cache_key, _build, force_refresh=force_refresh)
+
+
+# ---------------- Work group issue store ----------------
+# PI planning, backlog (and its child stories), capabilities and the FR list all look at the same work group
+# through overlapping JQL. Instead of one search per view, each work group is fetched once with the union of
+# their clauses and fields, kept delta-synced like any cached search, and indexed in memory; the views are
+# then slices of it. Fix versions missing from app_settings.json fall back to their own PI search.
+
+def _jira_time_ms(raw) -> int:
+    """Jira timestamp ('2025-03-01T10:15:00.000+0100') -> epoch milliseconds; 0 when missing or unparseable."""
+    try:
+        return int(datetime.strptime(str(raw), "%Y-%m-%dT%H:%M:%S.%f%z").timestamp() * 1000)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _issue_key_sort_key(key) -> tuple:
+    """'ABC-12' -> ('ABC', 12), so keys sort the way Jira's `ORDER BY key` does."""
+    project, _, number = str(key or "").rpartition("-")
+    return (project, int(number) if number.isdigit() else 0)
+
+
+def _jira_time_now() -> str:
+    return datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
+
+
+def _work_group_issues_jql(work_group: str, fix_versions) -> str:
+    """Union of what the views select for one work group."""
+    clauses = ["statusCategory != Done", "updated >= -365d", "issuetype = Capability"]
+    names = [str(fv).replace('"', '\\"') for fv in (fix_versions or []) if str(fv or "").strip()]
+    if names:
+        clauses.append("fixVersion in (" + ", ".join(f'"{n}"' for n in names) + ")")
+    return f"{_work_group_jql(work_group)} AND ({' OR '.join(clauses)})"
+
+
+def _index_buckets(fields: dict) -> dict[str, list[str]]:
+    """The by_type / by_status_category / by_fix_version buckets an issue with `fields` is listed under."""
+    return {
+        "by_type": [((fields.get("issuetype") or {}).get("name") or "").strip().lower()],
+        "by_status_category": [_status_category_key(fields)],
+        "by_fix_version": list(_fix_versions(fields)),
+    }
+
+
+def _index_work_group_issues(issues, fix_versions) -> dict:
+    buckets: dict[str, dict[str, list]] = {"by_type": {}, "by_status_category": {}, "by_fix_version": {}}
+    updated_ms = []
+    for it in issues:
+        f = it.get("fields") or {}
+        for name, values in _index_buckets(f).items():
+            for value in values:
+                buckets[name].setdefault(value, []).append(it)
+        updated_ms.append(_jira_time_ms(f.get("updated")))
+    return {
+        "issues": issues,                  # newest update first
+        "updated_ms": updated_ms,          # parallel to "issues"
+        "by_key": {it.get("key"): it for it in issues},
+        "by_type": buckets["by_type"],     # lower-cased issue type name
+        "by_status_category": buckets["by_status_category"],
+        "by_fix_version": buckets["by_fix_version"],
+        "fix_versions": set(fix_versions),
+    }
+
+
+def _index_replace_issues(index: dict, issues, positions: dict[str, int], replaced: list[tuple]) -> dict | None:
+    """
+    The index of `issues`, a copy of the indexed list with records replaced (position, old record, new record).
+    Only the buckets a record leaves or joins are copied; the old index is left as it was for its readers.
+    None when a record isn't where the index says (rebuild instead).
+    """
+    buckets = {name: dict(index[name]) for name in ("by_type", "by_status_category", "by_fix_version")}
+    copied = set()
+    for idx, old, new in replaced:
+        old_in = _index_buckets(old.get("fields") or {})
+        new_in = _index_buckets(new.get("fields") or {})
+        for name, by_value in buckets.items():
+            for value in set(old_in[name]) | set(new_in[name]):
+                if (name, value) not in copied:
+                    by_value[value] = list(by_value.get(value) or ())
+                    copied.add((name, value))
+                bucket = by_value[value]
+                if value in old_in[name]:
+                    at = next((i for i, it in enumerate(bucket) if it is old), None)
+                    if at is None:
+                        return None
+                    del bucket[at]
+                if value in new_in[name]:
+                    # buckets keep the store's order
+                    bucket.insert(bisect.bisect_left(bucket, idx, key=lambda it: positions.get(it.get("key"), -1)), new)
+                if not bucket:
+                    del by_value[value]
+    updated_ms = list(index["updated_ms"])
+    by_key = dict(index["by_key"])
+    for idx, old, new in replaced:
+        updated_ms[idx] = _jira_time_ms((new.get("fields") or {}).get("updated"))
+        by_key[new.get("key")] = new
+    return dict(index, issues=issues, updated_ms=updated_ms, by_key=by_key, **buckets)
+
+
+def _work_group_learn(work_group: str, issues):
+    """Feed the sprint catalog and user directory from store records."""
+    try:
+        _sprint_catalog_learn_issues(issues, work_group)
+    except Exception as e:
+        print(f"[Sprints] failed to catalog sprints of {work_group}: {e}")
+    _user_directory_add_issues(issues)
+
+
+def _store_fix_versions() -> list[str]:
+    """Fix versions every work group store (and mirror) covers: the ones listed in app_settings.json."""
+    return [fv for fv in (_load_app_settings().get("fix_versions") or []) if fv]
+
+
+def _work_group_issues(work_group: str, force_refresh: bool = False) -> dict:
+    """The work group's indexed issue store; the index is rebuilt only when the cached issue list changes."""
+    fix_versions = _store_fix_versions()
+    # the covered fix versions are part of the key, so editing app_settings.json starts a fresh store
+    cache_key = ("work_group_issues_v1", work_group, "|".join(fix_versions))
+    issues = _cached_issue_search(
+        cache_key,
+        f"{_work_group_issues_jql(work_group, fix_versions)} ORDER BY updated DESC",
+        WORK_GROUP_ISSUE_FIELDS,
+        work_group=work_group,
+        page_size=500, hard_cap=WORK_GROUP_ISSUES_HARD_CAP, force_refresh=force_refresh,
+    )
+    built = []
+
+    def _index(value):
+        built.append(True)
+        return _index_work_group_issues(value or (), fix_versions)
+
+    index = _cache_derived(cache_key, issues, "index", _index)
+    if built:
+        _work_group_learn(work_group, issues)
+    return index
+
+
+def _days_ago_ms(days: int) -> int:
+    return int(time.time() * 1000) - days * 24 * 3600 * 1000
+
+
+def _updated_within(store: dict, days: int, extra_keys=()) -> list[dict]:
+    """Issues updated in the last `days` days (or listed in `extra_keys`), newest first like the JQL views."""
+    cutoff = _days_ago_ms(days)
+    extra = set(extra_keys)
+    return [
+        it for it, ms in zip(store["issues"], store["updated_ms"])
+        if ms >= cutoff or it.get("key") in extra
+    ]
+
+
+def _pi_planning_issues(fix_version: str, work_group: str, force_refresh: bool = False) -> list[dict] | None:
+    """`fixVersion = fv OR updated >= -120d`; None when the store doesn't cover `fix_version`."""
+    if fix_version not in _store_fix_versions():
+        return None
+    mirrored = _mirror_view(
+        work_group,
+        "updated_ms >= ? OR key IN (SELECT key FROM mirror_fix_versions WHERE work_group = ? AND fix_version = ?)",
+        (_mirror_cutoff_ms(120), work_group, fix_version),
+        force_refresh=force_refresh,
+    )
+    if mirrored is not None:
+        return mirrored
+    store = _work_group_issues(work_group, force_refresh=force_refresh)
+    if fix_version not in store["fix_versions"]:
+        return None
+    in_version = [it.get("key") for it in store["by_fix_version"].get(fix_version, [])]
+    return _updated_within(store, 120, extra_keys=in_version)
+
+
+def _backlog_issues(work_group: str, force_refresh: bool = False) -> list[dict]:
+    """`statusCategory != Done`."""
+    mirrored = _mirror_view(work_group, "status_category != 'done'", force_refresh=force_refresh)
+    if mirrored is not None:
+        return mirrored
+    store = _work_group_issues(work_group, force_refresh=force_refresh)
+    return [it for cat, issues in store["by_status_category"].items() if cat != "done" for it in issues]
+
+
+def _backlog_child_issues(work_group: str, force_refresh: bool = False) -> list[dict]:
+    """`updated >= -365d ORDER BY updated DESC`."""
+    mirrored = _mirror_view(work_group, "updated_ms >= ?", (_mirror_cutoff_ms(365),), force_refresh=force_refresh)
+    if mirrored is not None:
+        return mirrored
+    return _updated_within(_work_group_issues(work_group, force_refresh=force_refresh), 365)
+
+
+def _capability_issues(work_group: str, force_refresh: bool = False) -> list[dict]:
+    """`issuetype = Capability ORDER BY key ASC`."""
+    issues = _mirror_view(work_group, "issuetype = 'capability'", force_refresh=force_refresh)
+    if issues is None:
+        issues = _work_group_issues(work_group, force_refresh=force_refresh)["by_type"].get("capability", [])
+    return sorted(issues, key=lambda it: _issue_key_sort_key(it.get("key")))
+
+
+def _fr_list_store_issues(fix_version: str, work_group: str, force_refresh: bool = False) -> list[dict] | None:
+    """Fault reports in `fix_version` (label clause left to the caller); None when the store doesn't cover it."""
+    if fix_version not in _store_fix_versions():
+        return None
+    mirrored = _mirror_view(
+        work_group,
+        "issuetype = 'fault report' AND key IN (SELECT key FROM mirror_fix_versions WHERE work_group = ? AND fix_version = ?)",
+        (work_group, fix_version),
+        force_refresh=force_refresh,
+    )
+    if mirrored is not None:
+        return mirrored
+    store = _work_group_issues(work_group, force_refresh=force_refresh)
+    if fix_version not in store["fix_versions"]:
+        return None
+    return [
+        it for it in store["by_fix_version"].get(fix_version, [])
+        if (((it.get("fields") or {}).get("issuetype") or {}).get("name") or "").strip().lower() == "fault report"
+    ]
+
+
+# ---------------- Local issue mirror (SQLite) ----------------
+# Opt-in (JIRA_MIRROR_DB): every configured work group's issue store is mirrored into one SQLite file.
+# A background loop (started with the first mirror read in each process) keeps it current with the same
+# `updated` deltas as above, and the issue views then select their slice of it in SQL over indexed columns
+# instead of building the store from Jira. A mirror behind its sync schedule is still served while a
+# background sync catches it up. A work group not yet mirrored, or not synced for longer than
+# MIRROR_MAX_STALE_SECONDS, the PI fallback for unlisted fix versions and fault report keyword search
+# still go to Jira. Parsed views are cached per work group generation, which every change to it bumps.
+
+_MIRROR_LOCAL = threading.local()
+_MIRROR_SYNC_LOCKS: dict[str, threading.Lock] = {}
+# work groups with a background sync queued or running in this process
+_MIRROR_SYNCING: set[str] = set()
+_MIRROR_START_LOCK = threading.Lock()
+# (work group, where, params) -> (generation, frozen issues), least recently used first
+_MIRROR_VIEWS: "OrderedDict[tuple, tuple]" = OrderedDict()
+_MIRROR_VIEWS_LOCK = threading.Lock()
+# pid of the process whose sync loop is running (a forked worker starts its own)
+_MIRROR_SYNC_PID: int | None = None
+_MIRROR_SCHEMA_VERSION = 2
+
+
+def _mirror_enabled() -> bool:
+    return bool(MIRROR_DB)
+
+
+def _mirror_conn() -> sqlite3.Connection:
+    conn = getattr(_MIRROR_LOCAL, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(MIRROR_DB, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS mirror_issues ("
+            " work_group TEXT NOT NULL, key TEXT NOT NULL, issuetype TEXT NOT NULL, status_category TEXT NOT NULL,"
+            " updated_ms INTEGER NOT NULL, payload TEXT NOT NULL, PRIMARY KEY (work_group, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS mirror_issues_updated ON mirror_issues(work_group, updated_ms)")
+        conn.execute("CREATE INDEX IF NOT EXISTS mirror_issues_key ON mirror_issues(key)")
+        conn.execute("CREATE INDEX IF NOT EXISTS mirror_issues_type ON mirror_issues(work_group, issuetype)")
+        conn.execute("CREATE INDEX IF NOT EXISTS mirror_issues_status ON mirror_issues(work_group, status_category)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS mirror_fix_versions ("
+            " work_group TEXT NOT NULL, fix_version TEXT NOT NULL, key TEXT NOT NULL,"
+            " PRIMARY KEY (work_group, fix_version, key))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS mirror_state ("
+            " work_group TEXT PRIMARY KEY, synced_at REAL NOT NULL, reconciled_at REAL NOT NULL,"
+            " fix_versions TEXT NOT NULL, generation INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS mirror_lease (name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)")
+        if conn.execute("PRAGMA user_version").fetchone()[0] < _MIRROR_SCHEMA_VERSION:
+            # mirror_fix_versions is new: have the next sync of every work group re-pull it in full
+            conn.execute("UPDATE mirror_state SET reconciled_at = 0")
+            conn.execute(f"PRAGMA user_version = {_MIRROR_SCHEMA_VERSION}")
+        _MIRROR_LOCAL.conn = conn
+    return conn
+
+
+def _mirror_state(work_group: str) -> dict | None:
+    row = _mirror_conn().execute(
+        "SELECT synced_at, reconciled_at, fix_versions, generation FROM mirror_state WHERE work_group = ?",
+        (work_group,),
+    ).fetchone()
+    if row is None:
+        return None
+    return {"synced_at": row[0], "reconciled_at": row[1], "fix_versions": json.loads(row[2]), "generation": row[3]}
+
+
+def _mirror_write_issues(conn: sqlite3.Connection, work_group: str, issues: list[dict]):
+    for it in issues:
+        key = it.get("key")
+        if not key:
+            continue
+        fields = it.get("fields") or {}
+        conn.execute(
+            "INSERT OR REPLACE INTO mirror_issues (work_group, key, issuetype, status_category, updated_ms, payload)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                work_group, key,
+                ((fields.get("issuetype") or {}).get("name") or "").strip().lower(),
+                _status_category_key(fields),
+                _jira_time_ms(fields.get("updated")),
+                json.dumps(it, ensure_ascii=False, separators=(",", ":")),
+            ),
+        )
+        conn.execute("DELETE FROM mirror_fix_versions WHERE work_group = ? AND key = ?", (work_group, key))
+        conn.executemany(
+            "INSERT OR IGNORE INTO mirror_fix_versions (work_group, fix_version, key) VALUES (?, ?, ?)",
+            [(work_group, fv, key) for fv in _fix_versions(fields)],
+        )
+
+
+def _mirror_sync_work_group(work_group: str, fix_versions=None, full: bool = False) -> int:
+    """
+    Bring one work group's mirror up to date: an `updated` delta normally, a full re-pull (which also drops
+    deleted issues) when it was never synced, the reconcile interval has passed, or new fix versions appeared.
+    Returns the number of issues written.
+    """
+    if fix_versions is None:
+        fix_versions = _load_app_settings().get("fix_versions") or []
+    started = time.time()
+    state = _mirror_state(work_group)
+    full = (
+        full or state is None
+        or started - state["reconciled_at"] >= DELTA_RECONCILE_SECONDS
+        or not set(fix_versions) <= set(state["fix_versions"])
+    )
+    if full:
+        jql = _work_group_issues_jql(work_group, fix_versions)
+        covered = list(fix_versions)
+    else:
+        jql = f"{_work_group_jql(work_group)} AND {_updated_since_jql(state['synced_at'], started)}"
+        covered = state["fix_versions"]
+    issues = _jira_search_compact(jql, WORK_GROUP_ISSUE_FIELDS, page_size=500, hard_cap=WORK_GROUP_ISSUES_HARD_CAP, strict=True)
+
+    conn = _mirror_conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if full:
+            conn.execute("DELETE FROM mirror_issues WHERE work_group = ?", (work_group,))
+            conn.execute("DELETE FROM mirror_fix_versions WHERE work_group = ?", (work_group,))
+        _mirror_write_issues(conn, work_group, issues)
+        bump = 1 if (full or issues) else 0
+        conn.execute(
+            "INSERT INTO mirror_state (work_group, synced_at, reconciled_at, fix_versions, generation)"
+            " VALUES (?, ?, ?, ?, 1)"
+            " ON CONFLICT(work_group) DO UPDATE SET synced_at = excluded.synced_at,"
+            " reconciled_at = excluded.reconciled_at, fix_versions = excluded.fix_versions,"
+            " generation = mirror_state.generation + ?",
+            (work_group, started, started if full else state["reconciled_at"], json.dumps(covered), bump),
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    print(f"[Mirror] WG='{work_group}': {'full' if full else 'delta'} sync wrote {len(issues)} issues "
+          f"in {time.time() - started:.2f}s")
+    # views read the mirror directly, so the sprint catalog and user directory learn from what was synced
+    try:
+        _sprint_catalog_learn_issues(issues, work_group)
+    except Exception as e:
+        print(f"[Sprints] failed to catalog sprints of {work_group}: {e}")
+    _user_directory_add_issues(issues)
+    return len(issues)
+
+
+def _mirror_sync(work_group: str, fix_versions=None) -> int:
+    """_mirror_sync_work_group, one at a time per work group in this process."""
+    with _MIRROR_START_LOCK:
+        lock = _MIRROR_SYNC_LOCKS.setdefault(work_group, threading.Lock())
+    with lock:
+        return _mirror_sync_work_group(work_group, fix_versions)
+
+
+def _mirror_sync_in_background(work_group: str) -> bool:
+    """Queue one sync of the work group on the refresh pool unless one is already queued or running."""
+    with _MIRROR_START_LOCK:
+        if work_group in _MIRROR_SYNCING:
+            return False
+        _MIRROR_SYNCING.add(work_group)
+
+    def _run():
+        try:
+            _mirror_sync(work_group, _store_fix_versions())
+        except Exception as e:
+            print(f"[Mirror] WG='{work_group}': background sync failed: {e}")
+        finally:
+            with _MIRROR_START_LOCK:
+                _MIRROR_SYNCING.discard(work_group)
+
+    _CACHE_REFRESH_POOL.submit(_run)
+    return True
+
+
+def _mirror_ready(work_group: str, sync_first: bool = False) -> dict | None:
+    """
+    The work group's mirror state when the mirror can answer for it, else None (the caller asks Jira).
+    Syncs first only on `sync_first` (forceRefresh). A mirror behind its sync schedule is served while a
+    background sync catches it up; one never synced, missing fix versions or older than
+    MIRROR_MAX_STALE_SECONDS is not served, and gets a background sync too.
+    """
+    if not (_mirror_enabled() and work_group):
+        return None
+    _start_mirror_sync()
+    state = _mirror_state(work_group)
+    fix_versions = _store_fix_versions()
+    if state is not None and sync_first:
+        try:
+            _mirror_sync(work_group, fix_versions)
+            state = _mirror_state(work_group)
+        except Exception as e:
+            print(f"[Mirror] WG='{work_group}': sync before read failed: {e}")
+    if state is None or not set(fix_versions) <= set(state["fix_versions"]):
+        _mirror_sync_in_background(work_group)
+        return None
+    age = time.time() - state["synced_at"]
+    # the sync loop normally keeps it within one interval
+    state["refreshing"] = age > 2 * MIRROR_SYNC_SECONDS and _mirror_sync_in_background(work_group)
+    if age > MIRROR_MAX_STALE_SECONDS:
+        print(f"[Mirror] WG='{work_group}': last synced {int(age)}s ago; reading Jira instead")
+        return None
+    return state
+
+
+def _mirror_cutoff_ms(days: int) -> int:
+    """`updated >= -{days}d` for mirror views, rounded down to the hour so the view cache key holds for an hour."""
+    hour_ms = 3600 * 1000
+    return _days_ago_ms(days) // hour_ms * hour_ms
+
+
+def _mirror_view(work_group: str, where: str, params=(), force_refresh: bool = False) -> list[dict] | None:
+    """
+    Mirrored issues of the work group matching the SQL condition `where` (over the indexed columns and
+    mirror_fix_versions), newest update first and frozen; None when the mirror can't answer (see _mirror_ready).
+    Payloads are parsed once per view and mirror generation.
+    """
+    state = _mirror_ready(work_group, sync_first=force_refresh)
+    if state is None:
+        return None
+    _note_data_age(state["synced_at"], state["refreshing"])
+    view_key = (work_group, where, tuple(params))
+    with _MIRROR_VIEWS_LOCK:
+        cached = _MIRROR_VIEWS.get(view_key)
+        if cached is not None and cached[0] == state["generation"]:
+            _MIRROR_VIEWS.move_to_end(view_key)
+            return cached[1]
+    rows = _mirror_conn().execute(
+        f"SELECT payload FROM mirror_issues WHERE work_group = ? AND ({where}) ORDER BY updated_ms DESC",
+        (work_group, *params),
+    ).fetchall()
+    issues = _freeze([json.loads(payload) for (payload,) in rows])
+    with _MIRROR_VIEWS_LOCK:
+        _MIRROR_VIEWS[view_key] = (state["generation"], issues)
+        _MIRROR_VIEWS.move_to_end(view_key)
+        while len(_MIRROR_VIEWS) > max(0, MIRROR_VIEW_CACHE_ENTRIES):
+            _MIRROR_VIEWS.popitem(last=False)
+    return issues
+
+
+def _mirror_issues_by_key(keys, fields: list[str]) -> dict[str, dict]:
+    """Mirrored records for any of `keys` (from whichever work group has them), projected onto `fields`."""
+    wanted = [k for k in dict.fromkeys(keys or []) if k]
+    if not (_mirror_enabled() and wanted) or not set(fields) <= set(WORK_GROUP_ISSUE_FIELDS):
+        return {}
+    out = {}
+    conn = _mirror_conn()
+    fresh_since = time.time() - MIRROR_MAX_STALE_SECONDS
+    for i in range(0, len(wanted), 500):
+        chunk = wanted[i:i + 500]
+        marks = ", ".join("?" for _ in chunk)
+        rows = conn.execute(
+            "SELECT i.payload FROM mirror_issues i JOIN mirror_state s ON s.work_group = i.work_group"
+            f" WHERE i.key IN ({marks}) AND s.synced_at >= ?",
+            (*chunk, fresh_since),
+        )
+        for (payload,) in rows:
+            it = json.loads(payload)
+            src = it.get("fields") or {}
+            out[it.get("key")] = {"key": it.get("key"), "fields": {k: src[k] for k in fields if k in src}}
+    return out
+
+
+def _mirror_patch_issues(patches: dict[str, dict]):
+    """Apply successful Jira writes (issue key -> field values) to the mirrored records in one transaction."""
+    if not (_mirror_enabled() and patches):
+        return
+    conn = _mirror_conn()
+    keys = list(patches)
+    rows = []
+    for i in range(0, len(keys), 500):
+        chunk = keys[i:i + 500]
+        rows.extend(conn.execute(
+            f"SELECT work_group, payload FROM mirror_issues WHERE key IN ({', '.join('?' for _ in chunk)})", chunk
+        ).fetchall())
+    if not rows:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for work_group, payload in rows:
+            it = json.loads(payload)
+            fields = it.setdefault("fields", {})
+            for name, value in patches[it.get("key")].items():
+                if name in WORK_GROUP_ISSUE_FIELDS:
+                    fields[name] = _thaw(value(fields.get(name)) if callable(value) else value)
+            fields["updated"] = _jira_time_now()
+            _mirror_write_issues(conn, work_group, [it])
+        # cached views of these work groups are outdated now
+        conn.executemany(
+            "UPDATE mirror_state SET generation = generation + 1 WHERE work_group = ?",
+            [(wg,) for wg in {work_group for work_group, _ in rows}],
+        )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _mirror_try_lease(owner: str, seconds: float) -> bool:
+    now = time.time()
+    cur = _mirror_conn().execute(
+        "INSERT INTO mirror_lease (name, owner, expires) VALUES ('sync', ?, ?)"
+        " ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires = excluded.expires"
+        " WHERE mirror_lease.expires < ? OR mirror_lease.owner = excluded.owner",
+        (owner, now + seconds, now),
+    )
+    return cur.rowcount == 1
+
+
+def _start_mirror_sync(interval_seconds: int = MIRROR_SYNC_SECONDS):
+    """
+    Keep the mirror current from a daemon thread, started once per process (by __main__ or the first mirror
+    read, so WSGI workers get one too). Every worker runs the loop, but only the lease holder talks to Jira.
+    """
+    global _MIRROR_SYNC_PID
+    if not _mirror_enabled() or interval_seconds <= 0:
+        return
+    with _MIRROR_START_LOCK:
+        if _MIRROR_SYNC_PID == os.getpid():
+            return
+        _MIRROR_SYNC_PID = os.getpid()
+    owner = f"{os.getpid()}"
+
+    def _tick():
+        if not _mirror_try_lease(owner, interval_seconds * 3):
+            return
+        settings = _load_app_settings()
+        for row in settings.get("work_groups") or []:
+            work_group = row.get("leadingWorkGroup") or ""
+            try:
+                _mirror_sync(work_group, settings.get("fix_versions") or [])
+            except Exception as e:
+                print(f"[Mirror] WG='{work_group}': sync failed: {e}")
+
+    def _loop():
+        while True:
+            try:
+                _tick()
+            except Exception as e:
+                print(f"[Mirror] sync loop error: {e}")
+            time.sleep(interval_seconds)
+
+    threading.Thread(target=_loop, name="issue-mirror-sync", daemon=True).start()
+
+
+# ---------------- Sprint catalog ----------------
+# Sprint name -> id without JQL scans. Every sprint seen in a work group's issue store, in a sprint move or on an
+# agile board listing is recorded in SPRINT_CATALOG_FILE (id, name, state, dates, board, work groups), and an
+# in-memory index keyed by (canonical name, work group, PI token) turns a lookup into a dict access. A miss
+# re-lists the agile boards the work group's sprints live on before falling back to the old JQL scans.
+
+_SPRINT_CATALOG: dict | None = None
+_SPRINT_CATALOG_INDEX: dict[tuple, list[int]] | None = None
+_SPRINT_CATALOG_LOCK = threading.RLock()
+# serializes file writes, which run outside _SPRINT_CATALOG_LOCK
+_SPRINT_CATALOG_SAVE_LOCK = threading.Lock()
+_SPRINT_CATALOG_DIRTY = False
+_SPRINT_CATALOG_SAVE_TIMER: threading.Timer | None = None
+_SPRINT_STATE_RANK = {"active": 0, "future": 1, "closed": 2}
+
+
+def _sprint_catalog_path() -> str:
+    return os.path.join(app.root_path, SPRINT_CATALOG_FILE)
+
+
+def _sprint_catalog() -> dict:
+    """{"sprints": {id: entry}, "boards": {board id: {"workGroups", "listedAt"}}}, loaded from disk once."""
+    global _SPRINT_CATALOG
+    with _SPRINT_CATALOG_LOCK:
+        if _SPRINT_CATALOG is None:
+            try:
+                with open(_sprint_catalog_path(), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = {}
+            except Exception as e:
+                print(f"[Sprints] ignoring unreadable {SPRINT_CATALOG_FILE}: {e}")
+                data = {}
+            data = data if isinstance(data, dict) else {}
+            _SPRINT_CATALOG = {"sprints": dict(data.get("sprints") or {}), "boards": dict(data.get("boards") or {})}
+        return _SPRINT_CATALOG
+
+
+def _save_sprint_catalog():
+    """Write the catalog if it changed since the last save; readers and learners only wait for the copy."""
+    global _SPRINT_CATALOG_DIRTY, _SPRINT_CATALOG_SAVE_TIMER
+    with _SPRINT_CATALOG_SAVE_LOCK:
+        with _SPRINT_CATALOG_LOCK:
+            _SPRINT_CATALOG_SAVE_TIMER = None
+            if not _SPRINT_CATALOG_DIRTY:
+                return
+            _SPRINT_CATALOG_DIRTY = False
+            catalog = _sprint_catalog()
+            # sprint entries are replaced, never edited; board entries are
+            data = {"sprints": dict(catalog["sprints"]), "boards": {k: dict(v) for k, v in catalog["boards"].items()}}
+        path = _sprint_catalog_path()
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except BaseException:
+            with _SPRINT_CATALOG_LOCK:
+                _SPRINT_CATALOG_DIRTY = True
+            raise
+
+
+def _save_sprint_catalog_quietly():
+    try:
+        _save_sprint_catalog()
+    except Exception as e:
+        print(f"[Sprints] failed to save {SPRINT_CATALOG_FILE}: {e}")
+
+
+def _sprint_catalog_changed():
+    """Mark the catalog for saving; the write happens SPRINT_CATALOG_SAVE_SECONDS later on a timer thread."""
+    global _SPRINT_CATALOG_DIRTY, _SPRINT_CATALOG_SAVE_TIMER
+    with _SPRINT_CATALOG_LOCK:
+        _SPRINT_CATALOG_DIRTY = True
+        if _SPRINT_CATALOG_SAVE_TIMER is None:
+            _SPRINT_CATALOG_SAVE_TIMER = threading.Timer(SPRINT_CATALOG_SAVE_SECONDS, _save_sprint_catalog_quietly)
+            _SPRINT_CATALOG_SAVE_TIMER.daemon = True
+            _SPRINT_CATALOG_SAVE_TIMER.start()
+
+
+atexit.register(_save_sprint_catalog_quietly)
+
+
+def _sprint_catalog_learn(sprints, work_group: str = "", board_id: int | None = None) -> int:
+    """Record compact sprint rows (see _compact_sprints) seen for `work_group`; returns the change count (saved soon)."""
+    global _SPRINT_CATALOG_INDEX
+    rows = {}
+    for row in (sprints or []):
+        if row.get("id") is not None and _canonicalize_sprint_name(row.get("name")):
+            rows[int(row["id"])] = row
+
+    changed = 0
+    with _SPRINT_CATALOG_LOCK:
+        catalog = _sprint_catalog()
+        for sprint_id, row in rows.items():
+            old = catalog["sprints"].get(str(sprint_id)) or {}
+            entry = {
+                "id": sprint_id,
+                "name": str(row.get("name") or old.get("name") or ""),
+                "canonical": _canonicalize_sprint_name(row.get("name")),
+                "piToken": _extract_pi_token(row.get("name")),
+                "state": str(row.get("state") or old.get("state") or "").lower(),
+                "boardId": row.get("boardId", old.get("boardId", board_id)),
+                "startDate": row.get("startDate") or old.get("startDate"),
+                "endDate": row.get("endDate") or old.get("endDate"),
+                "workGroups": sorted(set(old.get("workGroups") or []) | ({work_group} if work_group else set())),
+            }
+            if entry != old:
+                catalog["sprints"][str(sprint_id)] = entry
+                changed += 1
+            if work_group and entry["boardId"] is not None:
+                board = catalog["boards"].setdefault(str(entry["boardId"]), {"workGroups": [], "listedAt": 0})
+                if work_group not in board["workGroups"]:
+                    board["workGroups"] = sorted(set(board["workGroups"]) | {work_group})
+                    changed += 1
+        if changed:
+            _SPRINT_CATALOG_INDEX = None
+            _sprint_catalog_changed()
+    return changed
+
+
+def _sprint_catalog_learn_issues(issues, work_group: str) -> int:
+    return _sprint_catalog_learn(
+        [row for it in (issues or ()) for row in ((it.get("fields") or {}).get("customfield_10701") or ())],
+        work_group,
+    )
+
+
+def _sprint_catalog_index() -> dict[tuple, list[int]]:
+    """(canonical, work group or "", PI token or "") -> sprint ids, best first (active, future, then newest)."""
+    global _SPRINT_CATALOG_INDEX
+    with _SPRINT_CATALOG_LOCK:
+        if _SPRINT_CATALOG_INDEX is not None:
+            return _SPRINT_CATALOG_INDEX
+        catalog = _sprint_catalog()
+        ranked = sorted(
+            catalog["sprints"].values(),
+            key=lambda e: (_SPRINT_STATE_RANK.get(e.get("state"), 3), -int(e.get("id") or 0)),
+        )
+        index: dict[tuple, list[int]] = {}
+        for entry in ranked:
+            board = catalog["boards"].get(str(entry.get("boardId"))) or {}
+            work_groups = set(entry.get("workGroups") or []) | set(board.get("workGroups") or []) | {""}
+            for wg in work_groups:
+                for pi_token in {entry.get("piToken") or "", ""}:
+                    index.setdefault((entry.get("canonical"), wg, pi_token), []).append(int(entry["id"]))
+        _SPRINT_CATALOG_INDEX = index
+        return index
+
+
+def _sprint_catalog_lookup(canonical: str, work_group: str = "", pi_token: str = "") -> int | None:
+    ids = _sprint_catalog_index().get((canonical, work_group or "", pi_token or ""))
+    return ids[0] if ids else None
+
+
+def _jira_list_board_sprints(board_id: int) -> list[dict]:
+    out = []
+    start = 0
+    while True:
+        resp = JIRA_HTTP.get(
+            f"{JIRA_AGILE_BASE_URL}/board/{int(board_id)}/sprint",
+            params={"startAt": start, "maxResults": 50},
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"Failed to list sprints of board {board_id}: {resp.status_code} {resp.text}")
+        data = resp.json() or {}
+        values = data.get("values") or []
+        out.extend(_compact_sprints(values))
+        if data.get("isLast", True) or not values:
+            return out
+        start += len(values)
+
+
+def _sprint_catalog_refresh_boards(work_group: str = "") -> int:
+    """Re-list the agile boards known for `work_group` (all boards if empty) not listed recently; returns changes."""
+    now = time.time()
+    with _SPRINT_CATALOG_LOCK:
+        boards = [
+            board_id for board_id, board in _sprint_catalog()["boards"].items()
+            if (not work_group or work_group in (board.get("workGroups") or []))
+            and now - float(board.get("listedAt") or 0) >= SPRINT_BOARD_REFRESH_SECONDS
+        ]
+        for board_id in boards:
+            _sprint_catalog()["boards"][board_id]["listedAt"] = now
+
+    changed = 0
+    for board_id in boards:
+        try:
+            changed += _sprint_catalog_learn(_jira_list_board_sprints(int(board_id)), board_id=int(board_id))
+        except Exception as e:
+            print(f"[Sprints] {e}")
+    return changed
+
+
+def _jira_get_issue_sprint_refs(issue_key: str) -> list[dict]:
+    url = f"{JIRA_ISSUE}/{issue_key}"
+    resp = JIRA_HTTP.get(url, params={"fields": "customfield_10701"})
+    if resp.status_code != 200:
+        raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
+    fields = (resp.json().get("fields") or {})
+    return _extract_sprint_refs(fields.get("customfield_10701"))
+
+
+def _jira_find_sprint_id_by_name(sprint_name: str, work_group: str = "", fix_version: str = "") -> int | None:
+    canonical_target = _canonicalize_sprint_name(sprint_name)
+    if not canonical_target:
+        return None
+
+    pi_token = _extract_pi_token(fix_version)
+    sprint_id = _sprint_catalog_lookup(canonical_target, work_group, pi_token)
+    if sprint_id is None and _sprint_catalog_refresh_boards(work_group):
+        sprint_id = _sprint_catalog_lookup(canonical_target, work_group, pi_token)
+    if sprint_id is not None:
+        return sprint_id
+
+    # Not catalogued yet: try direct JQL by sprint name.
+    jql_direct = f'sprint = "{sprint_name}" ORDER BY updated DESC'
+    for page in _jira_search_pages(jql_direct, ["customfield_10701"], page_size=50, hard_cap=200):
+        _sprint_catalog_learn([row for issue in page for row in _compact_sprints((issue.get("fields") or {}).get("customfield_10701"))])
+        for issue in page:
+            fields = issue.get("fields", {}) or {}
+            refs = _extract_sprint_refs(fields.get("customfield_10701"))
+            for ref in refs:
+                if ref.get("canonical") == canonical_target and ref.get("id") is not None:
+                    return int(ref["id"])
+
+    # Fallback: scan recent issues in current PI/workgroup scope.
+    clauses = []
+    if work_group:
+        clauses.append(f'"Leading Work Group" = "{work_group}"')
+    if fix_version:
+        clauses.append(f'fixVersion = "{fix_version}"')
+    clauses.append("updated >= -120d")
+    jql_fallback = " AND ".join(clauses) + " ORDER BY updated DESC"
+    for page in _jira_search_pages(jql_fallback, ["customfield_10701"], page_size=200, hard_cap=800):
+        _sprint_catalog_learn_issues(
+            [{"fields": {"customfield_10701": _compact_sprints((issue.get("fields") or {}).get("customfield_10701"))}} for issue in page],
+            work_group,
+        )
+        for issue in page:
+            fields = issue.get("fields", {}) or {}
+            refs = _extract_sprint_refs(fields.get("customfield_10701"))
+            for ref in refs:
+                if ref.get("canonical") == canonical_target and ref.get("id") is not None:
+                    return int(ref["id"])
+
+    return None
+
+
+def _jira_move_issues_to_sprint(issue_keys: list[str], sprint_id: int) -> dict:
+    """One agile call moving up to SPRINT_MOVE_CHUNK issues into a sprint."""
+    url = f"{JIRA_AGILE_SPRINT_ISSUES}/{int(sprint_id)}/issue"
+    payload = {"issues": list(issue_keys)}
+    resp = JIRA_HTTP.post(url, json=payload)
+    if resp.status_code not in (200, 201, 204):
+        raise RuntimeError(
+            f"Failed to move {', '.join(issue_keys)} to sprint {sprint_id}: {resp.status_code} {resp.text}"
+        )
+    return payload
+
+
+def _jira_clear_issue_sprints(issue_key: str) -> dict:
+    # Jira stores Sprint in customfield_10701 in this environment.
+    payload = {"fields": {"customfield_10701": []}}
+    url = f"{JIRA_ISSUE}/{issue_key}"
+    resp = JIRA_HTTP.put(url, json=payload)
+    if resp.status_code not in (200, 204):
         raise RuntimeError(f"Failed to clear sprints for issue {issue_key}: {resp.status_code} {resp.text}")
     return payload
 
@@ -768,7 +2836,7 @@ def _jira_get_priorities(force_refresh: bool = False) -> list[dict]:
     cache_key = ("jira_priorities",)
 
     def _build():
-        resp = requests.get(JIRA_PRIORITY, headers=HEADERS)
+        resp = JIRA_HTTP.get(JIRA_PRIORITY)
         if resp.status_code != 200:
             raise RuntimeError(f"Failed to read Jira priorities: {resp.status_code} {resp.text}")
         data = resp.json()
@@ -807,59 +2875,6 @@ def _resolve_priority_id_from_number(priority_number: int, force_refresh: bool =
     raise RuntimeError(f"Priority '{wanted}' not found in Jira priorities")
 
 
-def _jira_update_issue_priority(issue_key: str, priority_id: str) -> dict:
-    payload = {"fields": {"priority": {"id": str(priority_id)}}}
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.put(url, headers=HEADERS, json=payload)
-    if resp.status_code not in (200, 204):
-        raise RuntimeError(f"Failed to update issue {issue_key} priority: {resp.status_code} {resp.text}")
-    return payload
-
-
-def _jira_get_issue_assignee(issue_key: str) -> dict:
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "assignee"})
-    if resp.status_code != 200:
-        raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
-    fields = (resp.json().get("fields") or {})
-    assignee = (fields.get("assignee") or {})
-    return {
-        "accountId": str(assignee.get("accountId") or "").strip(),
-        "displayName": str(assignee.get("displayName") or assignee.get("name") or "").strip(),
-        "emailAddress": str(assignee.get("emailAddress") or "").strip(),
-    }
-
-
-def _jira_update_issue_assignee(issue_key: str, assignee_identity: dict) -> dict:
-    identity = assignee_identity if isinstance(assignee_identity, dict) else {}
-
-    candidates = []
-    account_id = str(identity.get("accountId") or "").strip()
-    user_name = str(identity.get("name") or "").strip()
-    user_key = str(identity.get("key") or "").strip()
-
-    if account_id:
-        candidates.append(("accountId", account_id))
-    if user_name:
-        candidates.append(("name", user_name))
-    if user_key and user_key != user_name:
-        candidates.append(("key", user_key))
-
-    if not candidates:
-        raise RuntimeError("No valid assignee identity to update Jira issue")
-
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    errors = []
-    for mode, value in candidates:
-        payload = {"fields": {"assignee": {mode: value}}}
-        resp = requests.put(url, headers=HEADERS, json=payload)
-        if resp.status_code in (200, 204):
-            return {"mode": mode, "value": value, "payload": payload}
-        errors.append(f"{mode}={value}: {resp.status_code} {resp.text}")
-
-    raise RuntimeError(f"Failed to update issue {issue_key} assignee: {' | '.join(errors)}")
-
-
 def _resolve_user_identity(account_id: str, display_name: str, email_address: str) -> dict:
     aid = str(account_id or "").strip()
     if aid:
@@ -871,11 +2886,15 @@ def _resolve_user_identity(account_id: str, display_name: str, email_address: st
     if not target_email and not target_name_raw:
         raise RuntimeError("accountId or displayName/emailAddress is required to resolve assignee")
 
+    known = _user_directory_find(target_name_raw, target_email)
+    if known:
+        return known
+
     def _norm_name(s: str) -> str:
         return re.sub(r"[^a-z0-9]+", " ", str(s or "").lower()).strip()
 
     def _token_set(s: str) -> set[str]:
-        return {p for p in _norm_name(s).split(" ") if p}
+        return set(_user_name_tokens(s))
 
     query_candidates = []
     if target_email:
@@ -968,118 +2987,869 @@ def _resolve_user_identity(account_id: str, display_name: str, email_address: st
     raise RuntimeError("Failed to resolve Jira assignee identity")
 
 
-def _jira_get_issue_estimation(issue_key: str) -> int:
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "customfield_10708"})
-    if resp.status_code != 200:
-        raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
-    fields = (resp.json().get("fields") or {})
-    raw_val = fields.get("customfield_10708", 0)
+def _extract_text_value(raw) -> str:
+    if raw is None:
+        return ""
+    if isinstance(raw, str):
+        return raw.strip()
+    if isinstance(raw, list):
+        parts = [_extract_text_value(x) for x in raw]
+        return "\n".join([p for p in parts if p]).strip()
+    if isinstance(raw, dict):
+        if "text" in raw and isinstance(raw.get("text"), str):
+            return (raw.get("text") or "").strip()
+        if isinstance(raw.get("content"), list):
+            return _extract_text_value(raw.get("content"))
+        for key in ("value", "name", "displayName", "description"):
+            value = raw.get(key)
+            if isinstance(value, str) and value.strip():
+                return value.strip()
+        return ""
+    return str(raw).strip()
+
+
+def _jira_get_project_version_names(project_key: str, force_refresh: bool = False) -> list[str]:
+    project_key = str(project_key or "").strip().upper()
+    if not project_key:
+        return []
+
+    cache_key = ("project_versions", project_key)
+
+    def _build():
+        url = f"{JIRA_PROJECT}/{project_key}/versions"
+        resp = JIRA_HTTP.get(url)
+        if resp.status_code != 200:
+            raise RuntimeError(f"Failed to read project versions for {project_key}: {resp.status_code} {resp.text}")
+        data = resp.json()
+        out = []
+        if isinstance(data, list):
+            for v in data:
+                name = str((v or {}).get("name") or "").strip()
+                if name:
+                    out.append(name)
+        return out
+
+    return _cache_get_or_build(cache_key, _build, force_refresh=force_refresh)
+
+
+# A version missing from the cached list re-reads the project's versions, but at most this often per project,
+# so a batch full of the same typo doesn't re-pull the list once per issue.
+PROJECT_VERSIONS_RECHECK_SECONDS = 60
+_PROJECT_VERSION_SETS: dict[str, tuple] = {}
+_PROJECT_VERSIONS_RECHECKED: dict[str, float] = {}
+_PROJECT_VERSIONS_LOCK = threading.Lock()
+
+
+def _issue_project_key(issue_key: str) -> str:
+    """ABC-123 -> ABC (saves reading the issue's project field)."""
+    return str(issue_key or "").strip().upper().rsplit("-", 1)[0]
+
+
+def _project_version_set(project_key: str, force_refresh: bool = False) -> frozenset:
+    """The project's version names as a set, rebuilt only when the cached list changes."""
+    names = _jira_get_project_version_names(project_key, force_refresh=force_refresh)
+    with _PROJECT_VERSIONS_LOCK:
+        built = _PROJECT_VERSION_SETS.get(project_key)
+        if built is not None and built[0] is names:
+            return built[1]
+        versions = frozenset(names)
+        _PROJECT_VERSION_SETS[project_key] = (names, versions)
+        return versions
+
+
+def _unknown_fix_versions(project_key: str, wanted) -> tuple[list[str], frozenset]:
+    """(versions of `wanted` the project lacks, the project's versions)."""
+    valid = _project_version_set(project_key)
+    if not set(wanted) - valid:
+        return [], valid
+    now = time.time()
+    with _PROJECT_VERSIONS_LOCK:
+        recheck = now - _PROJECT_VERSIONS_RECHECKED.get(project_key, 0) >= PROJECT_VERSIONS_RECHECK_SECONDS
+        if recheck:
+            _PROJECT_VERSIONS_RECHECKED[project_key] = now
+    if recheck:
+        # maybe the version was created after the list was cached
+        valid = _project_version_set(project_key, force_refresh=True)
+    return sorted(set(wanted) - valid), valid
+
+
+def _invalid_fix_versions_result(issue_key: str, project_key: str, invalid: list[str], valid, dry_run: bool) -> dict:
+    return {
+        "ok": False,
+        "dryRun": dry_run,
+        "error": f"Invalid Fix Version(s) for project {project_key}: {', '.join(invalid)}",
+        "projectKey": project_key,
+        "invalid": invalid,
+        "validQsVersions": sorted([v for v in valid if re.match(r"^QS_\d{2}w\d{2}$", v)]),
+        "issueKey": issue_key,
+    }
+
+# ---------------- Cache write-through after Jira edits ----------------
+# Write endpoints already read the "after" value back from Jira; instead of forcing a full
+# refresh of every view, that value is patched into each cached issue list holding the issue.
+# A patch is a read-modify-write of the cached list, so it runs under a per-key lock (and, with the shared
+# backend, inside one SQLite write transaction). Cached lists are never edited: the patch copies the list
+# with the records replaced (found through a key -> position map) and publishes it with its updated index.
+
+_CACHE_PATCH_LOCKS: dict[tuple, threading.Lock] = {}
+
+
+def _cached_keys_in_namespaces(namespaces) -> list[tuple]:
+    wanted = set(namespaces or [])
+    with _CACHE_LOCK:
+        keys = [k for k in _DATA_CACHE if k and k[0] in wanted]
+    if _shared_cache_enabled():
+        keys.extend(_shared_cache_keys(wanted))
+    return list(dict.fromkeys(keys))
+
+
+def _cache_patch_lock(cache_key: tuple) -> threading.Lock:
+    with _CACHE_LOCK:
+        return _CACHE_PATCH_LOCKS.setdefault(cache_key, threading.Lock())
+
+
+def _cache_write_lock(cache_key: tuple):
+    """Held while a rebuilt cached issue list is stored, so an in-progress patch can't overwrite it with the old one."""
+    if cache_key and cache_key[0] in ISSUE_LIST_VIEW_FIELDS:
+        return _cache_patch_lock(cache_key)
+    return contextlib.nullcontext()
+
+
+def _cache_issue_positions(cache_key: tuple, issues) -> dict[str, int]:
+    """{issue key: position} of a cached issue list."""
+    return _cache_derived(cache_key, issues, "positions", lambda value: {it.get("key"): i for i, it in enumerate(value)})
+
+
+def _patch_issue_record(record: dict, field_values: dict, view_fields: list[str]) -> dict:
+    fields = _thaw(record.get("fields") or {})
+    for name, value in field_values.items():
+        if name not in view_fields:
+            continue
+        fields[name] = value(fields.get(name)) if callable(value) else value
+    if "updated" in view_fields:
+        # keeps recency slices of the work group store (updated >= -120d / -365d) right
+        fields["updated"] = _jira_time_now()
+    return _freeze({"key": record.get("key", ""), "fields": fields})
+
+
+def _cache_patch_entry(cache_key: tuple, patches: dict[str, dict], inserts: dict[str, dict]) -> dict[str, dict]:
+    """
+    One locked read-modify-write of a cached issue list: a copy with the records of `patches` (issue key ->
+    field values) patched and the records of `inserts` (issue key -> record) put in front when missing,
+    published together with what was derived from the list. Returns issue key -> patched record.
+    """
+    shared = _shared_cache_enabled()
+    with _cache_patch_lock(cache_key):
+        conn = _shared_cache_conn() if shared else None
+        if conn is not None:
+            # serializes the patch with other workers patching or refreshing the same key
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            entry = _cache_lookup(cache_key, allow_expired=True)
+            if shared:
+                shared_created = _shared_cache_created(cache_key)
+                if shared_created is None:
+                    entry = None
+                elif entry is None or shared_created > entry["created"]:
+                    entry = _shared_cache_load(cache_key, allow_expired=True)
+            if entry is None:
+                if conn is not None:
+                    conn.execute("COMMIT")
+                return {}
+
+            issues = entry["value"] or _FrozenList()
+            view_fields = ISSUE_LIST_VIEW_FIELDS[cache_key[0]]
+            positions = _cache_issue_positions(cache_key, issues)
+            size = entry.get("size")
+            records = list(issues)
+            patched = {}
+            replaced = []
+            for issue_key, field_values in patches.items():
+                idx = positions.get(issue_key)
+                if idx is None:
+                    continue
+                old = records[idx]
+                new = _patch_issue_record(old, field_values, view_fields)
+                records[idx] = new
+                if size is not None:
+                    size += _cache_value_size(new) - _cache_value_size(old)
+                patched[issue_key] = new
+                replaced.append((idx, old, new))
+
+            missing = [record for issue_key, record in inserts.items() if issue_key not in positions]
+            if missing:
+                # the list is ordered by `updated DESC` and these issues were just updated
+                records = [
+                    _freeze({"key": r["key"], "fields": {k: v for k, v in r["fields"].items() if k in view_fields}})
+                    for r in missing
+                ] + records
+                size = None
+            if not (patched or missing):
+                if conn is not None:
+                    conn.execute("COMMIT")
+                return {}
+
+            # the records are frozen already
+            patched_issues = _FrozenList(records)
+            derived = {} if missing else _cache_patched(cache_key, entry, patched_issues, positions, replaced)
+            # a fresh `created` is what tells other workers to reload the entry
+            stored = _cache_store(cache_key, patched_issues, expires=entry["expires"], size=size, derived=derived)
+            if conn is not None:
+                if missing:
+                    _shared_cache_put(cache_key, patched_issues, stored["created"], stored["expires"])
+                else:
+                    # only the patched records are written; the list itself stays as last stored
+                    _shared_cache_patch(cache_key, patched, stored["created"])
+                conn.execute("COMMIT")
+        except BaseException:
+            if conn is not None and conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    if "index" in derived:
+        _work_group_learn(cache_key[1], list(patched.values()))
+    return patched
+
+
+def _cache_patched(cache_key: tuple, entry: dict, issues, positions: dict[str, int], replaced: list[tuple]) -> dict:
+    """
+    What was derived from a cached issue list, carried over to `issues`, its copy with records replaced
+    (position, old record, new record): positions stay, the work group index is updated for those records.
+    """
+    derived = {"positions": positions}
+    index = (entry.get("derived") or {}).get("index")
+    if cache_key[0] == "work_group_issues_v1" and index is not None:
+        index = _index_replace_issues(index, issues, positions, replaced)
+        if index is not None:
+            derived["index"] = index
+    return derived
+
+
+def _cache_patch_issues(patches: dict[str, dict], added_fix_versions: dict[str, set] | None = None) -> dict[str, dict]:
+    """
+    Patch field values (compact field form, or callables old -> new), given per issue key, into every cached
+    issue list that contains the issue: one locked read-modify-write per cache key for the whole batch.
+    PI planning lists for a fix version an issue was just added to get its record inserted (projected from
+    another cached view), or are invalidated when no copy is at hand.
+    Returns issue key -> the patched record from the richest view that had it.
+    """
+    added_fix_versions = added_fix_versions or {}
+    sources: dict[str, dict] = {}
+    pi_lists = []
+    for cache_key in _cached_keys_in_namespaces(ISSUE_LIST_VIEW_FIELDS.keys()):
+        if cache_key[0] == "pi_planning_issues_v2" and any(cache_key[1] in added for added in added_fix_versions.values()):
+            # patched after the others, once the richest copy of each record is known
+            pi_lists.append(cache_key)
+            continue
+        for issue_key, record in _cache_patch_entry(cache_key, patches, {}).items():
+            if issue_key not in sources or len(record["fields"]) > len(sources[issue_key]["fields"]):
+                sources[issue_key] = record
+
+    for cache_key in pi_lists:
+        wanted = [k for k, added in added_fix_versions.items() if cache_key[1] in added]
+        if any(k not in sources for k in wanted):
+            _cache_invalidate(cache_key)
+            continue
+        patched = _cache_patch_entry(cache_key, patches, {k: sources[k] for k in wanted})
+        for issue_key, record in patched.items():
+            sources.setdefault(issue_key, record)
+    return sources
+
+
+def _compact_fix_versions_patch(names: list[str]):
+    """fixVersions patch that keeps the archived flag of versions the record already had."""
+    def _apply(old):
+        archived = {fv.get("name"): bool(fv.get("archived")) for fv in (old or []) if isinstance(fv, dict)}
+        return [{"name": n, "archived": archived.get(n, False)} for n in names]
+    return _apply
+
+
+def _sync_caches_after_writes(writes: list[dict]):
+    """
+    Bring cached views in line with a batch of successful Jira writes without re-pulling them.
+    Each write holds _sync_caches_after_write's arguments; every cached list is patched once for the batch.
+    """
+    writes = [w for w in writes or [] if w]
+    if not writes:
+        return
+    patches: dict[str, dict] = {}
+    added: dict[str, set] = {}
+    for w in writes:
+        patches.setdefault(w["issue_key"], {}).update(w.get("field_values") or {})
+        added.setdefault(w["issue_key"], set()).update(w.get("added_fix_versions") or ())
     try:
-        return int(float(raw_val or 0))
-    except Exception:
-        return 0
+        records = _cache_patch_issues(patches, added_fix_versions={k: v for k, v in added.items() if v})
+        _mirror_patch_issues(patches)
+
+        invalidate = []
+        touched = set()
+        for w in writes:
+            touched.update(w.get("touched_fix_versions") or ())
+            if w.get("affects_feature_details"):
+                invalidate.append(("feature_details", w["issue_key"]))
+                parent_key = _resolve_parent_feature_key((records.get(w["issue_key"]) or {}).get("fields") or {}, set())
+                if parent_key:
+                    # the parent's stories estimate includes this issue
+                    invalidate.append(("feature_details", parent_key))
+        if touched:
+            invalidate.extend(k for k in _cached_keys_in_namespaces(["fr_list_issues"]) if k[1] in touched)
+        for cache_key in dict.fromkeys(invalidate):
+            _cache_invalidate(cache_key)
+    except Exception as e:
+        # the Jira writes already succeeded; worst case the views show the old values until their TTL runs out
+        print(f"[Cache] failed to patch cached views for {', '.join(patches)}: {e}")
+
+
+def _sync_caches_after_write(issue_key: str, field_values: dict, added_fix_versions=(), touched_fix_versions=(),
+                             affects_feature_details: bool = False):
+    """Bring cached views in line with a successful Jira write without re-pulling them."""
+    _sync_caches_after_writes([{
+        "issue_key": issue_key,
+        "field_values": field_values,
+        "added_fix_versions": added_fix_versions,
+        "touched_fix_versions": touched_fix_versions,
+        "affects_feature_details": affects_feature_details,
+    }])
+
+
+# ---------------- Bulk issue updates ----------------
+# /bulk_update takes a whole pending change set (the roadmap's "Push to Jira"). The changes for one issue are
+# merged into a single PUT framed by one read before and one read after; issues run BULK_UPDATE_WORKERS at a time.
+
+# change name -> Jira field it reads and writes
+_BULK_CHANGE_FIELDS = {
+    "fixVersions": "fixVersions",
+    "priority": "priority",
+    "estimation": "customfield_10708",
+    "assignee": "assignee",
+    "piScope": "customfield_14700",
+}
 
 
-def _jira_update_issue_estimation(issue_key: str, estimation_value: int) -> dict:
-    payload = {"fields": {"customfield_10708": int(estimation_value)}}
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.put(url, headers=HEADERS, json=payload)
-    if resp.status_code not in (200, 204):
-        raise RuntimeError(f"Failed to update issue {issue_key} estimation: {resp.status_code} {resp.text}")
-    return payload
+def _normalize_pi_scope(raw) -> str:
+    normalized = str(raw or "").strip().lower()
+    if not normalized or normalized == "none":
+        return ""
+    if normalized == "committed":
+        return "Committed"
+    if normalized == "stretch":
+        return "Stretch"
+    if normalized in ("not included", "notincluded"):
+        return "Not Included"
+    raise RuntimeError("piScope must be one of: None, Committed, Stretch, Not Included")
 
 
-def _jira_get_issue_pi_scope(issue_key: str) -> str:
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "customfield_14700"})
+def _merge_bulk_changes(entries: list) -> tuple[list[str], dict, dict]:
+    """Group change entries per issue (later entries win for single-valued fields).
+
+    Returns (issue keys in first-seen order, issue key -> merged changes, issue key -> input error).
+    """
+    order, merged, errors = [], {}, {}
+    for entry in entries:
+        entry = entry if isinstance(entry, dict) else {}
+        issue_key = str(entry.get("issueKey") or "").strip().upper()
+        if issue_key not in merged:
+            order.append(issue_key)
+            merged[issue_key] = {}
+        changes = merged[issue_key]
+        try:
+            if not re.fullmatch(r"[A-Z][A-Z0-9]+-\d+", issue_key):
+                raise RuntimeError("Invalid issueKey format")
+
+            add_versions = entry.get("addFixVersions") or []
+            remove_versions = entry.get("removeFixVersions") or []
+            if not isinstance(add_versions, list) or not isinstance(remove_versions, list):
+                raise RuntimeError("addFixVersions/removeFixVersions must be arrays")
+            add_versions = [str(v).strip() for v in add_versions if str(v).strip()]
+            remove_versions = [str(v).strip() for v in remove_versions if str(v).strip()]
+            if add_versions or remove_versions:
+                fv = changes.setdefault("fixVersions", {"add": [], "remove": []})
+                fv["add"] = sorted(set(fv["add"]) | set(add_versions))
+                fv["remove"] = sorted(set(fv["remove"]) | set(remove_versions))
+
+            if entry.get("priority") is not None:
+                try:
+                    priority_number = int(entry.get("priority"))
+                except Exception:
+                    raise RuntimeError("priority must be integer 1..10")
+                if priority_number < 1 or priority_number > 10:
+                    raise RuntimeError("priority must be in range 1..10")
+                changes["priority"] = priority_number
+
+            if entry.get("estimation") is not None:
+                try:
+                    changes["estimation"] = int(entry.get("estimation"))
+                except Exception:
+                    raise RuntimeError("estimation must be an integer")
+
+            identity = {k: str(entry.get(k) or "").strip() for k in ("accountId", "displayName", "emailAddress")}
+            if any(identity.values()):
+                changes["assignee"] = identity
+
+            if "piScope" in entry:
+                changes["piScope"] = _normalize_pi_scope(entry.get("piScope"))
+        except RuntimeError as e:
+            errors.setdefault(issue_key, str(e))
+
+    for issue_key in order:
+        if issue_key in errors:
+            continue
+        changes = merged[issue_key]
+        if not changes:
+            errors[issue_key] = "Nothing to update"
+            continue
+        fv = changes.get("fixVersions")
+        overlap = sorted(set(fv["add"]) & set(fv["remove"])) if fv else []
+        if overlap:
+            errors[issue_key] = f"Same version in add and remove: {', '.join(overlap)}"
+    return order, merged, errors
+
+
+def _jira_read_issue_fields(issue_key: str, field_ids: list[str]) -> dict:
+    resp = JIRA_HTTP.get(f"{JIRA_ISSUE}/{issue_key}", params={"fields": ",".join(field_ids)})
     if resp.status_code != 200:
         raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
-    fields = (resp.json().get("fields") or {})
-    return _pi_scope_value(fields)
+    return resp.json().get("fields") or {}
+
+
+def _issue_change_values(fields: dict, names: list[str]) -> dict:
+    """Values of the changed fields in the shape the single-field update endpoints report them."""
+    out = {}
+    for name in names:
+        if name == "fixVersions":
+            out[name] = sorted(_fix_versions(fields))
+        elif name == "priority":
+            out[name] = _priority_name(fields)
+        elif name == "estimation":
+            try:
+                out[name] = int(float(fields.get("customfield_10708") or 0))
+            except Exception:
+                out[name] = 0
+        elif name == "assignee":
+            assignee = fields.get("assignee") or {}
+            out[name] = {
+                "accountId": str(assignee.get("accountId") or "").strip(),
+                "displayName": str(assignee.get("displayName") or assignee.get("name") or "").strip(),
+                "emailAddress": str(assignee.get("emailAddress") or "").strip(),
+            }
+        elif name == "piScope":
+            out[name] = _pi_scope_value(fields)
+    return out
+
+
+def _expected_change_values(before: dict, changes: dict, resolved: dict) -> dict:
+    """What the changed fields will read back as once the write lands (dry-run preview / unverified writes)."""
+    out = {}
+    for name in before:
+        if name == "fixVersions":
+            fv = changes["fixVersions"]
+            out[name] = sorted((set(before[name]) | set(fv["add"])) - set(fv["remove"]))
+        elif name == "priority":
+            out[name] = resolved["priority"]["name"]
+        elif name == "estimation":
+            out[name] = int(changes["estimation"])
+        elif name == "assignee":
+            identity = resolved["assignee"]
+            out[name] = {k: identity.get(k, "") for k in ("accountId", "displayName", "emailAddress")}
+        elif name == "piScope":
+            out[name] = changes["piScope"]
+    return out
+
+
+def _jira_apply_issue_changes(issue_key: str, changes: dict, dry_run: bool = True, verify: bool = True,
+                              versions_checked: bool = False, cache_writes: list | None = None) -> dict:
+    """Write one issue's changes with one read, one PUT and (when `verify`) one read back.
+
+    Returns the per-issue result; an invalid fix version comes back as a failed result carrying the valid
+    QS versions instead of raising, so callers can show them. `versions_checked` skips that validation
+    when the caller already did it for the whole batch (see _bulk_fix_version_failures). With `cache_writes`
+    the cache update is appended there for the caller to apply with the batch (_sync_caches_after_writes).
+    """
+    names = [n for n in _BULK_CHANGE_FIELDS if n in changes]
+    read_fields = [_BULK_CHANGE_FIELDS[n] for n in names]
+    fields = _jira_read_issue_fields(issue_key, read_fields)
+    before = _issue_change_values(fields, names)
+
+    payload = {"fields": {}, "update": {}}
+    resolved = {}
+    assignee_candidates = []
+    add_set, remove_set = set(), set()
+    if "fixVersions" in changes:
+        add_set = set(changes["fixVersions"]["add"])
+        remove_set = set(changes["fixVersions"]["remove"])
+        if add_set and not versions_checked:
+            project_key = _issue_project_key(issue_key)
+            invalid_add, valid_versions = _unknown_fix_versions(project_key, add_set)
+            if invalid_add:
+                return dict(
+                    _invalid_fix_versions_result(issue_key, project_key, invalid_add, valid_versions, dry_run),
+                    before=before,
+                )
+        payload["update"]["fixVersions"] = (
+            [{"add": {"name": v}} for v in sorted(add_set)] + [{"remove": {"name": v}} for v in sorted(remove_set)]
+        )
+    if "priority" in changes:
+        priority_id, priority_name = _resolve_priority_id_from_number(changes["priority"])
+        resolved["priority"] = {"id": priority_id, "name": priority_name}
+        payload["fields"]["priority"] = {"id": str(priority_id)}
+    if "estimation" in changes:
+        payload["fields"]["customfield_10708"] = int(changes["estimation"])
+    if "assignee" in changes:
+        wanted = changes["assignee"]
+        identity = _resolve_user_identity(wanted["accountId"], wanted["displayName"], wanted["emailAddress"])
+        resolved["assignee"] = identity
+        # accountId, then name, then key: tried in order if Jira rejects the identity
+        for mode in ("accountId", "name", "key"):
+            value = str(identity.get(mode) or "").strip()
+            if value and (mode, value) not in assignee_candidates and not (mode == "key" and value == identity.get("name")):
+                assignee_candidates.append((mode, value))
+        if not assignee_candidates:
+            raise RuntimeError("No valid assignee identity to update Jira issue")
+        payload["fields"]["assignee"] = {assignee_candidates[0][0]: assignee_candidates[0][1]}
+    if "piScope" in changes:
+        scope = changes["piScope"]
+        payload["fields"]["customfield_14700"] = {"value": scope} if scope else None
+    payload = {k: v for k, v in payload.items() if v}
+
+    result = {
+        "ok": True,
+        "dryRun": dry_run,
+        "issueKey": issue_key,
+        "before": before,
+        "requested": changes,
+        "resolved": resolved,
+        "payload": payload,
+    }
+    expected = _expected_change_values(before, changes, resolved)
+    if dry_run:
+        result["afterPreview"] = expected
+        return result
+
+    url = f"{JIRA_ISSUE}/{issue_key}"
+    errors = []
+    for mode, value in assignee_candidates or [(None, None)]:
+        if mode:
+            payload["fields"]["assignee"] = {mode: value}
+        resp = JIRA_HTTP.put(url, json=payload)
+        if resp.status_code in (200, 204):
+            break
+        detail = f"{resp.status_code} {resp.text}"
+        errors.append(f"{mode}={value}: {detail}" if mode else detail)
+    else:
+        raise RuntimeError(f"Failed to update issue {issue_key}: {' | '.join(errors)}")
+
+    if verify:
+        after = _issue_change_values(_jira_read_issue_fields(issue_key, read_fields), names)
+    else:
+        after = expected
+    result["after"] = after
+    result["verified"] = verify
+
+    patch = {}
+    if "fixVersions" in after:
+        patch["fixVersions"] = _compact_fix_versions_patch(after["fixVersions"])
+    if "priority" in after:
+        patch["priority"] = {"name": after["priority"]}
+    if "estimation" in after:
+        patch["customfield_10708"] = after["estimation"]
+    if "assignee" in after:
+        patch["assignee"] = _compact_user(after["assignee"])
+    if "piScope" in after:
+        patch["customfield_14700"] = {"value": after["piScope"]} if after["piScope"] else None
+    write = {
+        "issue_key": issue_key,
+        "field_values": patch,
+        "added_fix_versions": add_set,
+        "touched_fix_versions": add_set | remove_set,
+        "affects_feature_details": "estimation" in after or "assignee" in after,
+    }
+    if cache_writes is None:
+        _sync_caches_after_writes([write])
+    else:
+        cache_writes.append(write)
+    return result
+
+
+def _sprint_canonicals(refs: list[dict]) -> list[str]:
+    return sorted({str(ref.get("canonical") or "") for ref in refs if ref.get("canonical")})
+
+
+def _jira_move_sprints(moves: dict, work_group: str = "", fix_version: str = "", dry_run: bool = True) -> dict:
+    """Move many stories between sprints: {issue key: "Sprint N" | "No Sprint"} -> {issue key: result}.
+
+    Before/after values come from batched key searches. Moves are grouped by target sprint into agile calls
+    of up to SPRINT_MOVE_CHUNK issues, and each sprint name is resolved to an id at most once per batch.
+    "No Sprint" has no agile equivalent and is cleared per issue.
+    """
+    results = {}
+    before_issues = _jira_search_keys(list(moves), ["customfield_10701"])
+    before_refs = {}
+    for issue_key, target in moves.items():
+        issue = before_issues.get(issue_key)
+        if issue is None:
+            results[issue_key] = {"ok": False, "dryRun": dry_run, "issueKey": issue_key, "error": f"Issue {issue_key} not found"}
+            continue
+        before_refs[issue_key] = _extract_sprint_refs((issue.get("fields") or {}).get("customfield_10701"))
+        results[issue_key] = {
+            "ok": True,
+            "dryRun": dry_run,
+            "issueKey": issue_key,
+            "before": _sprint_canonicals(before_refs[issue_key]),
+            "requested": target,
+        }
+    if dry_run:
+        return results
+
+    by_sprint: dict[int, list[str]] = {}
+    clears = []
+    sprint_ids = {}
+    for issue_key, refs in before_refs.items():
+        target = moves[issue_key]
+        if target == "No Sprint":
+            clears.append(issue_key)
+            continue
+        # the issue's own sprint refs win, like /update_story_sprint; otherwise one lookup per sprint name
+        target_id = next((int(r["id"]) for r in refs if r.get("canonical") == target and r.get("id") is not None), None)
+        if target_id is None:
+            if target not in sprint_ids:
+                try:
+                    sprint_ids[target] = _jira_find_sprint_id_by_name(target, work_group=work_group, fix_version=fix_version)
+                except Exception as e:
+                    sprint_ids[target] = None
+                    print(f"[Sprints] lookup of '{target}' failed: {e}")
+            target_id = sprint_ids[target]
+        if target_id is None:
+            results[issue_key].update(ok=False, error=f"Sprint id not found for '{target}'")
+            continue
+        results[issue_key]["sprintId"] = target_id
+        by_sprint.setdefault(target_id, []).append(issue_key)
+
+    calls = [(sprint_id, keys[i:i + SPRINT_MOVE_CHUNK])
+             for sprint_id, keys in by_sprint.items() for i in range(0, len(keys), SPRINT_MOVE_CHUNK)]
+    calls += [(None, [issue_key]) for issue_key in clears]
+
+    def _run(call):
+        sprint_id, keys = call
+        try:
+            if sprint_id is None:
+                return keys, _jira_clear_issue_sprints(keys[0]), None
+            return keys, _jira_move_issues_to_sprint(keys, sprint_id), None
+        except Exception as e:
+            return keys, None, str(e)
+
+    written = []
+    if calls:
+        with ThreadPoolExecutor(max_workers=max(1, min(BULK_UPDATE_WORKERS, len(calls))), thread_name_prefix="sprint-move") as pool:
+            for keys, payload, error in pool.map(_run, calls):
+                for issue_key in keys:
+                    if error:
+                        results[issue_key].update(ok=False, error=error)
+                    else:
+                        results[issue_key]["payload"] = payload
+                        written.append(issue_key)
+
+    after_issues = _jira_search_keys(written, ["customfield_10701"])
+    seen_sprints = []
+    cache_writes = []
+    for issue_key in written:
+        raw = ((after_issues.get(issue_key) or {}).get("fields") or {}).get("customfield_10701")
+        results[issue_key]["after"] = _sprint_canonicals(_extract_sprint_refs(raw))
+        if issue_key in after_issues:
+            cache_writes.append({"issue_key": issue_key, "field_values": {"customfield_10701": _compact_sprints(raw)}})
+            seen_sprints.extend(_compact_sprints(raw))
+    # one patch per cached list for the whole batch
+    _sync_caches_after_writes(cache_writes)
+    _sprint_catalog_learn(seen_sprints, work_group)
+    return results
 
 
-def _jira_update_issue_pi_scope(issue_key: str, pi_scope_value: str) -> dict:
-    raw = str(pi_scope_value or "").strip()
-    normalized = raw.lower()
+def _bulk_fix_version_failures(merged: dict, dry_run: bool) -> dict:
+    """Check every added fix version of a batch with one version lookup per project; failed results by issue key."""
+    by_project: dict[str, dict] = {}
+    for issue_key, changes in merged.items():
+        added = (changes.get("fixVersions") or {}).get("add") or []
+        if added:
+            by_project.setdefault(_issue_project_key(issue_key), {})[issue_key] = added
 
-    if not normalized or normalized == "none":
-        payload = {"fields": {"customfield_14700": None}}
-    elif normalized == "committed":
-        payload = {"fields": {"customfield_14700": {"value": "Committed"}}}
-    elif normalized == "stretch":
-        payload = {"fields": {"customfield_14700": {"value": "Stretch"}}}
-    elif normalized in ("not included", "notincluded"):
-        payload = {"fields": {"customfield_14700": {"value": "Not Included"}}}
-    else:
-        raise RuntimeError("piScope must be one of: None, Committed, Stretch, Not Included")
+    failures = {}
+    for project_key, issues in by_project.items():
+        try:
+            unknown, valid = _unknown_fix_versions(project_key, set().union(*issues.values()))
+        except Exception as e:
+            for issue_key in issues:
+                failures[issue_key] = {"ok": False, "dryRun": dry_run, "issueKey": issue_key, "error": str(e)}
+            continue
+        for issue_key, added in issues.items():
+            invalid = sorted(set(added) & set(unknown))
+            if invalid:
+                failures[issue_key] = _invalid_fix_versions_result(issue_key, project_key, invalid, valid, dry_run)
+    return failures
 
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.put(url, headers=HEADERS, json=payload)
-    if resp.status_code not in (200, 204):
-        raise RuntimeError(f"Failed to update issue {issue_key} PI Scope: {resp.status_code} {resp.text}")
-    return payload
 
+def _single_field_response(result: dict, name: str, **extra):
+    """Shape a combined-edit result like the single-field update_* routes always answered."""
+    if not result.get("ok"):
+        return jsonify(result), 400
+    out = {"ok": True, "dryRun": result["dryRun"], "issueKey": result["issueKey"], "before": result["before"][name]}
+    if "after" in result:
+        out["after"] = result["after"][name]
+    out.update(extra)
+    out["payload"] = result["payload"]
+    return jsonify(out)
 
-def _extract_text_value(raw) -> str:
-    if raw is None:
-        return ""
-    if isinstance(raw, str):
-        return raw.strip()
-    if isinstance(raw, list):
-        parts = [_extract_text_value(x) for x in raw]
-        return "\n".join([p for p in parts if p]).strip()
-    if isinstance(raw, dict):
-        if "text" in raw and isinstance(raw.get("text"), str):
-            return (raw.get("text") or "").strip()
-        if isinstance(raw.get("content"), list):
-            return _extract_text_value(raw.get("content"))
-        for key in ("value", "name", "displayName", "description"):
-            value = raw.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-        return ""
-    return str(raw).strip()
 
+# ---------------- Background write jobs ----------------
+# A write endpoint called with "async": true enqueues a job and answers 202 with its id, so a push survives a closed
+# tab or a proxy timeout. /jobs/<id> reports progress and per-issue outcomes; /jobs/<id>/retry re-runs failed issues.
+# Jobs live in memory (the newest JOB_HISTORY) and all of them share one pool of JOB_WORKERS Jira writers.
 
-def _jira_get_issue_project_key(issue_key: str) -> str:
-    url = f"{JIRA_ISSUE}/{issue_key}"
-    resp = requests.get(url, headers=HEADERS, params={"fields": "project"})
-    if resp.status_code != 200:
-        raise RuntimeError(f"Failed to read issue {issue_key}: {resp.status_code} {resp.text}")
-    fields = (resp.json().get("fields") or {})
-    project = (fields.get("project") or {})
-    return str(project.get("key") or "").strip().upper()
+_JOBS: "OrderedDict[str, dict]" = OrderedDict()
+_JOBS_LOCK = threading.Lock()
+_JOB_POOL = ThreadPoolExecutor(max_workers=max(1, JOB_WORKERS), thread_name_prefix="jira-job")
 
 
-def _jira_get_project_version_names(project_key: str, force_refresh: bool = False) -> list[str]:
-    project_key = str(project_key or "").strip().upper()
-    if not project_key:
-        return []
+def _job_create(kind: str, dry_run: bool, order: list[str], runners: dict, results: dict, on_finish=None) -> dict:
+    """
+    Register a job; `runners` maps item id -> callable returning its result, `results` holds items already failed.
+    `on_finish` is called each time the job runs out of queued items (again after a retry).
+    """
+    job = {
+        "id": uuid.uuid4().hex,
+        "kind": kind,
+        "dryRun": dry_run,
+        "created": time.time(),
+        "started": None,
+        "finished": None,
+        "order": list(order),
+        "items": {},
+        "remaining": 0,
+        "on_finish": on_finish,
+    }
+    for item_id in order:
+        job["items"][item_id] = {
+            "state": "failed" if item_id in results else "queued",
+            "attempts": 0,
+            "result": results.get(item_id),
+            "run": runners.get(item_id),
+        }
 
-    cache_key = ("project_versions", project_key)
+    with _JOBS_LOCK:
+        _JOBS[job["id"]] = job
+        # forget the oldest finished jobs beyond the history limit
+        for job_id in [k for k, j in _JOBS.items() if j["finished"]][:max(0, len(_JOBS) - JOB_HISTORY)]:
+            del _JOBS[job_id]
 
-    def _build():
-        url = f"{JIRA_PROJECT}/{project_key}/versions"
-        resp = requests.get(url, headers=HEADERS)
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to read project versions for {project_key}: {resp.status_code} {resp.text}")
-        data = resp.json()
-        out = []
-        if isinstance(data, list):
-            for v in data:
-                name = str((v or {}).get("name") or "").strip()
-                if name:
-                    out.append(name)
-        return out
+    _job_submit(job, [item_id for item_id in order if item_id in runners])
+    return job
+
+
+def _job_submit(job: dict, item_ids: list[str] | None = None) -> list[str]:
+    """Queue items on the writer pool (default: the failed ones that can run again); returns the ids queued."""
+    with _JOBS_LOCK:
+        if item_ids is None:
+            # items rejected as invalid input have no runner and would only fail again
+            item_ids = [
+                item_id for item_id in job["order"]
+                if job["items"][item_id]["state"] == "failed" and job["items"][item_id]["run"] is not None
+            ]
+        for item_id in item_ids:
+            job["items"][item_id].update(state="queued", result=None)
+        job["remaining"] += len(item_ids)
+        if not job["remaining"]:
+            job["finished"] = job["finished"] or time.time()
+            return item_ids
+        job["finished"] = None
+    for item_id in item_ids:
+        _JOB_POOL.submit(_job_run_item, job, item_id)
+    return item_ids
+
+
+def _job_run_item(job: dict, item_id: str):
+    item = job["items"][item_id]
+    with _JOBS_LOCK:
+        item["state"] = "running"
+        job["started"] = job["started"] or time.time()
+    try:
+        result = item["run"]()
+    except Exception as e:
+        result = {"ok": False, "error": str(e)}
+    with _JOBS_LOCK:
+        item["result"] = result
+        item["state"] = "done" if result.get("ok") else "failed"
+        item["attempts"] += 1
+        job["remaining"] -= 1
+        finished = not job["remaining"]
+        if finished:
+            job["finished"] = time.time()
+            print(f"[Jobs] {job['kind']} {job['id']} finished in {job['finished'] - job['started']:.1f}s")
+    if finished and job["on_finish"] is not None:
+        try:
+            job["on_finish"]()
+        except Exception as e:
+            print(f"[Jobs] {job['kind']} {job['id']} finish hook failed: {e}")
+
+
+def _job_status(job: dict) -> dict:
+    with _JOBS_LOCK:
+        states = Counter(item["state"] for item in job["items"].values())
+        results = [
+            dict(job["items"][item_id]["result"] or {"issueKey": item_id},
+                 state=job["items"][item_id]["state"], attempts=job["items"][item_id]["attempts"])
+            for item_id in job["order"]
+        ]
+        if job["finished"]:
+            status = "finished"
+        elif job["started"]:
+            status = "running"
+        else:
+            status = "queued"
+        return {
+            "ok": True,
+            "jobId": job["id"],
+            "kind": job["kind"],
+            "dryRun": job["dryRun"],
+            "status": status,
+            "created": job["created"],
+            "started": job["started"],
+            "finished": job["finished"],
+            "total": len(job["order"]),
+            "completed": states["done"] + states["failed"],
+            "succeeded": states["done"],
+            "failed": states["failed"],
+            "results": results,
+        }
 
-    return _cache_get_or_build(cache_key, _build, force_refresh=force_refresh)
 
 # ======================================================================
 #                       1) FAULT REPORT DASHBOARD
 # ======================================================================
 
+def _fr_list_rows(issues) -> list[dict]:
+    out = []
+    for it in issues:
+        f = it.get("fields") or {}
+        out.append({
+            "key": it.get("key"),
+            "summary": f.get("summary", ""),
+            "status": f.get("status", {}),
+            "labels": [str(x).lower() for x in (f.get("labels") or [])],
+            "classes": [
+                get_classes(str(lbl).lower())
+                for lbl in (f.get("labels") or [])
+                if get_classes(str(lbl).lower()) not in ["buildissue", "internal_dev", "internla_dev"]
+            ],
+            "linked_features": extract_linked_features_for_fr(f.get("issuelinks", []))
+        })
+    return out
+
 def fr_list_issues(fix_version, work_group, force_refresh: bool = False):
+    issues = _fr_list_store_issues(fix_version, work_group, force_refresh=force_refresh)
+    if issues is not None:
+        # the store has every fault report of the fix version; apply the label clause here
+        return _fr_list_rows(
+            it for it in issues
+            if {"buildissue", "internal_dev"} <= {str(x).lower() for x in ((it.get("fields") or {}).get("labels") or [])}
+        )
+
     def _build():
         jql = (
             'type = "Fault Report" AND '
@@ -1087,25 +3857,10 @@ def fr_list_issues(fix_version, work_group, force_refresh: bool = False):
             f'fixVersion = "{fix_version}" '
             'AND (labels = "BuildIssue" AND labels = "Internal_Dev")'
         )
-        data = _jira_search(jql, ["summary", "status", "fixVersions", "labels", "issuelinks"], max_results=500)
-        out = []
+        data = _jira_search(jql, FR_LIST_FIELDS, max_results=500)
         if not data:
-            return out
-        for it in data.get("issues", []):
-            f = it.get("fields") or {}
-            out.append({
-                "key": it.get("key"),
-                "summary": f.get("summary", ""),
-                "status": f.get("status", {}),
-                "labels": [str(x).lower() for x in (f.get("labels") or [])],
-                "classes": [
-                    get_classes(str(lbl).lower())
-                    for lbl in (f.get("labels") or [])
-                    if get_classes(str(lbl).lower()) not in ["buildissue", "internal_dev", "internla_dev"]
-                ],
-                "linked_features": extract_linked_features_for_fr(f.get("issuelinks", []))
-            })
-        return out
+            return []
+        return _fr_list_rows(data.get("issues", []))
 
     cache_key = ("fr_list_issues", fix_version, work_group)
     return _cache_get_or_build(cache_key, _build, force_refresh=force_refresh)
@@ -1191,22 +3946,33 @@ def _match_and_normalize_sprint(raw, pi_token_lc: str):
 
     return (None, matches_pi)
 
+FEATURE_SIDE_LOAD_FIELDS = [
+    "summary", "issuetype", "issuelinks", "customfield_14700", "status", "priority",
+    "customfield_13801",
+    "fixVersions", "customfield_10708", "assignee", "reporter"
+]
+
 def _fetch_issue_full(key: str):
     """Side fetch for a missing parent Feature."""
     url = f"{JIRA_ISSUE}/{key}"
-    params = {
-        "fields": ",".join([
-            "summary", "issuetype", "issuelinks", "customfield_14700", "status", "priority",
-            "customfield_13801",
-            "fixVersions", "customfield_10708", "assignee", "reporter"
-        ])
-    }
-    resp = requests.get(url, headers=HEADERS, params=params)
+    params = {"fields": ",".join(FEATURE_SIDE_LOAD_FIELDS)}
+    resp = JIRA_HTTP.get(url, params=params)
     if resp.status_code == 200:
         return resp.json()
     return None
 
-def _seed_feature_from_issue_json(issue_json: dict, summary_cache: dict, cap_meta_cache: dict[str, dict]):
+def _fetch_issues_full(keys) -> dict[str, dict]:
+    """Bulk side fetch for missing parent Features: mirror first, then a batched search, single GET only for leftovers."""
+    found = _mirror_issues_by_key(keys, FEATURE_SIDE_LOAD_FIELDS)
+    found.update(_jira_search_keys([k for k in (keys or []) if k not in found], FEATURE_SIDE_LOAD_FIELDS))
+    for key in (keys or []):
+        if key and key not in found:
+            issue = _fetch_issue_full(key)
+            if issue:
+                found[key] = issue
+    return found
+
+def _seed_feature_from_issue_json(issue_json: dict, cap_meta_cache: dict[str, dict]):
     """Turn a fetched Feature issue into a row for 'features' dict."""
     if not issue_json:
         return None
@@ -1222,13 +3988,7 @@ def _seed_feature_from_issue_json(issue_json: dict, summary_cache: dict, cap_met
     priority_value = _priority_name(fields)
 
     parent_link_value = _extract_capability_key(fields)
-    parent_summary = _get_issue_summary(parent_link_value, summary_cache) if parent_link_value else ""
-    parent_meta = _get_issue_meta(parent_link_value, cap_meta_cache) if parent_link_value else {
-        "summary": "",
-        "leading_work_group": "",
-        "created": "",
-        "priority": "",
-    }
+    parent_meta = _get_issue_meta(parent_link_value, cap_meta_cache) if parent_link_value else _empty_issue_meta()
 
     fix_versions = _fix_versions(fields)
     feature_sp = _story_points(fields)
@@ -1241,7 +4001,7 @@ def _seed_feature_from_issue_json(issue_json: dict, summary_cache: dict, cap_met
         "pi_scope": pi_scope_value,
         "priority": priority_value,
         "parent_link": parent_link_value,
-        "parent_summary": parent_summary or parent_meta.get("summary", ""),
+        "parent_summary": parent_meta.get("summary", ""),
         "parent_leading_work_group": parent_meta.get("leading_work_group", ""),
         "parent_created": parent_meta.get("created", ""),
         "parent_priority": parent_meta.get("priority", ""),
@@ -1313,55 +4073,48 @@ def get_pi_planning(fix_version: str, work_group: str, force_refresh: bool = Fal
     """
     pi_token = _extract_pi_token(fix_version)
 
-    fields_needed = [
-        "summary", "issuetype", "issuelinks",
-        "customfield_10701",      # Sprint(s)
-        "customfield_14700",      # PI Scope
-        "status", "priority",
-        "customfield_13801",      # Capability link
-        "fixVersions",
-        "customfield_10702",      # Epic Link (if exists)
-        "customfield_10708",      # Story Points
-        "assignee",
-        "reporter",
-        "parent"
-    ]
+    fields_needed = PI_PLANNING_FIELDS
 
-    # Pull everything for WG that is either in this PI (fixVersion) OR recently updated (to catch sprint-only children).
-    jql = (
-        f'"Leading Work Group" = "{work_group}" '
-        f'AND (fixVersion = "{fix_version}" OR updated >= -120d) '
-        "ORDER BY updated DESC"
-    )
-    cache_key = ("pi_planning_issues_v2", fix_version, work_group)
-    issues = _cache_get_or_build(
-        cache_key,
-        lambda: _jira_search_all(jql, fields_needed, page_size=1000, hard_cap=6000),
-        force_refresh=force_refresh,
-    )
+    # Everything for WG that is either in this PI (fixVersion) OR recently updated (to catch sprint-only children).
+    issues = _pi_planning_issues(fix_version, work_group, force_refresh=force_refresh)
+    if issues is None:
+        # fix version not in app_settings.json, so not in the work group's store: search it directly
+        jql = (
+            f'"Leading Work Group" = "{work_group}" '
+            f'AND (fixVersion = "{fix_version}" OR updated >= -120d) '
+            "ORDER BY updated DESC"
+        )
+        cache_key = ("pi_planning_issues_v2", fix_version, work_group)
+        issues = _cached_issue_search(
+            cache_key, jql, fields_needed,
+            work_group=work_group,
+            page_size=1000, hard_cap=6000, force_refresh=force_refresh,
+        )
 
     features: dict[str, dict] = {}
-    summary_cache: dict[str, str] = {}
     cap_meta_cache: dict[str, dict] = {}
 
+    seed_issues = [
+        it for it in issues
+        if _is_feature_type(it.get("fields", {}) or {})
+        and fix_version in _fix_versions(it.get("fields", {}) or {})  # seed only the ones clearly in this PI
+    ]
+
+    # Resolve every capability of the seed set in a few batched searches instead of one GET each.
+    _prefetch_issue_meta([_extract_capability_key(it.get("fields", {}) or {}) for it in seed_issues], cap_meta_cache)
+
     # 1) Seed Features that explicitly carry this fixVersion
-    for it in issues:
-        fields = it.get("fields", {}) or {}
-        if not _is_feature_type(fields):
-            continue
-        if fix_version not in _fix_versions(fields):
-            continue  # seed only the ones clearly in this PI
-        key = it.get("key", "")
-        seeded = _seed_feature_from_issue_json(it, summary_cache, cap_meta_cache)
+    for it in seed_issues:
+        seeded = _seed_feature_from_issue_json(it, cap_meta_cache)
         if seeded:
             fk, row = seeded
             features[fk] = row
 
     feature_keys = set(features.keys())
 
-    # 2) Attach children (Story / Fault Report). If their parent Feature wasn't seeded, fetch/seed it now.
+    # 2a) Collect in-PI children (Story / Fault Report) with their parent Feature key.
+    pi_children = []
     for it in issues:
-        key = it.get("key", "")
         fields = it.get("fields", {}) or {}
         itype_name = ((fields.get("issuetype") or {}).get("name") or "").lower()
         if itype_name not in ("story", "fault report"):
@@ -1380,19 +4133,32 @@ def get_pi_planning(fix_version: str, work_group: str, force_refresh: bool = Fal
             continue
 
         parent_key = _resolve_parent_feature_key(fields, feature_keys)
-
-        if parent_key and parent_key not in features:
-            # side-load parent Feature and seed
-            parent_issue = _fetch_issue_full(parent_key)
-            seeded = _seed_feature_from_issue_json(parent_issue, summary_cache, cap_meta_cache)
+        if parent_key:
+            pi_children.append((it, parent_key))
+
+    # 2b) Side-load all parent Features that weren't seeded in one batch, then seed them.
+    missing_parents = list(dict.fromkeys(pk for _, pk in pi_children if pk not in features))
+    if missing_parents:
+        parent_issues = _fetch_issues_full(missing_parents)
+        _prefetch_issue_meta(
+            [_extract_capability_key(p.get("fields", {}) or {}) for p in parent_issues.values()],
+            cap_meta_cache,
+        )
+        for parent_key in missing_parents:
+            seeded = _seed_feature_from_issue_json(parent_issues.get(parent_key), cap_meta_cache)
             if seeded:
                 pk, prow = seeded
                 features[pk] = prow
                 feature_keys.add(pk)
 
-        if not parent_key or parent_key not in features:
+    # 2c) Attach children to their parent Features.
+    for it, parent_key in pi_children:
+        if parent_key not in features:
             continue
 
+        key = it.get("key", "")
+        fields = it.get("fields", {}) or {}
+
         # story points for child
         sp_val = _story_points(fields)
 
@@ -1481,23 +4247,8 @@ def backlog_data_service(work_group: str, force_refresh: bool = False) -> dict:
     All Feature-type issues for WG where statusCategory != done (across all fixVersions).
     Includes Capability (customfield_13801) and resolves its summary.
     """
-    fields_needed = [
-        "summary", "issuetype", "issuelinks", "customfield_14700",
-        "status", "priority", "fixVersions", "customfield_10708", "assignee", "reporter",
-        "customfield_13801",  # Capability link
-        "customfield_13802",  # Target start
-        "customfield_13803",  # Target end
-    ]
-
     # Back to efficient mode: seed only non-done issues for backlog table.
-    jql = f'"Leading Work Group" = "{work_group}" AND statusCategory != Done'
-
-    cache_key = ("backlog_issues_v6", work_group)
-    issues = _cache_get_or_build(
-        cache_key,
-        lambda: _jira_search_all(jql, fields_needed, page_size=500, hard_cap=20000),
-        force_refresh=force_refresh,
-    )
+    issues = _backlog_issues(work_group, force_refresh=force_refresh)
     if not issues:
         print(f"[Backlog] WG='{work_group}': no results from Jira")
         return {}
@@ -1505,16 +4256,19 @@ def backlog_data_service(work_group: str, force_refresh: bool = False) -> dict:
     features: dict[str, dict] = {}
     cap_cache: dict[str, dict] = {}
 
-    for it in issues:
+    backlog_issues = [
+        it for it in issues
+        if _is_feature_type(it.get("fields") or {})
+        and _status_category_key(it.get("fields") or {}) != "done"
+    ]
+    _prefetch_issue_meta([_extract_capability_key(it.get("fields") or {}) for it in backlog_issues], cap_cache)
+
+    for it in backlog_issues:
         key = it.get("key", "")
         f = it.get("fields") or {}
-        if not _is_feature_type(f):
-            continue
-        if _status_category_key(f) == "done":
-            continue
 
         cap_key = _extract_capability_key(f)
-        cap_meta = _get_issue_meta(cap_key, cap_cache) if cap_key else {"summary": "", "leading_work_group": "", "created": "", "priority": ""}
+        cap_meta = _get_issue_meta(cap_key, cap_cache) if cap_key else _empty_issue_meta()
         features[key] = {
             "summary": f.get("summary", "") or "",
             "status": ((f.get("status") or {}).get("name") or ""),
@@ -1541,23 +4295,8 @@ def backlog_data_service(work_group: str, force_refresh: bool = False) -> dict:
     # Attach child Story/Fault Report estimation sums to seeded features.
     # Use a separate child query to avoid scan-all on backlog seed set.
     if features:
-        child_fields = [
-            "summary",
-            "issuetype",
-            "customfield_10708",  # Story Points
-            "customfield_10702",  # Epic Link
-            "parent",
-            "issuelinks",
-            "status",
-            "assignee",
-        ]
-        child_jql = f'"Leading Work Group" = "{work_group}" AND updated >= -365d ORDER BY updated DESC'
-        child_cache_key = ("backlog_child_issues_v2", work_group)
-        child_issues = _cache_get_or_build(
-            child_cache_key,
-            lambda: _jira_search_all(child_jql, child_fields, page_size=500, hard_cap=40000),
-            force_refresh=force_refresh,
-        )
+        # the store was refreshed just above if asked to
+        child_issues = _backlog_child_issues(work_group)
 
         feature_keys = set(features.keys())
         for it in (child_issues or []):
@@ -1588,15 +4327,7 @@ def capabilities_data_service(work_group: str, force_refresh: bool = False) -> l
     """
     Return all Capability issues for selected WG, including capabilities without linked features.
     """
-    fields_needed = ["summary", "issuetype", "status", "customfield_14400", "created", "priority"]
-    jql = f'"Leading Work Group" = "{work_group}" AND issuetype = Capability ORDER BY key ASC'
-
-    cache_key = ("capability_issues_v3", work_group)
-    issues = _cache_get_or_build(
-        cache_key,
-        lambda: _jira_search_all(jql, fields_needed, page_size=500, hard_cap=10000),
-        force_refresh=force_refresh,
-    )
+    issues = _capability_issues(work_group, force_refresh=force_refresh)
 
     out = []
     for it in issues or []:
@@ -1683,13 +4414,18 @@ def capabilities_data():
     return jsonify(capabilities_data_service(work_group, force_refresh=force_refresh))
 
 
+@app.route("/cache_stats")
+def cache_stats():
+    return jsonify({"ok": True, "cache": _cache_stats()})
+
+
 @app.route("/jira_user_search")
 def jira_user_search():
     query_text = (request.args.get("q") or "").strip()
     if len(query_text) < 2:
         return jsonify({"ok": True, "users": []})
     try:
-        users = _jira_user_search(query_text, max_results=20)
+        users = _user_autocomplete(query_text, max_results=20)
         return jsonify({"ok": True, "users": users})
     except Exception as e:
         return jsonify({"ok": False, "error": str(e), "users": []}), 502
@@ -1781,6 +4517,7 @@ def team_capacity_data():
     store = _load_team_capacity_store()
     store[_team_capacity_key(work_group, fix_version)] = payload
     _save_team_capacity_store(store)
+    _user_directory_add(normalized)
 
     return jsonify({"ok": True, "data": payload})
 
@@ -2148,7 +4885,7 @@ def search_project_fault_reports(keywords: str, work_group: str | None = None, f
     cache_key = ("project_fault_reports", keywords, work_group or "")
     issues = _cache_get_or_build(
         cache_key,
-        lambda: _jira_search_all(jql, ["summary", "status", "fixVersions", "labels"], page_size=200),
+        lambda: _jira_search_compact(jql, PROJECT_FR_FIELDS, page_size=200),
         force_refresh=force_refresh,
     )
     out = []
@@ -2204,60 +4941,18 @@ def update_fix_versions():
     if overlap:
         return jsonify({"ok": False, "error": f"Same version in add and remove: {', '.join(overlap)}"}), 400
 
+    requested = {"add": sorted(add_set), "remove": sorted(remove_set)}
     try:
-        before = _jira_get_issue_fix_versions(issue_key)
-    except Exception as e:
-        return jsonify({"ok": False, "error": str(e)}), 502
-
-    try:
-        project_key = _jira_get_issue_project_key(issue_key)
-        valid_versions = set(_jira_get_project_version_names(project_key))
-        invalid_add = sorted([v for v in add_set if v not in valid_versions])
-        if invalid_add:
-            valid_versions = set(_jira_get_project_version_names(project_key, force_refresh=True))
-            invalid_add = sorted([v for v in add_set if v not in valid_versions])
-        if invalid_add:
-            valid_qs = sorted([v for v in valid_versions if re.match(r"^QS_\d{2}w\d{2}$", v)])
-            return jsonify({
-                "ok": False,
-                "error": f"Invalid Fix Version(s) for project {project_key}: {', '.join(invalid_add)}",
-                "projectKey": project_key,
-                "invalid": invalid_add,
-                "validQsVersions": valid_qs,
-                "issueKey": issue_key,
-                "before": before,
-            }), 400
+        result = _jira_apply_issue_changes(issue_key, {"fixVersions": requested}, dry_run=dry_run)
     except Exception as e:
-        return jsonify({"ok": False, "error": str(e), "issueKey": issue_key, "before": before}), 502
+        return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
 
+    if not result.get("ok"):
+        return jsonify(dict(result, before=result["before"]["fixVersions"])), 400
     if dry_run:
-        after_set = set(before)
-        after_set |= add_set
-        after_set -= remove_set
-        after = sorted(after_set)
-        return jsonify({
-            "ok": True,
-            "dryRun": True,
-            "issueKey": issue_key,
-            "before": before,
-            "requested": {"add": sorted(add_set), "remove": sorted(remove_set)},
-            "afterPreview": after,
-        })
-
-    try:
-        payload = _jira_update_issue_fix_versions(issue_key, sorted(add_set), sorted(remove_set))
-        after = _jira_get_issue_fix_versions(issue_key)
-        return jsonify({
-            "ok": True,
-            "dryRun": False,
-            "issueKey": issue_key,
-            "before": before,
-            "after": after,
-            "applied": {"add": sorted(add_set), "remove": sorted(remove_set)},
-            "payload": payload,
-        })
-    except Exception as e:
-        return jsonify({"ok": False, "error": str(e), "issueKey": issue_key, "before": before}), 502
+        return _single_field_response(result, "fixVersions", requested=requested,
+                                      afterPreview=result["afterPreview"]["fixVersions"])
+    return _single_field_response(result, "fixVersions", applied=requested)
 
 
 @app.route("/update_priority", methods=["POST"])
@@ -2280,42 +4975,10 @@ def update_priority():
         return jsonify({"ok": False, "error": "priority must be in range 1..10"}), 400
 
     try:
-        before_issue = requests.get(f"{JIRA_ISSUE}/{issue_key}", headers=HEADERS, params={"fields": "priority"})
-        if before_issue.status_code != 200:
-            raise RuntimeError(f"Failed to read issue {issue_key}: {before_issue.status_code} {before_issue.text}")
-        before_priority = (((before_issue.json().get("fields") or {}).get("priority") or {}).get("name") or "")
-
-        priority_id, priority_name = _resolve_priority_id_from_number(priority_number)
-
-        if dry_run:
-            return jsonify({
-                "ok": True,
-                "dryRun": True,
-                "issueKey": issue_key,
-                "before": before_priority,
-                "requested": priority_number,
-                "resolved": {"id": priority_id, "name": priority_name},
-            })
-
-        payload = _jira_update_issue_priority(issue_key, priority_id)
-
-        after_issue = requests.get(f"{JIRA_ISSUE}/{issue_key}", headers=HEADERS, params={"fields": "priority"})
-        if after_issue.status_code != 200:
-            raise RuntimeError(f"Failed to read updated issue {issue_key}: {after_issue.status_code} {after_issue.text}")
-        after_priority = (((after_issue.json().get("fields") or {}).get("priority") or {}).get("name") or "")
-
-        return jsonify({
-            "ok": True,
-            "dryRun": False,
-            "issueKey": issue_key,
-            "before": before_priority,
-            "after": after_priority,
-            "requested": priority_number,
-            "resolved": {"id": priority_id, "name": priority_name},
-            "payload": payload,
-        })
+        result = _jira_apply_issue_changes(issue_key, {"priority": priority_number}, dry_run=dry_run)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
+    return _single_field_response(result, "priority", requested=priority_number, resolved=result["resolved"]["priority"])
 
 
 @app.route("/update_estimation", methods=["POST"])
@@ -2335,31 +4998,10 @@ def update_estimation():
         return jsonify({"ok": False, "error": "estimation must be an integer"}), 400
 
     try:
-        before_estimation = _jira_get_issue_estimation(issue_key)
-
-        if dry_run:
-            return jsonify({
-                "ok": True,
-                "dryRun": True,
-                "issueKey": issue_key,
-                "before": before_estimation,
-                "requested": estimation_value,
-            })
-
-        payload = _jira_update_issue_estimation(issue_key, estimation_value)
-        after_estimation = _jira_get_issue_estimation(issue_key)
-
-        return jsonify({
-            "ok": True,
-            "dryRun": False,
-            "issueKey": issue_key,
-            "before": before_estimation,
-            "after": after_estimation,
-            "requested": estimation_value,
-            "payload": payload,
-        })
+        result = _jira_apply_issue_changes(issue_key, {"estimation": estimation_value}, dry_run=dry_run)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
+    return _single_field_response(result, "estimation", requested=estimation_value)
 
 
 @app.route("/update_assignee", methods=["POST"])
@@ -2377,35 +5019,12 @@ def update_assignee():
     if not account_id and not display_name and not email_address:
         return jsonify({"ok": False, "error": "accountId or displayName/emailAddress is required"}), 400
 
+    requested = {"accountId": account_id, "displayName": display_name, "emailAddress": email_address}
     try:
-        before_assignee = _jira_get_issue_assignee(issue_key)
-        resolved_identity = _resolve_user_identity(account_id, display_name, email_address)
-
-        if dry_run:
-            return jsonify({
-                "ok": True,
-                "dryRun": True,
-                "issueKey": issue_key,
-                "before": before_assignee,
-                "requested": {"accountId": account_id, "displayName": display_name, "emailAddress": email_address},
-                "resolved": resolved_identity,
-            })
-
-        payload = _jira_update_issue_assignee(issue_key, resolved_identity)
-        after_assignee = _jira_get_issue_assignee(issue_key)
-
-        return jsonify({
-            "ok": True,
-            "dryRun": False,
-            "issueKey": issue_key,
-            "before": before_assignee,
-            "after": after_assignee,
-            "requested": {"accountId": account_id, "displayName": display_name, "emailAddress": email_address},
-            "resolved": resolved_identity,
-            "payload": payload,
-        })
+        result = _jira_apply_issue_changes(issue_key, {"assignee": requested}, dry_run=dry_run)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
+    return _single_field_response(result, "assignee", requested=requested, resolved=result["resolved"]["assignee"])
 
 
 @app.route("/update_pi_scope", methods=["POST"])
@@ -2420,43 +5039,170 @@ def update_pi_scope():
         return jsonify({"ok": False, "error": "Invalid issueKey format"}), 400
 
     try:
-        before_scope = _jira_get_issue_pi_scope(issue_key)
-
-        normalized = raw_scope.lower()
-        if not normalized or normalized == "none":
-            requested_scope = ""
-        elif normalized == "committed":
-            requested_scope = "Committed"
-        elif normalized == "stretch":
-            requested_scope = "Stretch"
-        elif normalized in ("not included", "notincluded"):
-            requested_scope = "Not Included"
-        else:
-            return jsonify({"ok": False, "error": "piScope must be one of: None, Committed, Stretch, Not Included"}), 400
+        requested_scope = _normalize_pi_scope(raw_scope)
+    except RuntimeError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
 
-        if dry_run:
-            return jsonify({
-                "ok": True,
-                "dryRun": True,
-                "issueKey": issue_key,
-                "before": before_scope,
-                "requested": requested_scope,
-            })
+    try:
+        result = _jira_apply_issue_changes(issue_key, {"piScope": requested_scope}, dry_run=dry_run)
+    except Exception as e:
+        return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
+    return _single_field_response(result, "piScope", requested=requested_scope)
 
-        payload = _jira_update_issue_pi_scope(issue_key, requested_scope)
-        after_scope = _jira_get_issue_pi_scope(issue_key)
 
-        return jsonify({
-            "ok": True,
-            "dryRun": False,
-            "issueKey": issue_key,
-            "before": before_scope,
-            "after": after_scope,
-            "requested": requested_scope,
-            "payload": payload,
-        })
+@app.route("/update_issue", methods=["POST"])
+def update_issue():
+    """Change several fields of one issue in a single Jira write.
+
+    Takes the update_* body keys together (addFixVersions/removeFixVersions, priority, estimation,
+    accountId/displayName/emailAddress, piScope). `verify` (default true) reads the fields back afterwards;
+    with false the response reports the values that were written.
+    """
+    data = request.get_json(silent=True) or {}
+    dry_run = bool(data.get("dryRun", True))
+    verify = bool(data.get("verify", True))
+
+    order, merged, errors = _merge_bulk_changes([data])
+    issue_key = order[0]
+    if issue_key in errors:
+        return jsonify({"ok": False, "error": errors[issue_key], "issueKey": issue_key}), 400
+
+    try:
+        result = _jira_apply_issue_changes(issue_key, merged[issue_key], dry_run=dry_run, verify=verify)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
+    return jsonify(result), (200 if result.get("ok") else 400)
+
+
+@app.route("/bulk_update", methods=["POST"])
+def bulk_update():
+    """Apply a batch of field changes: {"dryRun", "verify", "async", "changes": [{"issueKey", ...update_* body keys}]}."""
+    data = request.get_json(silent=True) or {}
+
+    entries = data.get("changes")
+    dry_run = bool(data.get("dryRun", True))
+    verify = bool(data.get("verify", True))
+    if not isinstance(entries, list) or not entries:
+        return jsonify({"ok": False, "error": "changes must be a non-empty array"}), 400
+
+    order, merged, errors = _merge_bulk_changes(entries)
+    results = {k: {"ok": False, "dryRun": dry_run, "issueKey": k, "error": err} for k, err in errors.items()}
+    results.update(_bulk_fix_version_failures({k: v for k, v in merged.items() if k not in results}, dry_run))
+
+    # cached views are patched once per cache key for the whole batch, not once per issue
+    cache_writes = []
+
+    def _apply(issue_key):
+        try:
+            return _jira_apply_issue_changes(
+                issue_key, merged[issue_key], dry_run=dry_run, verify=verify, versions_checked=True,
+                cache_writes=cache_writes,
+            )
+        except Exception as e:
+            return {"ok": False, "dryRun": dry_run, "issueKey": issue_key, "error": str(e)}
+
+    def _sync_caches():
+        batch = cache_writes[:]
+        # writes appended meanwhile (a retry still running) stay for the next flush
+        del cache_writes[:len(batch)]
+        _sync_caches_after_writes(batch)
+
+    pending = [k for k in order if k not in results]
+    if data.get("async"):
+        runners = {k: (lambda k=k: _apply(k)) for k in pending}
+        job = _job_create("bulk_update", dry_run, order, runners, results, on_finish=_sync_caches)
+        return jsonify({"ok": True, "async": True, "jobId": job["id"], "statusUrl": f"/jobs/{job['id']}"}), 202
+
+    if pending:
+        workers = max(1, min(BULK_UPDATE_WORKERS, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-update") as pool:
+            for issue_key, result in zip(pending, pool.map(_apply, pending)):
+                results[issue_key] = result
+        _sync_caches()
+
+    ordered = [results[k] for k in order]
+    failed = sum(1 for r in ordered if not r.get("ok"))
+    return jsonify({
+        "ok": failed == 0,
+        "dryRun": dry_run,
+        "total": len(ordered),
+        "succeeded": len(ordered) - failed,
+        "failed": failed,
+        "results": ordered,
+    })
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+    if job is None:
+        return jsonify({"ok": False, "error": f"Unknown job {job_id}"}), 404
+    return jsonify(_job_status(job))
+
+
+@app.route("/jobs/<job_id>/retry", methods=["POST"])
+def job_retry(job_id):
+    with _JOBS_LOCK:
+        job = _JOBS.get(job_id)
+    if job is None:
+        return jsonify({"ok": False, "error": f"Unknown job {job_id}"}), 404
+    retried = _job_submit(job)
+    if not retried:
+        return jsonify({"ok": False, "error": "No failed items to retry", "jobId": job_id}), 400
+    return jsonify(dict(_job_status(job), retried=retried)), 202
+
+
+@app.route("/bulk_update_sprints", methods=["POST"])
+def bulk_update_sprints():
+    """Move many stories at once: {"dryRun", "workGroup", "fixVersion", "moves": [{"issueKey", "targetSprint"}]}."""
+    data = request.get_json(silent=True) or {}
+
+    entries = data.get("moves")
+    dry_run = bool(data.get("dryRun", True))
+    work_group = str(data.get("workGroup") or "").strip()
+    fix_version = str(data.get("fixVersion") or "").strip()
+    if not isinstance(entries, list) or not entries:
+        return jsonify({"ok": False, "error": "moves must be a non-empty array"}), 400
+
+    order, moves, results = [], {}, {}
+    for entry in entries:
+        entry = entry if isinstance(entry, dict) else {}
+        issue_key = str(entry.get("issueKey") or "").strip().upper()
+        target_sprint = str(entry.get("targetSprint") or "").strip()
+        if issue_key not in moves and issue_key not in results:
+            order.append(issue_key)
+        results.pop(issue_key, None)
+        moves.pop(issue_key, None)
+
+        canonical_target = _canonicalize_sprint_name(target_sprint)
+        if not re.fullmatch(r"[A-Z][A-Z0-9]+-\d+", issue_key):
+            results[issue_key] = {"ok": False, "dryRun": dry_run, "issueKey": issue_key, "error": "Invalid issueKey format"}
+        elif target_sprint.lower() in {"no sprint", "none", "unscheduled"}:
+            moves[issue_key] = "No Sprint"
+        elif canonical_target:
+            moves[issue_key] = canonical_target
+        else:
+            results[issue_key] = {"ok": False, "dryRun": dry_run, "issueKey": issue_key,
+                                  "error": "targetSprint must be Sprint 1..N or No Sprint"}
+
+    if moves:
+        try:
+            results.update(_jira_move_sprints(moves, work_group=work_group, fix_version=fix_version, dry_run=dry_run))
+        except Exception as e:
+            for issue_key in moves:
+                results[issue_key] = {"ok": False, "dryRun": dry_run, "issueKey": issue_key, "error": str(e)}
+
+    ordered = [results[k] for k in order]
+    failed = sum(1 for r in ordered if not r.get("ok"))
+    return jsonify({
+        "ok": failed == 0,
+        "dryRun": dry_run,
+        "total": len(ordered),
+        "succeeded": len(ordered) - failed,
+        "failed": failed,
+        "results": ordered,
+    })
 
 
 @app.route("/update_story_sprint", methods=["POST"])
@@ -2503,10 +5249,12 @@ def update_story_sprint():
                 target_id = _jira_find_sprint_id_by_name(canonical_target, work_group=work_group, fix_version=fix_version)
             if target_id is None:
                 raise RuntimeError(f"Sprint id not found for '{canonical_target}'")
-            payload = _jira_move_issue_to_sprint(issue_key, target_id)
+            payload = _jira_move_issues_to_sprint([issue_key], target_id)
 
-        after_refs = _jira_get_issue_sprint_refs(issue_key)
-        after_canonical = sorted({str(ref.get("canonical") or "") for ref in after_refs if ref.get("canonical")})
+        # the raw field keeps boardId and dates, which the parsed refs drop
+        after_raw = _jira_read_issue_fields(issue_key, ["customfield_10701"]).get("customfield_10701")
+        after_canonical = _sprint_canonicals(_extract_sprint_refs(after_raw))
+        _sync_caches_after_write(issue_key, {"customfield_10701": _compact_sprints(after_raw)})
 
         return jsonify({
             "ok": True,
@@ -2534,9 +5282,8 @@ def feature_details():
 
         def _build():
             issue_url = f"{JIRA_ISSUE}/{issue_key}"
-            issue_resp = requests.get(
+            issue_resp = JIRA_HTTP.get(
                 issue_url,
-                headers=HEADERS,
                 params={
                     "fields": ",".join([
                         "summary",
@@ -2554,11 +5301,13 @@ def feature_details():
             fields = (issue_resp.json().get("fields") or {})
 
             stories_jql = f'"Epic Link" = "{issue_key}"'
-            story_issues = _jira_search_all(stories_jql, ["customfield_10708", "summary"], page_size=200, hard_cap=5000)
             stories_estimation = 0.0
-            for st in story_issues or []:
-                st_fields = st.get("fields") or {}
-                stories_estimation += _story_points(st_fields)
+            stories_count = 0
+            for page in _jira_search_pages(stories_jql, ["customfield_10708"], page_size=200, hard_cap=5000):
+                stories_count += len(page)
+                for st in page:
+                    st_fields = st.get("fields") or {}
+                    stories_estimation += _story_points(st_fields)
 
             feature_estimation = _story_points(fields)
 
@@ -2572,13 +5321,120 @@ def feature_details():
                 "reporter": _reporter_name(fields),
                 "feature_estimation": feature_estimation,
                 "stories_estimation": stories_estimation,
-                "stories_count": len(story_issues or []),
+                "stories_count": stories_count,
             }
 
         return jsonify(_cache_get_or_build(cache_key, _build, force_refresh=force_refresh))
     except Exception as e:
         return jsonify({"ok": False, "error": str(e), "issueKey": issue_key}), 502
 
+# ---------------- Cache warm-up ----------------
+
+def _warm_up_jobs(settings: dict, force_refresh: bool) -> list[tuple[str, object]]:
+    jobs = []
+    fix_versions = settings.get("fix_versions") or []
+    for row in settings.get("work_groups") or []:
+        wg = row.get("leadingWorkGroup") or ""
+        if not wg:
+            continue
+        jobs.append((f"backlog {wg}", lambda wg=wg: backlog_data_service(wg, force_refresh=force_refresh)))
+        jobs.append((f"capabilities {wg}", lambda wg=wg: capabilities_data_service(wg, force_refresh=force_refresh)))
+        for fv in fix_versions:
+            jobs.append((f"pi_planning {fv} {wg}", lambda fv=fv, wg=wg: get_pi_planning(fv, wg, force_refresh=force_refresh)))
+            jobs.append((f"fr_list {fv} {wg}", lambda fv=fv, wg=wg: fr_list_issues(fv, wg, force_refresh=force_refresh)))
+    return jobs
+
+
+def _warm_up_stores(settings: dict, workers: int):
+    """Refresh each configured work group's issue source once: its mirror when enabled, else its cached store."""
+    work_groups = list(dict.fromkeys(row.get("leadingWorkGroup") or "" for row in settings.get("work_groups") or []))
+
+    def _refresh(wg):
+        if _mirror_enabled():
+            _mirror_sync(wg, settings.get("fix_versions") or [])
+        else:
+            _work_group_issues(wg, force_refresh=True)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="warm-up") as pool:
+        futures = {pool.submit(_refresh, wg): wg for wg in work_groups if wg}
+        for fut in as_completed(futures):
+            try:
+                fut.result()
+            except Exception as e:
+                print(f"[WarmUp] refresh of WG='{futures[fut]}' failed: {e}")
+
+
+def _warm_up_views(force_refresh: bool = False, workers: int = CACHE_WARMUP_WORKERS) -> dict:
+    """
+    Build every configured fix version x work group view (PI planning, backlog, capabilities, FR list)
+    with at most `workers` running at once, printing each one as it lands. The views are slices of one
+    issue source per work group, so a forced warm-up (and any warm-up with the issue mirror enabled)
+    refreshes each of those once up front and then builds the views from it without forcing again.
+    """
+    settings = _load_app_settings()
+    started = time.time()
+    if force_refresh or _mirror_enabled():
+        _warm_up_stores(settings, workers)
+
+    jobs = _warm_up_jobs(settings, force_refresh=False)
+    print(f"[WarmUp] {len(jobs)} views, {max(1, workers)} at a time")
+
+    def _timed(job):
+        t0 = time.time()
+        job()
+        return time.time() - t0
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="warm-up") as pool:
+        futures = {pool.submit(_timed, job): name for name, job in jobs}
+        for done, fut in enumerate(as_completed(futures), start=1):
+            name = futures[fut]
+            try:
+                print(f"[WarmUp] {done}/{len(jobs)} {name}: {fut.result():.1f}s")
+            except Exception as e:
+                failed.append(name)
+                print(f"[WarmUp] {done}/{len(jobs)} {name}: failed: {e}")
+    elapsed = time.time() - started
+    print(f"[WarmUp] done: {len(jobs) - len(failed)}/{len(jobs)} views in {elapsed:.1f}s")
+    return {"views": len(jobs), "failed": failed, "seconds": round(elapsed, 1)}
+
+
+def _start_cache_rewarmer(interval_seconds: int = CACHE_REWARM_SECONDS):
+    """
+    Rebuild the warm-up views from a daemon thread every interval (readers keep the old copy until each
+    one lands). With the shared cache, a marker entry in it makes one worker per interval do the work.
+    """
+    if interval_seconds <= 0:
+        return
+    marker = ("cache_rewarm",)
+
+    def _due() -> bool:
+        if not _shared_cache_enabled():
+            return True
+        if not _shared_cache_try_lease(marker):
+            return False
+        try:
+            if _shared_cache_load(marker) is not None:
+                return False
+            now = time.time()
+            # half an interval, so the next tick of whichever worker gets there first finds it expired
+            _shared_cache_put(marker, {"started": now}, now, now + interval_seconds / 2)
+            return True
+        finally:
+            _shared_cache_release_lease(marker)
+
+    def _loop():
+        while True:
+            time.sleep(interval_seconds)
+            try:
+                if _due():
+                    _warm_up_views(force_refresh=True)
+            except Exception as e:
+                print(f"[WarmUp] scheduled re-warm failed: {e}")
+
+    threading.Thread(target=_loop, name="cache-rewarm", daemon=True).start()
+
+
 # ---------------- Main ----------------
 
 if __name__ == "__main__":
@@ -2586,5 +5442,25 @@ if __name__ == "__main__":
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host IP to bind (default: 0.0.0.0)")
     parser.add_argument("--port", type=int, default=80, help="Port to bind (default: 80)")
     parser.add_argument("--debug", action="store_true", help="Enable Flask debug mode")
+    parser.add_argument("--warm-up", action="store_true",
+                        help="Pre-build every configured fix version x work group view in the background at startup")
+    parser.add_argument("--warm-up-only", action="store_true",
+                        help="Re-pull every configured view into the cache (snapshot / shared cache / mirror) and exit")
+    parser.add_argument("--warm-up-workers", type=int, default=CACHE_WARMUP_WORKERS,
+                        help=f"Views built concurrently during warm-up (default: {CACHE_WARMUP_WORKERS})")
     args = parser.parse_args()
+    if args.warm_up_only:
+        # the snapshot is written again at exit, so the next server start begins warm
+        _start_cache_snapshotter()
+        summary = _warm_up_views(force_refresh=True, workers=args.warm_up_workers)
+        raise SystemExit(1 if summary["failed"] else 0)
+    # With the debug reloader only the serving child process owns the cache.
+    if (not args.debug) or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        _start_cache_snapshotter()
+        _start_mirror_sync()
+        _start_cache_rewarmer()
+        if args.warm_up:
+            # requests arriving meanwhile join the builds already running instead of starting their own
+            threading.Thread(target=_warm_up_views, kwargs={"workers": args.warm_up_workers},
+                             name="cache-warm-up", daemon=True).start()
     app.run(host=args.host, port=args.port, debug=args.debug)
@@ -1151,6 +1151,31 @@ function simplifyPushError(rawError) {
   return text;
 }
 
+// Runs /bulk_update as a server-side job and polls it, so a long push is not tied to one HTTP request.
+// Gives up polling after timeoutMs; the job itself keeps running on the server.
+async function runBulkUpdateJob(changes, pollMs = 1000, timeoutMs = 10 * 60 * 1000) {
+  const resp = await fetch("/bulk_update", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ changes, dryRun: false, async: true }),
+  });
+  const started = await resp.json().catch(() => ({}));
+  if (!resp.ok || !started?.statusUrl) return { error: started?.error || `HTTP ${resp.status}` };
+
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, pollMs));
+    const statusResp = await fetch(started.statusUrl, { cache: "no-store" });
+    const status = await statusResp.json().catch(() => ({}));
+    if (!statusResp.ok) return { error: status?.error || `HTTP ${statusResp.status}` };
+    if (status.status === "finished") return status;
+  }
+  return {
+    error: `Timed out after ${Math.round(timeoutMs / 1000)}s waiting for Jira update job ${started.jobId}; `
+      + `it may still finish, check ${started.statusUrl}`,
+  };
+}
+
 async function pushRoadmapMovesToJira() {
   const host = document.getElementById("backlog-roadmap");
   if (!host || !host._roadmapData) return;
@@ -1168,6 +1193,9 @@ async function pushRoadmapMovesToJira() {
     const succeeded = [];
     const partial = [];
 
+    // Collect every field change first; the server merges them per issue and writes issues concurrently.
+    const plans = [];
+    const changes = [];
     for (const [featureId, move] of entries) {
       const feature = host._roadmapData?.[featureId];
       if (!feature) {
@@ -1194,9 +1222,37 @@ async function pushRoadmapMovesToJira() {
         continue;
       }
 
-      const fieldMessages = [];
-      let hasFieldFailure = false;
-      let hasFieldSuccess = false;
+      const clearFix = () => {
+        currentPending.fixDirty = false;
+        currentPending.toFuture = false;
+        currentPending.targetFixVersion = "";
+      };
+      const clearPriority = () => {
+        currentPending.priorityDirty = false;
+        delete currentPending.targetPriority;
+      };
+      const clearEstimation = () => {
+        currentPending.estimationDirty = false;
+        delete currentPending.targetEstimation;
+      };
+      const clearAssignee = () => {
+        currentPending.assigneeDirty = false;
+        delete currentPending.targetAssigneeAccountId;
+        delete currentPending.targetAssigneeName;
+        delete currentPending.targetAssigneeEmail;
+      };
+      const clearPiScope = () => {
+        currentPending.piScopeDirty = false;
+        delete currentPending.targetPiScope;
+      };
+
+      const plan = { featureId, currentPending, fieldMessages: [], hasFieldSuccess: false, updates: [] };
+      const change = { issueKey: featureId };
+      const noUpdate = (label, clear) => {
+        clear();
+        plan.fieldMessages.push(`- ${label}: No update needed`);
+        plan.hasFieldSuccess = true;
+      };
 
       if (fixDirty) {
         const currentQs = parseQsFixVersionLatest(feature?.fixVersions || [], feature?.archived_fixVersions || [])?.raw || "";
@@ -1208,64 +1264,21 @@ async function pushRoadmapMovesToJira() {
           : ((currentQs && currentQs !== targetFixVersion) ? [currentQs] : []);
 
         if (!addFixVersions.length && !removeFixVersions.length) {
-          currentPending.fixDirty = false;
-          currentPending.toFuture = false;
-          currentPending.targetFixVersion = "";
-          fieldMessages.push("- Fix Version: No update needed");
-          hasFieldSuccess = true;
+          noUpdate("Fix Version", clearFix);
         } else {
-          const resp = await fetch("/update_fix_versions", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              issueKey: featureId,
-              addFixVersions,
-              removeFixVersions,
-              dryRun: false,
-            }),
-          });
-          const json = await resp.json().catch(() => ({}));
-          if (!resp.ok || !json?.ok) {
-            fieldMessages.push(`- Fix Version: Failed - ${simplifyPushError(json?.error || `HTTP ${resp.status}`)}`);
-            hasFieldFailure = true;
-          } else {
-            currentPending.fixDirty = false;
-            currentPending.toFuture = false;
-            currentPending.targetFixVersion = "";
-            fieldMessages.push("- Fix Version: Success");
-            hasFieldSuccess = true;
-          }
+          change.addFixVersions = addFixVersions;
+          change.removeFixVersions = removeFixVersions;
+          plan.updates.push({ label: "Fix Version", clear: clearFix });
         }
       }
 
       if (priorityDirty) {
         const currentPriority = roadmapPriorityNumber(feature?.priority);
-        const priorityNeedsUpdate = targetPriority !== null && targetPriority !== currentPriority;
-        if (!priorityNeedsUpdate) {
-          currentPending.priorityDirty = false;
-          delete currentPending.targetPriority;
-          fieldMessages.push("- Priority: No update needed");
-          hasFieldSuccess = true;
+        if (targetPriority === null || targetPriority === currentPriority) {
+          noUpdate("Priority", clearPriority);
         } else {
-          const resp = await fetch("/update_priority", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              issueKey: featureId,
-              priority: targetPriority,
-              dryRun: false,
-            }),
-          });
-          const json = await resp.json().catch(() => ({}));
-          if (!resp.ok || !json?.ok) {
-            fieldMessages.push(`- Priority: Failed - ${simplifyPushError(json?.error || `HTTP ${resp.status}`)}`);
-            hasFieldFailure = true;
-          } else {
-            currentPending.priorityDirty = false;
-            delete currentPending.targetPriority;
-            fieldMessages.push("- Priority: Success");
-            hasFieldSuccess = true;
-          }
+          change.priority = targetPriority;
+          plan.updates.push({ label: "Priority", clear: clearPriority });
         }
       }
 
@@ -1273,101 +1286,74 @@ async function pushRoadmapMovesToJira() {
         const currentEstimation = Number.isFinite(Number(feature?.story_points))
           ? Number.parseInt(String(feature.story_points), 10)
           : 0;
-        const estimationNeedsUpdate = targetEstimation !== null && targetEstimation !== currentEstimation;
-        if (!estimationNeedsUpdate) {
-          currentPending.estimationDirty = false;
-          delete currentPending.targetEstimation;
-          fieldMessages.push("- Estimation: No update needed");
-          hasFieldSuccess = true;
+        if (targetEstimation === null || targetEstimation === currentEstimation) {
+          noUpdate("Estimation", clearEstimation);
         } else {
-          const resp = await fetch("/update_estimation", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              issueKey: featureId,
-              estimation: targetEstimation,
-              dryRun: false,
-            }),
-          });
-          const json = await resp.json().catch(() => ({}));
-          if (!resp.ok || !json?.ok) {
-            fieldMessages.push(`- Estimation: Failed - ${simplifyPushError(json?.error || `HTTP ${resp.status}`)}`);
-            hasFieldFailure = true;
-          } else {
-            currentPending.estimationDirty = false;
-            delete currentPending.targetEstimation;
-            fieldMessages.push("- Estimation: Success");
-            hasFieldSuccess = true;
-          }
+          change.estimation = targetEstimation;
+          plan.updates.push({ label: "Estimation", clear: clearEstimation });
         }
       }
 
       if (assigneeDirty) {
         const currentAssigneeName = String(feature?.assignee || "").trim();
-        const assigneeNeedsUpdate = !!targetAssigneeName && targetAssigneeName.toLowerCase() !== currentAssigneeName.toLowerCase();
-        if (!assigneeNeedsUpdate) {
-          currentPending.assigneeDirty = false;
-          delete currentPending.targetAssigneeAccountId;
-          delete currentPending.targetAssigneeName;
-          delete currentPending.targetAssigneeEmail;
-          fieldMessages.push("- Assignee: No update needed");
-          hasFieldSuccess = true;
+        if (!targetAssigneeName || targetAssigneeName.toLowerCase() === currentAssigneeName.toLowerCase()) {
+          noUpdate("Assignee", clearAssignee);
         } else {
-          const resp = await fetch("/update_assignee", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              issueKey: featureId,
-              accountId: targetAssigneeAccountId,
-              displayName: targetAssigneeName,
-              emailAddress: targetAssigneeEmail,
-              dryRun: false,
-            }),
-          });
-          const json = await resp.json().catch(() => ({}));
-          if (!resp.ok || !json?.ok) {
-            fieldMessages.push(`- Assignee: Failed - ${simplifyPushError(json?.error || `HTTP ${resp.status}`)}`);
-            hasFieldFailure = true;
-          } else {
-            currentPending.assigneeDirty = false;
-            delete currentPending.targetAssigneeAccountId;
-            delete currentPending.targetAssigneeName;
-            delete currentPending.targetAssigneeEmail;
-            fieldMessages.push("- Assignee: Success");
-            hasFieldSuccess = true;
-          }
+          change.accountId = targetAssigneeAccountId;
+          change.displayName = targetAssigneeName;
+          change.emailAddress = targetAssigneeEmail;
+          plan.updates.push({ label: "Assignee", clear: clearAssignee });
         }
       }
 
       if (piScopeDirty) {
         const currentScope = normalizePiScopeValue(feature?.pi_scope);
-        const scopeNeedsUpdate = targetPiScope !== currentScope;
-        if (!scopeNeedsUpdate) {
-          currentPending.piScopeDirty = false;
-          delete currentPending.targetPiScope;
-          fieldMessages.push("- Commitment: No update needed");
-          hasFieldSuccess = true;
+        if (targetPiScope === currentScope) {
+          noUpdate("Commitment", clearPiScope);
         } else {
-          const resp = await fetch("/update_pi_scope", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({
-              issueKey: featureId,
-              piScope: targetPiScope || "None",
-              dryRun: false,
-            }),
-          });
-          const json = await resp.json().catch(() => ({}));
-          if (!resp.ok || !json?.ok) {
-            fieldMessages.push(`- Commitment: Failed - ${simplifyPushError(json?.error || `HTTP ${resp.status}`)}`);
+          change.piScope = targetPiScope || "None";
+          plan.updates.push({ label: "Commitment", clear: clearPiScope });
+        }
+      }
+
+      if (plan.updates.length) changes.push(change);
+      plans.push(plan);
+    }
+
+    const resultsByKey = new Map();
+    let batchError = "";
+    if (changes.length) {
+      try {
+        const json = await runBulkUpdateJob(changes);
+        if (!Array.isArray(json?.results)) {
+          batchError = json?.error || "Bulk update returned no results";
+        } else {
+          json.results.forEach((r) => resultsByKey.set(String(r?.issueKey || ""), r));
+        }
+      } catch (err) {
+        batchError = String(err?.message || err);
+      }
+    }
+
+    for (const plan of plans) {
+      const { featureId, currentPending, fieldMessages } = plan;
+      let hasFieldSuccess = plan.hasFieldSuccess;
+      let hasFieldFailure = false;
+
+      if (plan.updates.length) {
+        // all fields of one issue go out in a single Jira write, so they succeed or fail together
+        const result = resultsByKey.get(featureId);
+        const error = batchError || (!result ? "No result returned" : (!result.ok ? (result.error || "Update failed") : ""));
+        plan.updates.forEach(({ label, clear }) => {
+          if (error) {
+            fieldMessages.push(`- ${label}: Failed - ${simplifyPushError(error)}`);
             hasFieldFailure = true;
           } else {
-            currentPending.piScopeDirty = false;
-            delete currentPending.targetPiScope;
-            fieldMessages.push("- Commitment: Success");
+            clear();
+            fieldMessages.push(`- ${label}: Success`);
             hasFieldSuccess = true;
           }
-        }
+        });
       }
 
       const stillDirty =
@@ -1408,7 +1394,7 @@ async function pushRoadmapMovesToJira() {
       showRoadmapNotice(`Push to Jira completed. Updated ${succeeded.length} feature(s).`, "success");
     }
 
-    await loadBacklogData(true);
+    await loadBacklogData(true, false);
   } finally {
     hideLoading();
   }
@@ -1574,32 +1560,90 @@ function makeCacheKey(scope, paramsObj) {
 }
 
 function readClientCache(cacheKey) {
+  const entry = readClientCacheEntry(cacheKey);
+  return entry ? entry.data : null;
+}
+
+function readClientCacheEntry(cacheKey) {
   try {
     const raw = localStorage.getItem(cacheKey);
     if (!raw) return null;
     const parsed = JSON.parse(raw);
-    return parsed?.data ?? null;
+    if (parsed?.data == null) return null;
+    return { data: parsed.data, fetchedAt: parsed.fetchedAt ?? parsed.ts ?? null };
   } catch {
     return null;
   }
 }
 
-function writeClientCache(cacheKey, data) {
+function writeClientCache(cacheKey, data, fetchedAt = Date.now()) {
   try {
-    localStorage.setItem(cacheKey, JSON.stringify({ ts: Date.now(), data }));
+    localStorage.setItem(cacheKey, JSON.stringify({ ts: Date.now(), fetchedAt, data }));
   } catch {
     // ignore storage quota or serialization issues
   }
 }
 
+// Age of the Jira data currently on screen: the oldest fetch among the loads of the last few seconds.
+const DATA_AGE_MERGE_MS = 5000;
+let dataAgeState = { fetchedAt: null, refreshing: false, notedAt: 0 };
+let dataAgeTimer = null;
+
+function noteDataAge(fetchedAt, refreshing = false) {
+  if (!Number.isFinite(fetchedAt)) return;
+  const now = Date.now();
+  if (dataAgeState.fetchedAt == null || now - dataAgeState.notedAt > DATA_AGE_MERGE_MS) {
+    dataAgeState = { fetchedAt, refreshing, notedAt: now };
+  } else {
+    dataAgeState = {
+      fetchedAt: Math.min(dataAgeState.fetchedAt, fetchedAt),
+      refreshing: dataAgeState.refreshing || refreshing,
+      notedAt: now,
+    };
+  }
+  renderDataAge();
+  if (!dataAgeTimer) dataAgeTimer = setInterval(renderDataAge, 30000);
+}
+
+function formatDataAge(ms) {
+  const seconds = Math.max(0, Math.round(ms / 1000));
+  if (seconds < 60) return "just now";
+  const minutes = Math.round(seconds / 60);
+  if (minutes < 60) return `${minutes} min ago`;
+  const hours = Math.round(minutes / 60);
+  if (hours < 48) return `${hours} h ago`;
+  return `${Math.round(hours / 24)} days ago`;
+}
+
+function renderDataAge() {
+  if (dataAgeState.fetchedAt == null) return;
+  let el = document.getElementById("data-age-indicator");
+  if (!el) {
+    el = document.createElement("div");
+    el.id = "data-age-indicator";
+    el.className = "data-age-indicator";
+    document.body.appendChild(el);
+  }
+  const age = formatDataAge(Date.now() - dataAgeState.fetchedAt);
+  el.textContent = `Jira data from ${age}${dataAgeState.refreshing ? " \u00b7 refreshing\u2026" : ""}`;
+  el.title = `Fetched from Jira at ${new Date(dataAgeState.fetchedAt).toLocaleString()}`;
+  el.classList.toggle("refreshing", dataAgeState.refreshing);
+}
+
 async function fetchJsonWithClientCache(url, cacheKey, forceRefresh = false) {
   if (!forceRefresh) {
-    const cached = readClientCache(cacheKey);
-    if (cached != null) return cached;
+    const cached = readClientCacheEntry(cacheKey);
+    if (cached) {
+      noteDataAge(cached.fetchedAt);
+      return cached.data;
+    }
   }
   const resp = await fetch(url, { cache: "no-store" });
   const json = await resp.json();
-  writeClientCache(cacheKey, json);
+  const age = Number(resp.headers.get("X-Data-Age"));
+  const fetchedAt = resp.headers.has("X-Data-Age") && Number.isFinite(age) ? Date.now() - age * 1000 : Date.now();
+  noteDataAge(fetchedAt, resp.headers.get("X-Data-Refreshing") === "1");
+  writeClientCache(cacheKey, json, fetchedAt);
   return json;
 }
 
@@ -1944,15 +1988,16 @@ function setupStickyLayoutOffsets() {
 /* ========================
    PI Planning main loader
    ======================== */
-async function loadPIPlanningData(forceRefresh = false) {
+// serverRefresh=false bypasses only the browser cache (e.g. after a push, where the server already patched its copy).
+async function loadPIPlanningData(forceRefresh = false, serverRefresh = forceRefresh) {
   showLoading();
   try {
     const fixVersion = getSelectedFixVersion();
     const workGroup  = getSelectedWorkGroup();
     if (!fixVersion || !workGroup) return;
 
-    const url = `/pi_planning_data?fixVersion=${encodeURIComponent(fixVersion)}&workGroup=${encodeURIComponent(workGroup)}${forceRefresh ? "&forceRefresh=1" : ""}`;
-    const capabilitiesUrl = `/capabilities_data?workGroup=${encodeURIComponent(workGroup)}${forceRefresh ? "&forceRefresh=1" : ""}`;
+    const url = `/pi_planning_data?fixVersion=${encodeURIComponent(fixVersion)}&workGroup=${encodeURIComponent(workGroup)}${serverRefresh ? "&forceRefresh=1" : ""}`;
+    const capabilitiesUrl = `/capabilities_data?workGroup=${encodeURIComponent(workGroup)}${serverRefresh ? "&forceRefresh=1" : ""}`;
     const cacheKey = makeCacheKey("piPlanningDataV2", { fixVersion, workGroup });
     const capabilitiesCacheKey = makeCacheKey("capabilitiesDataV3", { workGroup });
     const [data, capabilities] = await Promise.all([
@@ -4000,14 +4045,15 @@ function renderBacklogRoadmap(featuresObj, capabilitiesList = [], roadmapCapacit
   updateStickyLayoutOffsets();
 }
 
-async function loadBacklogData(forceRefresh = false) {
+// serverRefresh=false bypasses only the browser cache (e.g. after a push, where the server already patched its copy).
+async function loadBacklogData(forceRefresh = false, serverRefresh = forceRefresh) {
   showLoading();
   try {
     const workGroup = getSelectedWorkGroup();
     if (!workGroup) return;
 
-    const url = `/backlog_data?workGroup=${encodeURIComponent(workGroup)}${forceRefresh ? "&forceRefresh=1" : ""}`;
-    const capabilitiesUrl = `/capabilities_data?workGroup=${encodeURIComponent(workGroup)}${forceRefresh ? "&forceRefresh=1" : ""}`;
+    const url = `/backlog_data?workGroup=${encodeURIComponent(workGroup)}${serverRefresh ? "&forceRefresh=1" : ""}`;
+    const capabilitiesUrl = `/capabilities_data?workGroup=${encodeURIComponent(workGroup)}${serverRefresh ? "&forceRefresh=1" : ""}`;
     const cacheKey = makeCacheKey("backlogDataV3", { workGroup });
     const capabilitiesCacheKey = makeCacheKey("capabilitiesDataV3", { workGroup });
     const [data, capabilities, roadmapCapacityByFixVersion] = await Promise.all([
@@ -5540,14 +5586,27 @@ function addTeamCapacityMember(rawUser) {
   scheduleTeamCapacityAutosave();
 }
 
-async function searchTeamCapacityUsers() {
+let teamCapacityUserSearchTimer = null;
+let teamCapacityUserSearchSeq = 0;
+
+// Search-as-you-type: wait for a pause in typing, and ignore answers to queries the user has typed past.
+function scheduleTeamCapacityUserSearch(delayMs = 250) {
+  if (teamCapacityUserSearchTimer) clearTimeout(teamCapacityUserSearchTimer);
+  teamCapacityUserSearchTimer = setTimeout(() => {
+    teamCapacityUserSearchTimer = null;
+    searchTeamCapacityUsers({ quiet: true });
+  }, delayMs);
+}
+
+async function searchTeamCapacityUsers({ quiet = false } = {}) {
   const input = document.getElementById("team-capacity-user-search");
   const host = document.getElementById("team-capacity-search-results");
   if (!input || !host) return;
   const q = String(input.value || "").trim();
+  const seq = ++teamCapacityUserSearchSeq;
   if (q.length < 2) {
     host.innerHTML = "";
-    showTeamCapacityStatus("Type at least 2 characters to search Jira users.", "info");
+    if (!quiet) showTeamCapacityStatus("Type at least 2 characters to search Jira users.", "info");
     return;
   }
 
@@ -5555,6 +5614,7 @@ async function searchTeamCapacityUsers() {
   try {
     const resp = await fetch(`/jira_user_search?q=${encodeURIComponent(q)}`, { cache: "no-store" });
     const json = await resp.json().catch(() => ({}));
+    if (seq !== teamCapacityUserSearchSeq) return;
     if (!resp.ok || !json?.ok) {
       throw new Error(json?.error || `HTTP ${resp.status}`);
     }
@@ -5582,6 +5642,7 @@ async function searchTeamCapacityUsers() {
       });
     });
   } catch (err) {
+    if (seq !== teamCapacityUserSearchSeq) return;
     host.innerHTML = "";
     showTeamCapacityStatus(`User search failed: ${String(err || "Unknown error")}`, "error");
   }
@@ -5693,7 +5754,7 @@ function bindTeamCapacityPage() {
     loadTeamCapacityData();
   });
 
-  document.getElementById("team-capacity-user-search-btn")?.addEventListener("click", searchTeamCapacityUsers);
+  document.getElementById("team-capacity-user-search-btn")?.addEventListener("click", () => searchTeamCapacityUsers());
   document.getElementById("team-capacity-copy-prev")?.addEventListener("click", copyTeamMembersFromPreviousFixVersion);
   document.getElementById("team-capacity-first-week")?.addEventListener("change", (ev) => {
     const target = ev.target;
@@ -5710,9 +5771,12 @@ function bindTeamCapacityPage() {
   document.getElementById("team-capacity-user-search")?.addEventListener("keydown", (ev) => {
     if (ev.key === "Enter") {
       ev.preventDefault();
+      if (teamCapacityUserSearchTimer) clearTimeout(teamCapacityUserSearchTimer);
+      teamCapacityUserSearchTimer = null;
       searchTeamCapacityUsers();
     }
   });
+  document.getElementById("team-capacity-user-search")?.addEventListener("input", () => scheduleTeamCapacityUserSearch());
 
   const applyDaysInputValue = (target, rerenderAfter = false) => {
     if (!(target instanceof HTMLInputElement)) return;
@@ -6580,25 +6644,34 @@ async function pushPiStoryChangesToJira() {
     let anySuccess = false;
     let anyFailure = false;
 
+    // all sprint moves go out in one request; the server groups them per target sprint
+    const sprintMoves = Array.from(pending.entries())
+      .filter(([, change]) => change?.sprintDirty === true && change?.targetSprint)
+      .map(([storyKey, change]) => ({ issueKey: storyKey, targetSprint: change.targetSprint }));
+    const sprintResults = new Map();
+    let sprintBatchError = '';
+    if (sprintMoves.length) {
+      const resp = await fetch('/bulk_update_sprints', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ moves: sprintMoves, workGroup, fixVersion, dryRun: false }),
+      });
+      const json = await resp.json().catch(() => ({}));
+      if (!Array.isArray(json?.results)) {
+        sprintBatchError = String(json?.error || `HTTP ${resp.status}`);
+      } else {
+        json.results.forEach((r) => sprintResults.set(String(r?.issueKey || ''), r));
+      }
+    }
+
     for (const [storyKey, change] of Array.from(pending.entries())) {
       const next = { ...(change || {}) };
       const messages = [];
 
       if (next.sprintDirty === true && next.targetSprint) {
-        const resp = await fetch('/update_story_sprint', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            issueKey: storyKey,
-            targetSprint: next.targetSprint,
-            workGroup,
-            fixVersion,
-            dryRun: false,
-          }),
-        });
-        const json = await resp.json().catch(() => ({}));
-        if (!resp.ok || !json?.ok) {
-          messages.push(`Sprint: Failed - ${String(json?.error || `HTTP ${resp.status}`)}`);
+        const result = sprintResults.get(storyKey);
+        if (sprintBatchError || !result?.ok) {
+          messages.push(`Sprint: Failed - ${sprintBatchError || String(result?.error || 'No result returned')}`);
           anyFailure = true;
         } else {
           next.sprintDirty = false;
@@ -6608,66 +6681,61 @@ async function pushPiStoryChangesToJira() {
         }
       }
 
+      // priority, story points and assignee go out together as one Jira write
+      const fieldUpdates = [];
+      const body = { issueKey: storyKey, dryRun: false };
       if (next.priorityDirty === true && Number.isInteger(next.targetPriority)) {
-        const resp = await fetch('/update_priority', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ issueKey: storyKey, priority: next.targetPriority, dryRun: false }),
+        body.priority = next.targetPriority;
+        fieldUpdates.push({
+          label: 'Priority',
+          clear: () => {
+            next.priorityDirty = false;
+            delete next.targetPriority;
+          },
         });
-        const json = await resp.json().catch(() => ({}));
-        if (!resp.ok || !json?.ok) {
-          messages.push(`Priority: Failed - ${String(json?.error || `HTTP ${resp.status}`)}`);
-          anyFailure = true;
-        } else {
-          next.priorityDirty = false;
-          delete next.targetPriority;
-          messages.push('Priority: Success');
-          anySuccess = true;
-        }
       }
-
       if (next.estimationDirty === true && Number.isInteger(next.targetEstimation)) {
-        const resp = await fetch('/update_estimation', {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ issueKey: storyKey, estimation: next.targetEstimation, dryRun: false }),
+        body.estimation = next.targetEstimation;
+        fieldUpdates.push({
+          label: 'Story points',
+          clear: () => {
+            next.estimationDirty = false;
+            delete next.targetEstimation;
+          },
         });
-        const json = await resp.json().catch(() => ({}));
-        if (!resp.ok || !json?.ok) {
-          messages.push(`Story points: Failed - ${String(json?.error || `HTTP ${resp.status}`)}`);
-          anyFailure = true;
-        } else {
-          next.estimationDirty = false;
-          delete next.targetEstimation;
-          messages.push('Story points: Success');
-          anySuccess = true;
-        }
       }
-
       if (next.assigneeDirty === true && next.targetAssigneeName) {
-        const resp = await fetch('/update_assignee', {
+        body.accountId = String(next.targetAssigneeAccountId || '');
+        body.displayName = String(next.targetAssigneeName || '');
+        body.emailAddress = String(next.targetAssigneeEmail || '');
+        fieldUpdates.push({
+          label: 'Assignee',
+          clear: () => {
+            next.assigneeDirty = false;
+            delete next.targetAssigneeAccountId;
+            delete next.targetAssigneeName;
+            delete next.targetAssigneeEmail;
+          },
+        });
+      }
+
+      if (fieldUpdates.length) {
+        const resp = await fetch('/update_issue', {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({
-            issueKey: storyKey,
-            accountId: String(next.targetAssigneeAccountId || ''),
-            displayName: String(next.targetAssigneeName || ''),
-            emailAddress: String(next.targetAssigneeEmail || ''),
-            dryRun: false,
-          }),
+          body: JSON.stringify(body),
         });
         const json = await resp.json().catch(() => ({}));
-        if (!resp.ok || !json?.ok) {
-          messages.push(`Assignee: Failed - ${String(json?.error || `HTTP ${resp.status}`)}`);
-          anyFailure = true;
-        } else {
-          next.assigneeDirty = false;
-          delete next.targetAssigneeAccountId;
-          delete next.targetAssigneeName;
-          delete next.targetAssigneeEmail;
-          messages.push('Assignee: Success');
-          anySuccess = true;
-        }
+        fieldUpdates.forEach(({ label, clear }) => {
+          if (!resp.ok || !json?.ok) {
+            messages.push(`${label}: Failed - ${String(json?.error || `HTTP ${resp.status}`)}`);
+            anyFailure = true;
+          } else {
+            clear();
+            messages.push(`${label}: Success`);
+            anySuccess = true;
+          }
+        });
       }
 
       if (piStoryHasDirty(next)) pending.set(storyKey, next);
@@ -6685,7 +6753,7 @@ async function pushPiStoryChangesToJira() {
     }
 
     if (anySuccess) {
-      await loadPIPlanningData(true);
+      await loadPIPlanningData(true, false);
     } else {
       renderPiStoryPlanningTable(window._piCommittedFeatures || [], window._piPlanningSprints || []);
     }
@@ -0,0 +1,138 @@
+import os
+import re
+import sys
+from urllib.parse import urlsplit
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["JIRA_SHARED_CACHE_DB"] = ""
+os.environ["JIRA_MIRROR_DB"] = ""
+
+import fr_stat  # noqa: E402
+
+WORK_GROUP = "WG"
+FIX_VERSION = "QS_25w49"
+
+
+def raw_issue(key, issuetype, updated="2026-10-17T10:00:00.000+0200", **fields):
+    """A Jira search hit carrying the work group store fields."""
+    base = {
+        "summary": f"summary {key}",
+        "issuetype": {"name": issuetype},
+        "status": {"name": "Open", "statusCategory": {"key": "new"}},
+        "priority": {"name": "3"},
+        "customfield_14400": [{"value": WORK_GROUP}],
+        "fixVersions": [],
+        "updated": updated,
+    }
+    base.update(fields)
+    return {"key": key, "fields": base}
+
+
+class _Response:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeJira:
+    """
+    Jira as the app sees it through JIRA_HTTP and the compact search: `issues` (raw search hits) answer every
+    issue search and issue read and take PUT fields, `users` answer /user/search and `versions` (project key ->
+    names) answer /project/<key>/versions. Every search and REST call is recorded.
+    """
+
+    def __init__(self):
+        self.issues = []
+        self.users = []
+        self.versions = {}
+        self.searches = []
+        # (method, URL path, params or JSON body)
+        self.calls = []
+
+    def calls_to(self, method, pattern):
+        return [body for m, path, body in self.calls if m == method and re.search(pattern, path)]
+
+    def search_compact(self, jql, fields, page_size=1000, hard_cap=5000, strict=False):
+        self.searches.append(jql)
+        return [fr_stat._compact_issue(it, fields) for it in self.issues]
+
+    def _issue(self, path):
+        key = path.rsplit("/", 1)[-1]
+        return next((it for it in self.issues if it["key"] == key), None)
+
+    def get(self, url, params=None, **kwargs):
+        path = urlsplit(url).path
+        self.calls.append(("GET", path, dict(params or {})))
+        if path.endswith("/user/search"):
+            q = str((params or {}).get("query") or (params or {}).get("username") or "").lower()
+            hits = [u for u in self.users
+                    if any(str(u.get(k) or "").lower().startswith(q) for k in ("displayName", "emailAddress", "name"))]
+            return _Response(hits[:int((params or {}).get("maxResults", 50))])
+        m = re.search(r"/project/([^/]+)/versions$", path)
+        if m:
+            if m.group(1) not in self.versions:
+                return _Response({"errorMessages": [f"No project {m.group(1)}"]}, 404)
+            return _Response([{"name": name} for name in self.versions[m.group(1)]])
+        if "/issue/" in path and self._issue(path):
+            return _Response({"key": self._issue(path)["key"], "fields": dict(self._issue(path)["fields"])})
+        return _Response({"errorMessages": [f"Not found: {path}"]}, 404)
+
+    def put(self, url, json=None, **kwargs):
+        path = urlsplit(url).path
+        self.calls.append(("PUT", path, json))
+        issue = self._issue(path)
+        if issue is None:
+            return _Response({"errorMessages": [f"Not found: {path}"]}, 404)
+        issue["fields"].update((json or {}).get("fields") or {})
+        return _Response(None, 204)
+
+    def post(self, url, json=None, **kwargs):
+        self.calls.append(("POST", urlsplit(url).path, json))
+        return _Response(None, 204)
+
+
+@pytest.fixture
+def jira():
+    return FakeJira()
+
+
+@pytest.fixture
+def fr(monkeypatch, tmp_path, jira):
+    """fr_stat with empty caches and user directory, one configured work group / fix version and `jira` as Jira."""
+    with fr_stat._CACHE_LOCK:
+        fr_stat._DATA_CACHE.clear()
+        fr_stat._CACHE_STATS.clear()
+    monkeypatch.setattr(fr_stat, "_load_app_settings", lambda: {
+        "fix_versions": [FIX_VERSION],
+        "work_groups": [{"leadingWorkGroup": WORK_GROUP}],
+    })
+    monkeypatch.setattr(fr_stat, "_sprint_catalog_path", lambda: str(tmp_path / "sprint_catalog.json"))
+    monkeypatch.setattr(fr_stat, "_SPRINT_CATALOG", None)
+    monkeypatch.setattr(fr_stat, "_SPRINT_CATALOG_INDEX", None)
+    for name in ("_USER_DIRECTORY", "_USER_BY_ACCOUNT", "_USER_BY_NAME", "_USER_BY_EMAIL", "_USER_BY_TOKENS",
+                 "_USER_BY_WORD", "_USER_SEARCH_COMPLETE", "_PROJECT_VERSION_SETS", "_PROJECT_VERSIONS_RECHECKED"):
+        monkeypatch.setattr(fr_stat, name, {})
+    monkeypatch.setattr(fr_stat, "_USER_WORDS_SORTED", None)
+    monkeypatch.setattr(fr_stat, "_USER_DIRECTORY_SEEDED", True)
+
+    monkeypatch.setattr(fr_stat, "JIRA_HTTP", jira)
+    monkeypatch.setattr(fr_stat, "_jira_search_compact", jira.search_compact)
+    monkeypatch.setattr(fr_stat, "_jira_search_keys", lambda keys, fields, chunk_size=100: {})
+    yield fr_stat
+    # flush catalog changes into tmp_path now rather than from the save timer after the patches are undone
+    fr_stat._save_sprint_catalog_quietly()
+
+
+@pytest.fixture
+def cache_stores(fr, monkeypatch):
+    """Keys of every `_cache_store` call made after the fixture is set up, in call order."""
+    stores = []
+    store = fr._cache_store
+    monkeypatch.setattr(fr, "_cache_store", lambda key, value, **kw: stores.append(key) or store(key, value, **kw))
+    return stores
@@ -0,0 +1,274 @@
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import FIX_VERSION, WORK_GROUP, raw_issue
+
+
+def _multi_sprint_story(key="S-1", parent="F-1"):
+    # carried over from the previous PI's Sprint 5 into this PI's Sprint 1
+    return raw_issue(
+        key, "Story",
+        customfield_10702=parent,
+        customfield_10708=3,
+        customfield_10701=[
+            {"id": 11, "name": "BSW 25w37 Sprint 5", "state": "closed", "originBoardId": 5},
+            {"id": 21, "name": "BSW 25w49 Sprint 1", "state": "active", "originBoardId": 5},
+        ],
+    )
+
+
+def test_frozen_values_keep_list_semantics(fr):
+    value = fr._freeze({"sprints": [{"name": "Sprint 2"}], "keys": ("A", "B")})
+    assert isinstance(value["sprints"], list)
+    assert value["keys"] == ("A", "B")
+    with pytest.raises(TypeError):
+        value["sprints"].append({})
+    assert fr._thaw(value) == {"sprints": [{"name": "Sprint 2"}], "keys": ["A", "B"]}
+    assert fr._extract_sprint_refs(value["sprints"])[0]["canonical"] == "Sprint 2"
+
+
+def test_multi_sprint_story_is_placed_from_the_cached_store(fr, jira):
+    jira.issues = [
+        raw_issue("F-1", "Feature", fixVersions=[{"name": FIX_VERSION}]),
+        _multi_sprint_story(),
+    ]
+
+    first = fr.get_pi_planning(FIX_VERSION, WORK_GROUP)
+    # the second call is answered from the frozen cached store
+    cached = fr.get_pi_planning(FIX_VERSION, WORK_GROUP)
+
+    assert len(jira.searches) == 1
+    for features in (first, cached):
+        assert features["F-1"]["sprints"] == {"Sprint 1": ["S-1"]}
+        assert features["F-1"]["sum_story_points"] == 3
+
+
+def test_concurrent_patches_of_one_store_all_survive(fr, jira):
+    jira.issues = [raw_issue(f"S-{i}", "Story") for i in range(5000)]
+    issues = fr._work_group_issues(WORK_GROUP)["issues"]
+    patched_keys = [f"S-{i}" for i in range(0, 5000, 300)]
+
+    with ThreadPoolExecutor(max_workers=len(patched_keys)) as pool:
+        list(pool.map(lambda k: fr._sync_caches_after_write(k, {"priority": {"name": "1"}}), patched_keys))
+
+    store = fr._work_group_issues(WORK_GROUP)
+    assert len(jira.searches) == 1
+    assert len(store["issues"]) == 5000
+    for issue_key in patched_keys:
+        assert store["by_key"][issue_key]["fields"]["priority"] == {"name": "1"}
+    assert store["by_key"]["S-1"]["fields"]["priority"] == {"name": "3"}
+    # copy on write: readers still holding the old list never see a patch
+    assert all(it["fields"]["priority"] == {"name": "3"} for it in issues)
+
+
+def test_batch_patch_writes_each_cached_list_once(fr, jira, cache_stores):
+    jira.issues = [raw_issue(f"S-{i}", "Story") for i in range(50)]
+    fr._work_group_issues(WORK_GROUP)
+    cache_stores.clear()
+
+    fr._sync_caches_after_writes([
+        {"issue_key": f"S-{i}", "field_values": {"customfield_10708": i}} for i in range(10)
+    ])
+
+    assert len(cache_stores) == 1
+    by_key = fr._work_group_issues(WORK_GROUP)["by_key"]
+    assert [by_key[f"S-{i}"]["fields"]["customfield_10708"] for i in range(10)] == list(range(10))
+
+
+def test_forced_refresh_takes_over_a_queued_background_refresh(fr, monkeypatch):
+    builds = []
+    queued = []
+    monkeypatch.setattr(fr._CACHE_REFRESH_POOL, "submit", queued.append)
+    cache_key = ("test_v1", "k")
+    fr._cache_get_or_build(cache_key, lambda: builds.append(1) or len(builds))
+
+    assert fr._cache_refresh_in_background(cache_key, lambda: builds.append(1) or len(builds))
+    assert fr._cache_get_or_build(cache_key, lambda: builds.append(1) or len(builds), force_refresh=True) == 2
+    for run in queued:
+        run()
+
+    assert len(queued) == 1
+    assert len(builds) == 2
+    assert not fr._CACHE_REFRESHING
+
+
+def test_patch_updates_the_work_group_index_without_rebuilding_it(fr, jira, monkeypatch):
+    jira.issues = [
+        raw_issue(f"S-{i}", "Story" if i % 2 else "Bug", fixVersions=[{"name": FIX_VERSION}] if i % 3 else [])
+        for i in range(30)
+    ]
+    fr._work_group_issues(WORK_GROUP)
+    rebuilds = []
+    index = fr._index_work_group_issues
+    monkeypatch.setattr(fr, "_index_work_group_issues", lambda *a: rebuilds.append(1) or index(*a))
+
+    fr._sync_caches_after_writes([
+        {"issue_key": "S-3", "field_values": {"fixVersions": [], "issuetype": {"name": "Bug"}}},
+        {"issue_key": "S-4", "field_values": {"fixVersions": [{"name": FIX_VERSION}],
+                                              "status": {"name": "Done", "statusCategory": {"key": "done"}}}},
+        {"issue_key": "S-5", "field_values": {"customfield_10708": 8}},
+    ])
+    store = fr._work_group_issues(WORK_GROUP)
+
+    assert not rebuilds
+    expected = index(store["issues"], [FIX_VERSION])
+    for name in ("updated_ms", "by_key", "by_type", "by_status_category", "by_fix_version"):
+        assert store[name] == expected[name], name
+    assert store["by_key"]["S-5"]["fields"]["customfield_10708"] == 8
+    assert "S-3" in [it["key"] for it in store["by_type"]["bug"]]
+    assert "S-4" in [it["key"] for it in store["by_status_category"]["done"]]
+
+
+def test_bulk_update_patches_each_cached_list_once_after_the_batch(fr, jira, cache_stores):
+    jira.issues = [raw_issue(f"ST-{i}", "Story") for i in range(20)]
+    fr._work_group_issues(WORK_GROUP)
+    cache_stores.clear()
+    resp = fr.app.test_client().post("/bulk_update", json={
+        "dryRun": False,
+        "changes": [{"issueKey": f"ST-{i}", "estimation": i} for i in range(10)],
+    })
+
+    assert resp.get_json()["succeeded"] == 10
+    assert len(jira.calls_to("PUT", r"/issue/ST-")) == 10
+    assert len(cache_stores) == 1
+    by_key = fr._work_group_issues(WORK_GROUP)["by_key"]
+    assert [by_key[f"ST-{i}"]["fields"]["customfield_10708"] for i in range(10)] == list(range(10))
+
+
+def test_sprint_moves_patch_the_batch_once_with_full_sprint_objects(fr, jira, cache_stores, monkeypatch):
+    jira.issues = [_multi_sprint_story(f"ST-{i}") for i in range(5)]
+    fr._work_group_issues(WORK_GROUP)
+    cache_stores.clear()
+    sprint_2 = {"id": 22, "name": "BSW 25w49 Sprint 2", "state": "future", "originBoardId": 5,
+                "startDate": "2026-11-02T09:00:00.000+01:00", "endDate": "2026-11-16T09:00:00.000+01:00"}
+    moved = set()
+    monkeypatch.setattr(fr, "_jira_move_issues_to_sprint", lambda keys, sprint_id: moved.update(keys) or {})
+    monkeypatch.setattr(fr, "_jira_search_keys", lambda keys, fields, chunk_size=100: {
+        k: {"key": k, "fields": {"customfield_10701": [sprint_2] if k in moved else
+                                 (jira.issues[0]["fields"]["customfield_10701"])}}
+        for k in keys
+    })
+    monkeypatch.setattr(fr, "_jira_find_sprint_id_by_name", lambda name, work_group="", fix_version="": 22)
+
+    results = fr._jira_move_sprints({f"ST-{i}": "Sprint 2" for i in range(5)}, work_group=WORK_GROUP, dry_run=False)
+
+    assert all(r["ok"] and r["after"] == ["Sprint 2"] for r in results.values())
+    assert len(cache_stores) == 1
+    sprints = fr._work_group_issues(WORK_GROUP)["by_key"]["ST-0"]["fields"]["customfield_10701"]
+    assert sprints == [{"id": 22, "name": "BSW 25w49 Sprint 2", "state": "future", "boardId": 5,
+                        "startDate": sprint_2["startDate"], "endDate": sprint_2["endDate"]}]
+
+
+def test_large_values_are_sized_from_a_sample(fr):
+    value = fr._freeze([fr._compact_issue(raw_issue(f"S-{i}", "Story"), fr.WORK_GROUP_ISSUE_FIELDS) for i in range(2000)])
+    measured = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    assert abs(fr._cache_value_size(value) - measured) < measured * 0.25
+
+
+def test_shared_patch_writes_only_the_patched_records(fr, jira, monkeypatch, tmp_path):
+    monkeypatch.setattr(fr, "SHARED_CACHE_DB", str(tmp_path / "shared.db"))
+    monkeypatch.setattr(fr, "_SHARED_CACHE_LOCAL", threading.local())
+    jira.issues = [raw_issue(f"S-{i}", "Story") for i in range(50)]
+    fr._work_group_issues(WORK_GROUP)
+    puts = []
+    put = fr._shared_cache_put
+    monkeypatch.setattr(fr, "_shared_cache_put", lambda key, *a: puts.append(key) or put(key, *a))
+
+    fr._sync_caches_after_write("S-7", {"priority": {"name": "1"}})
+    # another worker: nothing in memory, everything from the shared store
+    with fr._CACHE_LOCK:
+        fr._DATA_CACHE.clear()
+    store = fr._work_group_issues(WORK_GROUP)
+
+    assert not puts
+    assert len(jira.searches) == 1
+    assert store["by_key"]["S-7"]["fields"]["priority"] == {"name": "1"}
+    assert store["by_key"]["S-8"]["fields"]["priority"] == {"name": "3"}
+
+
+@pytest.fixture
+def mirror(fr, jira, monkeypatch, tmp_path):
+    """fr with the SQLite mirror enabled (sync loop off) and WORK_GROUP synced from `jira`."""
+    monkeypatch.setattr(fr, "MIRROR_DB", str(tmp_path / "mirror.db"))
+    monkeypatch.setattr(fr, "_MIRROR_LOCAL", threading.local())
+    monkeypatch.setattr(fr, "_MIRROR_VIEWS", OrderedDict())
+    monkeypatch.setattr(fr, "_start_mirror_sync", lambda: None)
+    jira.issues = [raw_issue(f"ST-{i}", "Story") for i in range(10)]
+    fr._mirror_sync_work_group(WORK_GROUP, [FIX_VERSION])
+    return fr
+
+
+def test_mirror_views_are_parsed_once_per_generation(mirror, jira):
+    first = mirror._backlog_issues(WORK_GROUP)
+    assert mirror._backlog_issues(WORK_GROUP) is first
+
+    mirror._sync_caches_after_write("ST-3", {"priority": {"name": "1"}})
+    patched = mirror._backlog_issues(WORK_GROUP)
+
+    assert patched is not first
+    assert {it["key"]: it for it in patched}["ST-3"]["fields"]["priority"] == {"name": "1"}
+    assert len(jira.searches) == 1
+
+
+def test_stale_mirror_is_served_while_it_syncs_in_background(mirror, jira, monkeypatch):
+    mirror._mirror_conn().execute("UPDATE mirror_state SET synced_at = synced_at - ?", (3 * mirror.MIRROR_SYNC_SECONDS,))
+    queued = []
+    monkeypatch.setattr(mirror._CACHE_REFRESH_POOL, "submit", queued.append)
+
+    assert len(mirror._backlog_issues(WORK_GROUP)) == 10
+    assert len(mirror._backlog_issues(WORK_GROUP)) == 10
+    assert len(queued) == 1
+    assert len(jira.searches) == 1
+    queued[0]()
+    assert len(jira.searches) == 2
+
+
+def test_sprint_catalog_changes_are_saved_later_in_one_write(fr, jira, monkeypatch):
+    monkeypatch.setattr(fr, "SPRINT_CATALOG_SAVE_SECONDS", 60)
+    jira.issues = [_multi_sprint_story()]
+    fr._work_group_issues(WORK_GROUP)
+    fr._sprint_catalog_learn([{"id": 22, "name": "BSW 25w49 Sprint 2", "state": "future", "boardId": 5}], WORK_GROUP)
+
+    assert not os.path.exists(fr._sprint_catalog_path())
+    assert fr._sprint_catalog_lookup("Sprint 2", WORK_GROUP, "25w49") == 22
+    fr._save_sprint_catalog()
+
+    with open(fr._sprint_catalog_path(), encoding="utf-8") as f:
+        text = f.read()
+    assert "\n" not in text
+    assert set(json.loads(text)["sprints"]) == {"11", "21", "22"}
+
+
+def _updated_days_ago(days):
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime(time.time() - days * 86400))
+
+
+def test_issue_views_are_slices_of_one_work_group_search(fr, jira, monkeypatch):
+    done = {"name": "Done", "statusCategory": {"key": "done"}}
+    jira.issues = [
+        raw_issue("ST-1", "Story", updated=_updated_days_ago(1)),
+        raw_issue("ST-2", "Story", updated=_updated_days_ago(200), fixVersions=[{"name": FIX_VERSION}]),
+        raw_issue("ST-3", "Story", updated=_updated_days_ago(300), status=done),
+        raw_issue("CA-1", "Capability", updated=_updated_days_ago(400)),
+        raw_issue("CA-2", "Capability", updated=_updated_days_ago(2), status=done),
+    ]
+    builds = []
+    index = fr._index_work_group_issues
+    monkeypatch.setattr(fr, "_index_work_group_issues", lambda *a: builds.append(1) or index(*a))
+
+    keys = lambda issues: sorted(it["key"] for it in issues)
+    assert keys(fr._pi_planning_issues(FIX_VERSION, WORK_GROUP)) == ["CA-2", "ST-1", "ST-2"]
+    assert keys(fr._backlog_issues(WORK_GROUP)) == ["CA-1", "ST-1", "ST-2"]
+    assert keys(fr._backlog_child_issues(WORK_GROUP)) == ["CA-2", "ST-1", "ST-2", "ST-3"]
+    assert keys(fr._capability_issues(WORK_GROUP)) == ["CA-1", "CA-2"]
+    assert fr._pi_planning_issues("QS_26w10", WORK_GROUP) is None
+
+    assert len(jira.searches) == 1
+    assert len(builds) == 1
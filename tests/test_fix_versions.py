@@ -0,0 +1,67 @@
+from conftest import FIX_VERSION, raw_issue
+
+OLD_VERSION = "QS_25w37"
+
+
+def _version_reads(jira, project_key):
+    return jira.calls_to("GET", rf"/project/{project_key}/versions$")
+
+
+def test_project_key_comes_from_the_issue_key(fr):
+    assert fr._issue_project_key("ST-12") == "ST"
+    assert fr._issue_project_key(" abc2-7 ") == "ABC2"
+
+
+def test_a_batch_reads_each_project_version_list_once(fr, jira):
+    jira.versions = {"ST": [OLD_VERSION, FIX_VERSION], "CA": [OLD_VERSION]}
+    merged = {f"ST-{i}": {"fixVersions": {"add": [FIX_VERSION], "remove": [OLD_VERSION]}} for i in range(30)}
+    merged.update({f"CA-{i}": {"fixVersions": {"add": [FIX_VERSION, OLD_VERSION], "remove": []}} for i in range(5)})
+    merged["CA-9"] = {"fixVersions": {"add": [OLD_VERSION], "remove": []}}
+    merged["NOPE-1"] = {"fixVersions": {"add": [FIX_VERSION], "remove": []}}
+    merged["ST-99"] = {"priority": 2}
+
+    failures = fr._bulk_fix_version_failures(merged, dry_run=True)
+
+    assert sorted(failures) == ["CA-0", "CA-1", "CA-2", "CA-3", "CA-4", "NOPE-1"]
+    assert failures["CA-0"]["invalid"] == [FIX_VERSION]
+    assert failures["CA-0"]["validQsVersions"] == [OLD_VERSION]
+    assert "NOPE" in failures["NOPE-1"]["error"]
+    assert len(_version_reads(jira, "ST")) == 1
+    # the unknown version re-reads CA's list once, in case it was created since the list was cached
+    assert len(_version_reads(jira, "CA")) == 2
+
+
+def test_an_unknown_version_rechecks_the_project_at_most_once_per_window(fr, jira):
+    jira.versions = {"ST": [OLD_VERSION]}
+
+    for _ in range(3):
+        assert fr._unknown_fix_versions("ST", {FIX_VERSION})[0] == [FIX_VERSION]
+    assert len(_version_reads(jira, "ST")) == 2
+
+    jira.versions["ST"].append(FIX_VERSION)
+    assert fr._unknown_fix_versions("ST", {FIX_VERSION})[0] == [FIX_VERSION]
+    fr._PROJECT_VERSIONS_RECHECKED["ST"] -= fr.PROJECT_VERSIONS_RECHECK_SECONDS
+    unknown, valid = fr._unknown_fix_versions("ST", {FIX_VERSION})
+    assert unknown == []
+    assert valid == {OLD_VERSION, FIX_VERSION}
+    assert len(_version_reads(jira, "ST")) == 3
+
+
+def test_fix_version_push_makes_one_version_read_per_project(fr, jira):
+    jira.issues = [raw_issue(f"ST-{i}", "Story", fixVersions=[{"name": OLD_VERSION}]) for i in range(50)]
+    jira.versions = {"ST": [OLD_VERSION, FIX_VERSION]}
+
+    resp = fr.app.test_client().post("/bulk_update", json={
+        "dryRun": False,
+        "verify": False,
+        "changes": [
+            {"issueKey": f"ST-{i}", "addFixVersions": [FIX_VERSION], "removeFixVersions": [OLD_VERSION]}
+            for i in range(50)
+        ],
+    })
+
+    assert resp.get_json()["succeeded"] == 50
+    assert len(_version_reads(jira, "ST")) == 1
+    # one read of each issue's current versions and nothing else
+    assert len(jira.calls_to("GET", "")) == 51
+    assert len(jira.calls_to("PUT", r"/issue/ST-\d+$")) == 50
@@ -0,0 +1,59 @@
+from conftest import FIX_VERSION, WORK_GROUP, raw_issue
+
+
+def _story_in_sprint_1(key):
+    return raw_issue(key, "Story", customfield_10701=[
+        {"id": 11, "name": "BSW 25w37 Sprint 5", "state": "closed", "originBoardId": 5},
+        {"id": 21, "name": "BSW 25w49 Sprint 1", "state": "active", "originBoardId": 5},
+    ])
+
+
+def _sprint_moves_setup(fr, jira, monkeypatch):
+    jira.issues = [_story_in_sprint_1(f"ST-{i}") for i in range(8)]
+    monkeypatch.setattr(fr, "_jira_search_keys", lambda keys, fields, chunk_size=100: {
+        it["key"]: fr._compact_issue(it, fields) for it in jira.issues if it["key"] in keys
+    })
+    lookups = []
+    sprint_ids = {"Sprint 2": 22, "Sprint 3": 23}
+    monkeypatch.setattr(fr, "_jira_find_sprint_id_by_name",
+                        lambda name, work_group="", fix_version="": lookups.append(name) or sprint_ids.get(name))
+    return lookups
+
+
+def test_sprint_moves_are_grouped_into_one_agile_call_per_sprint_chunk(fr, jira, monkeypatch):
+    lookups = _sprint_moves_setup(fr, jira, monkeypatch)
+    monkeypatch.setattr(fr, "SPRINT_MOVE_CHUNK", 2)
+    moves = {f"ST-{i}": "Sprint 2" for i in range(5)}
+    moves.update({"ST-5": "Sprint 3", "ST-6": "No Sprint", "ST-7": "Sprint 1", "ST-99": "Sprint 2"})
+
+    results = fr._jira_move_sprints(moves, work_group=WORK_GROUP, fix_version=FIX_VERSION, dry_run=False)
+
+    # one lookup per sprint name; the issue's own Sprint 1 ref needs none
+    assert lookups == ["Sprint 2", "Sprint 3"]
+    assert sorted(body["issues"] for body in jira.calls_to("POST", r"/sprint/22/issue$")) == [
+        ["ST-0", "ST-1"], ["ST-2", "ST-3"], ["ST-4"],
+    ]
+    assert [body["issues"] for body in jira.calls_to("POST", r"/sprint/23/issue$")] == [["ST-5"]]
+    assert [body["issues"] for body in jira.calls_to("POST", r"/sprint/21/issue$")] == [["ST-7"]]
+    assert jira.calls_to("PUT", r"/issue/ST-6$") == [{"fields": {"customfield_10701": []}}]
+    assert len(jira.calls) == 6
+
+    assert {k: r.get("sprintId") for k, r in results.items() if r["ok"]} == {
+        "ST-0": 22, "ST-1": 22, "ST-2": 22, "ST-3": 22, "ST-4": 22, "ST-5": 23, "ST-6": None, "ST-7": 21,
+    }
+    assert results["ST-6"]["after"] == []
+    assert results["ST-0"]["before"] == ["Sprint 1", "Sprint 5"]
+    assert not results["ST-99"]["ok"]
+
+
+def test_sprint_moves_dry_run_and_unknown_sprints_write_nothing(fr, jira, monkeypatch):
+    lookups = _sprint_moves_setup(fr, jira, monkeypatch)
+
+    dry = fr._jira_move_sprints({"ST-0": "Sprint 2", "ST-1": "Sprint 9"}, work_group=WORK_GROUP, dry_run=True)
+    assert all(r["ok"] and "sprintId" not in r for r in dry.values())
+    assert not lookups
+
+    results = fr._jira_move_sprints({"ST-0": "Sprint 9", "ST-1": "Sprint 9"}, work_group=WORK_GROUP, dry_run=False)
+    assert lookups == ["Sprint 9"]
+    assert all(r["error"] == "Sprint id not found for 'Sprint 9'" for r in results.values())
+    assert not jira.calls
@@ -0,0 +1,91 @@
+import time
+
+from conftest import WORK_GROUP, raw_issue
+
+JANE = {"name": "jdoe1", "displayName": "Jane Doe", "emailAddress": "jane.doe@one.example"}
+JOHN = {"name": "jroe", "displayName": "John Roe", "emailAddress": "john.roe@one.example"}
+
+
+def _user_searches(jira):
+    return jira.calls_to("GET", r"/user/search$")
+
+
+def test_assignees_of_cached_issues_resolve_without_jira(fr, jira):
+    jira.issues = [raw_issue("ST-1", "Story", assignee=JANE, reporter=JOHN)]
+    fr._work_group_issues(WORK_GROUP)
+
+    assert fr._resolve_user_identity("", "Jane Doe", "")["name"] == "jdoe1"
+    assert fr._resolve_user_identity("", "", "John.Roe@one.example")["name"] == "jroe"
+    assert not _user_searches(jira)
+
+
+def test_team_capacity_members_seed_the_directory(fr, jira, monkeypatch):
+    monkeypatch.setattr(fr, "_USER_DIRECTORY_SEEDED", False)
+    monkeypatch.setattr(fr, "_load_team_capacity_store", lambda: {
+        "WG|QS_25w49": {"members": [{"accountId": "acc-1", "displayName": "Jane Doe", "emailAddress": JANE["emailAddress"]}]},
+    })
+
+    assert fr._resolve_user_identity("", "Jane Doe", "")["accountId"] == "acc-1"
+    assert not _user_searches(jira)
+
+
+def test_unknown_assignee_is_searched_once_and_then_known(fr, jira):
+    jira.users = [JOHN]
+
+    assert fr._resolve_user_identity("", "John Roe", "john.roe@one.example")["name"] == "jroe"
+    searches = len(_user_searches(jira))
+    assert searches >= 1
+    assert fr._resolve_user_identity("", "John Roe", "john.roe@one.example")["name"] == "jroe"
+    assert len(_user_searches(jira)) == searches
+
+
+def test_user_directory_does_not_match_a_namesake_when_the_email_differs(fr):
+    fr._user_directory_add([JANE])
+
+    assert fr._user_directory_find("Jane Doe", "jane.doe@two.example") is None
+    assert fr._user_directory_find("Jane Doe", "JANE.DOE@one.example")["name"] == "jdoe1"
+    assert fr._user_directory_find("Jane Doe")["name"] == "jdoe1"
+
+
+def test_two_namesakes_or_an_expired_entry_go_to_jira(fr):
+    fr._user_directory_add([JOHN], seen=time.time() - 2 * fr.USER_DIRECTORY_TTL_SECONDS)
+    fr._user_directory_add([JANE, {"name": "jdoe2", "displayName": "Doe, Jane", "emailAddress": "jd@two.example"}])
+
+    assert fr._user_directory_find("John Roe") is None
+    assert fr._user_directory_find("Jane Doe") is None
+    assert fr._user_directory_find("", "jd@two.example")["name"] == "jdoe2"
+
+
+def _autocomplete(fr, q):
+    resp = fr.app.test_client().get("/jira_user_search", query_string={"q": q})
+    assert resp.status_code == 200
+    return [u["displayName"] for u in resp.get_json()["users"]]
+
+
+def test_keystrokes_after_a_complete_jira_answer_are_served_locally(fr, jira):
+    jira.users = [JANE, JOHN, {"name": "jsmith", "displayName": "Jack Smith", "emailAddress": "jack@one.example"}]
+
+    assert _autocomplete(fr, "j") == []
+    assert sorted(_autocomplete(fr, "ja")) == ["Jack Smith", "Jane Doe"]
+    for q in ("jan", "jane", "jane d", "Jane Doe"):
+        assert _autocomplete(fr, q) == ["Jane Doe"]
+    assert sorted(_autocomplete(fr, "ja")) == ["Jack Smith", "Jane Doe"]
+
+    assert len(_user_searches(jira)) == 1
+
+
+def test_directory_with_enough_matches_answers_without_jira(fr, jira):
+    fr._user_directory_add([{"name": f"anna{i}", "displayName": f"Anna Nilsson {i:02d}"} for i in range(25)])
+
+    users = _autocomplete(fr, "an nil")
+
+    assert users == [f"Anna Nilsson {i:02d}" for i in range(20)]
+    assert not _user_searches(jira)
+
+
+def test_directory_matches_every_query_word_as_a_prefix(fr):
+    fr._user_directory_add([JANE, JOHN])
+
+    assert [u["name"] for u in fr._user_directory_match("doe ja", 20)] == ["jdoe1"]
+    assert [u["name"] for u in fr._user_directory_match("one.ex", 20)] == ["jdoe1", "jroe"]
+    assert fr._user_directory_match("jane roe", 20) == []